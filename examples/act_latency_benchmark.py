@@ -0,0 +1,108 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Benchmarks the per-call latency of Agent.act with and without the precompiled act fast path.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from tensorforce.agents import Agent
+
+
+# python examples/act_latency_benchmark.py -s 8 -c 10000
+
+
+def benchmark(agent, state_size, batch_size, num_calls, independent):
+    if batch_size is None:
+        states = np.random.randn(state_size).astype(np.float32)
+    else:
+        states = np.random.randn(batch_size, state_size).astype(np.float32)
+
+    # Warm-up (also compiles the act callable).
+    for _ in range(10):
+        agent.act(states=states, deterministic=True, independent=independent)
+
+    latencies = np.zeros(shape=(num_calls,))
+    for n in range(num_calls):
+        start = time.time()
+        agent.act(states=states, deterministic=True, independent=independent)
+        latencies[n] = time.time() - start
+        if not independent:
+            agent.observe(terminal=False, reward=0.0)
+
+    return np.mean(latencies), np.percentile(latencies, 50), np.percentile(latencies, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-s', '--state-size', type=int, default=8, help="State size")
+    parser.add_argument('-b', '--batch-sizes', type=int, nargs='*', default=[], help="Batch sizes (besides single states)")
+    parser.add_argument('-c', '--calls', type=int, default=10000, help="Number of timed act calls")
+    parser.add_argument('--observe', action='store_true', default=False, help="Non-independent act followed by observe")
+
+    args = parser.parse_args()
+
+    logging.getLogger('tensorflow').disabled = True
+
+    print("{:<12} {:<12} {:>12} {:>12} {:>12}".format('fast path', 'batch size', 'mean (us)', 'p50 (us)', 'p99 (us)'))
+    for act_fast_path in (False, True):
+        agent = Agent.from_spec(
+            spec=dict(
+                type='dqn_agent',
+                memory=dict(type='replay', include_next_states=True, capacity=10000),
+                batching_capacity=max([1000] + args.batch_sizes),
+                execution=dict(
+                    type='single',
+                    session_config=None,
+                    distributed_spec=None,
+                    act_fast_path=act_fast_path
+                )
+            ),
+            kwargs=dict(
+                states=dict(type='float', shape=(args.state_size,)),
+                actions=dict(type='int', num_actions=4),
+                network=[dict(type='dense', size=32), dict(type='dense', size=32)]
+            )
+        )
+
+        for batch_size in [None] + args.batch_sizes:
+            if batch_size is not None and args.observe:
+                continue
+            mean, p50, p99 = benchmark(
+                agent=agent,
+                state_size=args.state_size,
+                batch_size=batch_size,
+                num_calls=args.calls,
+                independent=(not args.observe)
+            )
+            print("{:<12} {:<12} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+                str(act_fast_path), '-' if batch_size is None else batch_size, mean * 1e6, p50 * 1e6, p99 * 1e6
+            ))
+
+        agent.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Benchmarks graph construction time, graph size and retrieval latency of episode and sequence retrieval of the
+replay memory for different batch sizes.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce.core.memories import Replay
+
+
+# python examples/memory_retrieval_benchmark.py -b 32 256 1024 4096
+
+
+def benchmark(unit, batch_size, capacity, episode_length, sequence_length, num_retrievals, state_size):
+    tf.reset_default_graph()
+
+    def custom_getter(getter, name, registered=False, **kwargs):
+        return getter(name=name, **kwargs)
+
+    start = time.time()
+    with tf.variable_scope('benchmark', custom_getter=custom_getter):
+        memory = Replay(
+            states=dict(state=dict(shape=(state_size,), type='float')),
+            internals=dict(),
+            actions=dict(action=dict(shape=(), type='int')),
+            include_next_states=False,
+            capacity=capacity
+        )
+        memory.initialize()
+
+        states = tf.placeholder(dtype=tf.float32, shape=(None, state_size))
+        actions = tf.placeholder(dtype=tf.int32, shape=(None,))
+        terminal = tf.placeholder(dtype=tf.bool, shape=(None,))
+        reward = tf.placeholder(dtype=tf.float32, shape=(None,))
+
+        store = memory.store(
+            states=dict(state=states),
+            internals=dict(),
+            actions=dict(action=actions),
+            terminal=terminal,
+            reward=reward
+        )
+        if unit == 'episodes':
+            batch = memory.retrieve_episodes(n=batch_size)
+        else:
+            batch = memory.retrieve_sequences(n=batch_size, sequence_length=sequence_length)
+    build_time = time.time() - start
+    num_ops = len(tf.get_default_graph().get_operations())
+
+    with tf.Session() as session:
+        session.run(tf.global_variables_initializer())
+
+        # Fill the memory with episodes of fixed length.
+        num_stored = 0
+        while num_stored < capacity:
+            session.run(fetches=store, feed_dict={
+                states: np.random.randn(episode_length, state_size),
+                actions: np.random.randint(10, size=(episode_length,)),
+                terminal: np.arange(episode_length) == episode_length - 1,
+                reward: np.random.randn(episode_length)
+            })
+            num_stored += episode_length
+
+        # Warm-up, then timed retrievals.
+        session.run(fetches=batch)
+        start = time.time()
+        for _ in range(num_retrievals):
+            session.run(fetches=batch)
+        retrieve_time = (time.time() - start) / num_retrievals
+
+    return build_time, num_ops, retrieve_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-b', '--batch-sizes', type=int, nargs='+', default=[32, 128, 512, 1024, 4096], help="Batch sizes")
+    parser.add_argument('-c', '--capacity', type=int, default=100000, help="Memory capacity")
+    parser.add_argument('-e', '--episode-length', type=int, default=20, help="Length of stored episodes")
+    parser.add_argument('-l', '--sequence-length', type=int, default=8, help="Length of retrieved sequences")
+    parser.add_argument('-r', '--retrievals', type=int, default=100, help="Number of timed retrievals")
+    parser.add_argument('-s', '--state-size', type=int, default=8, help="State size")
+
+    args = parser.parse_args()
+
+    print("{:<10} {:>10} {:>12} {:>10} {:>16}".format('unit', 'batch', 'build (s)', 'ops', 'retrieve (ms)'))
+    for unit in ('episodes', 'sequences'):
+        for batch_size in args.batch_sizes:
+            build_time, num_ops, retrieve_time = benchmark(
+                unit=unit,
+                batch_size=batch_size,
+                capacity=args.capacity,
+                episode_length=args.episode_length,
+                sequence_length=args.sequence_length,
+                num_retrievals=args.retrievals,
+                state_size=args.state_size
+            )
+            print("{:<10} {:>10} {:>12.2f} {:>10} {:>16.3f}".format(
+                unit, batch_size, build_time, num_ops, retrieve_time * 1000.0
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Benchmarks environment steps per second of the ParallelRunner for different numbers of environments.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import copy
+import logging
+import time
+
+from tensorforce.agents import Agent
+from tensorforce.execution import Runner, ParallelRunner
+from tensorforce.tests.minimal_test import MinimalTest
+
+
+# python examples/parallel_runner_benchmark.py -n 1 2 4 8 16 32 -t 20000
+
+
+def create_agent(environment, num_parallel):
+    return Agent.from_spec(
+        spec=dict(
+            type='vpg_agent',
+            update_mode=dict(unit='episodes', batch_size=10, frequency=10),
+            memory=dict(type='latest', include_next_states=False, capacity=10000),
+            optimizer=dict(type='adam', learning_rate=1e-3),
+            batching_capacity=max(num_parallel, 1000),
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=num_parallel)
+        ),
+        kwargs=dict(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32), dict(type='dense', size=32)]
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-n', '--num-environments', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32], help="Numbers of environments")
+    parser.add_argument('-t', '--timesteps', type=int, default=20000, help="Number of timesteps per measurement")
+    parser.add_argument('-m', '--max-episode-timesteps', type=int, default=100, help="Maximum number of timesteps per episode")
+
+    args = parser.parse_args()
+
+    logging.getLogger('tensorflow').disabled = True
+
+    environment = MinimalTest(specification={'int': ()})
+
+    # Sequential baseline: one act per environment step.
+    agent = create_agent(environment=environment, num_parallel=1)
+    runner = Runner(agent=agent, environment=environment)
+    start = time.time()
+    runner.run(num_timesteps=args.timesteps, max_episode_timesteps=args.max_episode_timesteps)
+    baseline = runner.timestep / (time.time() - start)
+    runner.close()
+
+    results = list()
+    for num_environments in args.num_environments:
+        environments = [copy.deepcopy(environment) for _ in range(num_environments)]
+        agent = create_agent(environment=environment, num_parallel=num_environments)
+        runner = ParallelRunner(agent=agent, environment=environments)
+        start = time.time()
+        runner.run(num_timesteps=args.timesteps, max_episode_timesteps=args.max_episode_timesteps)
+        results.append((num_environments, runner.timestep / (time.time() - start)))
+        runner.close()
+
+    print("{:<20} {:>14} {:>10}".format('environments', 'steps/sec', 'speedup'))
+    print("{:<20} {:>14.1f} {:>10.2f}".format('1 (Runner)', baseline, 1.0))
+    for num_environments, steps_per_second in results:
+        print("{:<20} {:>14.1f} {:>10.2f}".format(num_environments, steps_per_second, steps_per_second / baseline))
+
+
+if __name__ == '__main__':
+    main()
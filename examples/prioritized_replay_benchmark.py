@@ -0,0 +1,131 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Benchmarks sampling and priority updates of the prioritized replay memories for different capacities.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce.core.memories import PrioritizedReplay, SumTreePrioritizedReplay
+
+
+# python examples/prioritized_replay_benchmark.py -c 10000 100000 1000000 -b 32
+
+
+def benchmark(memory_class, capacity, batch_size, num_updates, state_size, kwargs):
+    tf.reset_default_graph()
+
+    def custom_getter(getter, name, registered=False, **kwargs):
+        return getter(name=name, **kwargs)
+
+    with tf.variable_scope('benchmark', custom_getter=custom_getter):
+        memory = memory_class(
+            states=dict(state=dict(shape=(state_size,), type='float')),
+            internals=dict(),
+            actions=dict(action=dict(shape=(), type='int')),
+            include_next_states=False,
+            capacity=capacity,
+            **kwargs
+        )
+        memory.initialize()
+
+        states = tf.placeholder(dtype=tf.float32, shape=(None, state_size))
+        actions = tf.placeholder(dtype=tf.int32, shape=(None,))
+        terminal = tf.placeholder(dtype=tf.bool, shape=(None,))
+        reward = tf.placeholder(dtype=tf.float32, shape=(None,))
+        loss = tf.placeholder(dtype=tf.float32, shape=(None,))
+
+        store = memory.store(
+            states=dict(state=states),
+            internals=dict(),
+            actions=dict(action=actions),
+            terminal=terminal,
+            reward=reward
+        )
+        batch = memory.retrieve_timesteps(n=batch_size)
+        with tf.control_dependencies(control_inputs=(batch['reward'],)):
+            update = memory.update_batch(loss_per_instance=loss)
+
+    with tf.Session() as session:
+        session.run(tf.global_variables_initializer())
+
+        # Fill the memory in chunks (the buffer of PrioritizedReplay needs to be flushed via updates).
+        chunk_size = min(kwargs.get('buffer_size', capacity) - 1, capacity - 1, 10000)
+        num_stored = 0
+        start = time.time()
+        while num_stored < capacity:
+            session.run(fetches=store, feed_dict={
+                states: np.random.randn(chunk_size, state_size),
+                actions: np.random.randint(10, size=(chunk_size,)),
+                terminal: np.random.uniform(size=(chunk_size,)) < 0.01,
+                reward: np.random.randn(chunk_size)
+            })
+            if memory_class is PrioritizedReplay:
+                session.run(fetches=update, feed_dict={loss: np.random.uniform(size=(batch_size,))})
+            num_stored += chunk_size
+        store_time = time.time() - start
+
+        # Warm-up, then timed sample + priority update steps.
+        feed_dict = {loss: np.random.uniform(size=(batch_size,))}
+        session.run(fetches=update, feed_dict=feed_dict)
+        start = time.time()
+        for _ in range(num_updates):
+            feed_dict = {loss: np.random.uniform(size=(batch_size,))}
+            session.run(fetches=update, feed_dict=feed_dict)
+        update_time = (time.time() - start) / num_updates
+
+    return store_time, update_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-c', '--capacities', type=int, nargs='+', default=[10000, 100000, 1000000], help="Memory capacities")
+    parser.add_argument('-b', '--batch-size', type=int, default=32, help="Batch size")
+    parser.add_argument('-u', '--updates', type=int, default=100, help="Number of timed sample + update steps")
+    parser.add_argument('-s', '--state-size', type=int, default=8, help="State size")
+    parser.add_argument('--skip-sorted', action='store_true', default=False, help="Only benchmark the sum-tree memory")
+
+    args = parser.parse_args()
+
+    memories = [('sum_tree_prioritized_replay', SumTreePrioritizedReplay, dict())]
+    if not args.skip_sorted:
+        memories.append(('prioritized_replay', PrioritizedReplay, dict(buffer_size=1000)))
+
+    print("{:<30} {:>10} {:>12} {:>22}".format('memory', 'capacity', 'fill (s)', 'sample + update (ms)'))
+    for capacity in args.capacities:
+        for name, memory_class, kwargs in memories:
+            store_time, update_time = benchmark(
+                memory_class=memory_class,
+                capacity=capacity,
+                batch_size=args.batch_size,
+                num_updates=args.updates,
+                state_size=args.state_size,
+                kwargs=kwargs
+            )
+            print("{:<30} {:>10} {:>12.2f} {:>22.3f}".format(name, capacity, store_time, update_time * 1000.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Benchmarks optimization steps per second of a DQN agent for different numbers of retrieval and optimization
+steps per update (update_mode['repeat_update']), run in one in-graph loop.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from tensorforce.agents import Agent
+
+
+# python examples/repeat_update_benchmark.py -k 1 2 4 8 16
+
+
+def benchmark(repeat_update, state_size, batch_size, frequency, num_timesteps):
+    agent = Agent.from_spec(
+        spec=dict(
+            type='dqn_agent',
+            update_mode=dict(unit='timesteps', batch_size=batch_size, frequency=frequency, repeat_update=repeat_update),
+            memory=dict(type='replay', include_next_states=True, capacity=10000),
+            batching_capacity=1
+        ),
+        kwargs=dict(
+            states=dict(type='float', shape=(state_size,)),
+            actions=dict(type='int', num_actions=4),
+            network=[dict(type='dense', size=64), dict(type='dense', size=64)]
+        )
+    )
+
+    states = np.random.randn(num_timesteps, state_size).astype(np.float32)
+
+    # Fill the memory up to the first update.
+    for n in range(batch_size):
+        agent.act(states=states[n])
+        agent.observe(terminal=False, reward=0.0)
+
+    num_updates = 0
+    start = time.time()
+    for n in range(num_timesteps):
+        agent.act(states=states[n])
+        agent.observe(terminal=(n % 100 == 99), reward=np.random.randn())
+        if agent.timestep % frequency == 0:
+            num_updates += 1
+    elapsed_time = time.time() - start
+
+    agent.close()
+
+    return num_updates * repeat_update / elapsed_time, num_timesteps / elapsed_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-k', '--repeat-updates', type=int, nargs='+', default=[1, 2, 4, 8, 16], help="Steps per update")
+    parser.add_argument('-s', '--state-size', type=int, default=8, help="State size")
+    parser.add_argument('-b', '--batch-size', type=int, default=32, help="Batch size")
+    parser.add_argument('-f', '--frequency', type=int, default=4, help="Update frequency")
+    parser.add_argument('-t', '--timesteps', type=int, default=4000, help="Number of timed timesteps")
+
+    args = parser.parse_args()
+
+    logging.getLogger('tensorflow').disabled = True
+
+    print("{:<8} {:>14} {:>16} {:>14}".format('K', 'replay ratio', 'updates/s', 'timesteps/s'))
+    for repeat_update in args.repeat_updates:
+        updates_per_second, timesteps_per_second = benchmark(
+            repeat_update=repeat_update,
+            state_size=args.state_size,
+            batch_size=args.batch_size,
+            frequency=args.frequency,
+            num_timesteps=args.timesteps
+        )
+        print("{:<8} {:>14.2f} {:>16.1f} {:>14.1f}".format(
+            repeat_update, repeat_update * args.batch_size / args.frequency, updates_per_second, timesteps_per_second
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Benchmarks environment steps per second of the ThreadedRunner for different numbers of worker threads, with one
+atomic observe call per timestep versus batched atomic observe calls.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import copy
+import logging
+import time
+
+from tensorforce.agents import VPGAgent
+from tensorforce.execution import ThreadedRunner
+from tensorforce.execution.threaded_runner import clone_worker_agent
+from tensorforce.tests.minimal_test import MinimalTest
+
+
+# python examples/threaded_runner_benchmark.py -n 1 2 4 8 16 -b 32
+
+
+def benchmark(num_threads, num_episodes, max_episode_timesteps, observe_batch_size):
+    environment = MinimalTest(specification={'int': ()})
+    network = [dict(type='dense', size=32), dict(type='dense', size=32)]
+    kwargs = dict(
+        update_mode=dict(unit='episodes', batch_size=10, frequency=10),
+        memory=dict(type='latest', include_next_states=False, capacity=10000),
+        optimizer=dict(type='adam', learning_rate=1e-3),
+        batched_observe=False
+    )
+    agent = VPGAgent(states=environment.states, actions=environment.actions, network=network, **kwargs)
+
+    agents = clone_worker_agent(agent, num_threads, environment, network, kwargs)
+    environments = [environment] + [copy.deepcopy(environment) for _ in range(num_threads - 1)]
+    runner = ThreadedRunner(agent=agents, environment=environments)
+
+    start = time.time()
+    runner.run(
+        num_episodes=num_episodes,
+        max_episode_timesteps=max_episode_timesteps,
+        observe_batch_size=observe_batch_size
+    )
+    steps_per_second = sum(runner.episode_timesteps) / (time.time() - start)
+    runner.close()
+
+    return steps_per_second
+
+
+def main():
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-n', '--num-threads', type=int, nargs='+', default=[1, 2, 4, 8, 16], help="Numbers of threads")
+    parser.add_argument('-b', '--observe-batch-size', type=int, default=32, help="Transitions per batched atomic observe")
+    parser.add_argument('-e', '--episodes', type=int, default=200, help="Number of episodes per measurement")
+    parser.add_argument('-m', '--max-episode-timesteps', type=int, default=100, help="Maximum number of timesteps per episode")
+
+    args = parser.parse_args()
+
+    logging.getLogger('tensorflow').disabled = True
+
+    print("{:<10} {:>22} {:>22} {:>10}".format('threads', 'per-step (steps/sec)', 'batched (steps/sec)', 'speedup'))
+    for num_threads in args.num_threads:
+        per_step = benchmark(
+            num_threads=num_threads,
+            num_episodes=args.episodes,
+            max_episode_timesteps=args.max_episode_timesteps,
+            observe_batch_size=None
+        )
+        batched = benchmark(
+            num_threads=num_threads,
+            num_episodes=args.episodes,
+            max_episode_timesteps=args.max_episode_timesteps,
+            observe_batch_size=args.observe_batch_size
+        )
+        print("{:<10} {:>22.1f} {:>22.1f} {:>10.2f}".format(num_threads, per_step, batched, batched / per_step))
+
+
+if __name__ == '__main__':
+    main()
@@ -26,6 +26,7 @@ from tensorforce.agents.trpo_agent import TRPOAgent
 from tensorforce.agents.acktr_agent import ACKTRAgent
 from tensorforce.agents.vpg_agent import VPGAgent
 from tensorforce.agents.ddpg_agent import DDPGAgent
+from tensorforce.agents.inference_agent import InferenceAgent
 # from tensorforce.agents.categorical_dqn_agent import CategoricalDQNAgent
 
 
@@ -59,5 +60,6 @@ __all__ = [
     'ACKTRAgent',
     'VPGAgent',
     'DDPGAgent',
+    'InferenceAgent',
     'agents'
 ]
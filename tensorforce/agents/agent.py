@@ -18,6 +18,7 @@ from __future__ import print_function
 from __future__ import division
 
 from copy import deepcopy
+import time
 
 import numpy as np
 
@@ -72,6 +73,8 @@ class Agent(object):
         self.current_reward = None
         self.timestep = None
         self.episode = None
+        # Time spent in observe calls which triggered an update.
+        self.update_time = 0.0
 
         self.model = self.initialize_model()
         if self.batched_observe:
@@ -101,6 +104,16 @@ class Agent(object):
         self.episode, self.timestep, self.next_internals = self.model.reset()
         self.current_internals = self.next_internals
 
+    def reset_buffers(self):
+        """
+        Discards the buffered act/observe records of all parallel episodes, e.g. of episodes which were interrupted
+        at the end of a previous run and hence would otherwise be continued by the next episode of the same index.
+        """
+        self.model.reset_buffers()
+        if self.batched_observe:
+            self.observe_terminal = [list() for _ in range(self.model.num_parallel)]
+            self.observe_reward = [list() for _ in range(self.model.num_parallel)]
+
     def act(self, states, deterministic=False, independent=False, fetch_tensors=None, buffered=True, index=0):
         """
         Return action(s) for given state(s). States preprocessing and exploration are applied if
@@ -114,6 +127,8 @@ class Agent(object):
             fetch_tensors (list): Optional String of named tensors to fetch
             buffered (bool): If true (default), states and internals are not returned but buffered
                 with observes. Must be false for multi-threaded mode as we need atomic inserts.
+            index (int): Parallel episode index, or list of indices for a batch of states from parallel
+                episodes, which subsequently have to be observed per index.
         Returns:
             Scalar value of the action or dict of multiple actions the agent wants to execute.
             (fetched_tensors) Optional dict() with named tensors fetched
@@ -172,6 +187,7 @@ class Agent(object):
         Args:
             terminal (bool): boolean indicating if the episode terminated after the observation.
             reward (float): scalar reward that resulted from executing the action.
+            index (int): Parallel episode index.
         """
         self.current_terminal = terminal
         self.current_reward = reward
@@ -182,19 +198,26 @@ class Agent(object):
             self.observe_reward[index].append(self.current_reward)
 
             if self.current_terminal or len(self.observe_terminal[index]) >= self.batching_capacity:
+                start = time.time()
                 self.episode = self.model.observe(
                     terminal=self.observe_terminal[index],
                     reward=self.observe_reward[index],
                     index=index
                 )
+                if self.model.update_due(timestep=self.timestep, episode=self.episode, terminal=self.current_terminal):
+                    self.update_time += time.time() - start
                 self.observe_terminal[index] = list()
                 self.observe_reward[index] = list()
 
         else:
+            start = time.time()
             self.episode = self.model.observe(
                 terminal=self.current_terminal,
-                reward=self.current_reward
+                reward=self.current_reward,
+                index=index
             )
+            if self.model.update_due(timestep=self.timestep, episode=self.episode, terminal=self.current_terminal):
+                self.update_time += time.time() - start
 
     def atomic_observe(self, states, actions, internals, reward, terminal):
         """
@@ -221,6 +244,7 @@ class Agent(object):
         if self.unique_action:
             actions = dict(action=actions)
 
+        start = time.time()
         self.episode = self.model.atomic_observe(
             states=states,
             actions=actions,
@@ -228,6 +252,8 @@ class Agent(object):
             terminal=self.current_terminal,
             reward=self.current_reward
         )
+        if self.model.update_due(timestep=self.timestep, episode=self.episode, terminal=self.current_terminal):
+            self.update_time += time.time() - start
 
     def should_stop(self):
         return self.model.monitored_session.should_stop()
@@ -275,6 +301,35 @@ class Agent(object):
         """
         self.model.restore(directory=directory, file=file)
 
+    def export_inference(self, directory):
+        """
+        Exports a frozen inference-only graph (states preprocessing, network and action distributions), which can
+        be loaded via `InferenceAgent` without building the full model.
+
+        Args:
+            directory (str): Export directory.
+
+        Returns:
+            Path of the exported graph file.
+        """
+        return self.model.export_inference(
+            directory=directory,
+            unique_state=self.unique_state,
+            unique_action=self.unique_action
+        )
+
+    def buffer_memory_report(self):
+        """
+        Returns the number of bytes used per act/observe buffer of the model (see `execution['buffering']`).
+        """
+        return self.model.buffer_memory_report()
+
+    def learner_statistics(self):
+        """
+        Returns acting and learning throughput of the background learner thread (see `execution['learner']`).
+        """
+        return self.model.learner_statistics()
+
     @staticmethod
     def from_spec(spec, kwargs):
         """
@@ -17,6 +17,9 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+import logging
+import time
+
 from six.moves import xrange
 
 from tensorforce.agents import LearningAgent
@@ -255,12 +258,55 @@ class DQFDAgent(LearningAgent):
                 reward=reward
             )
 
-    def pretrain(self, steps):
+    def import_demonstration_dataset(self, path, batch_size=10000, report_interval=None):
+        """
+        Imports demonstrations from an on-disk columnar dataset (see `ExperienceDataset`, written e.g. via
+        `save_experience`) in fixed-size batches, so memory usage is bounded by the batch size.
+
+        Args:
+            path (str): Dataset directory or .npz file.
+            batch_size (int): Number of timesteps imported per session call (at most the demo memory capacity).
+            report_interval (int): Logs the import throughput every report_interval batches (default: never).
+
+        Returns:
+            Dict with number of imported timesteps, seconds and timesteps per second.
+        """
+        return self.stream_dataset(
+            path=path,
+            import_fn=self.model.import_demo_experience,
+            capacity=self.model.demo_memory.capacity,
+            batch_size=batch_size,
+            report_interval=report_interval
+        )
+
+    def pretrain(self, steps, steps_per_call=100, report_interval=None):
         """
         Computes pre-train updates.
 
         Args:
             steps: Number of updates to execute.
+            steps_per_call (int): Number of updates run in one in-graph loop per session call.
+            report_interval (int): Logs the pretraining progress and throughput every report_interval session
+                calls (default: never).
+
+        Returns:
+            Dict with number of updates, seconds and updates per second.
         """
-        for _ in xrange(steps):
-            self.model.demo_update()
+        num_steps = 0
+        start = time.time()
+        for n in xrange(-(-steps // steps_per_call)):
+            call_steps = min(steps_per_call, steps - num_steps)
+            self.model.demo_update(steps=call_steps)
+            num_steps += call_steps
+
+            if report_interval is not None and (n + 1) % report_interval == 0:
+                logging.getLogger(__name__).info('Pretrained {} of {} steps ({:.1f} steps/sec).'.format(
+                    num_steps, steps, num_steps / max(time.time() - start, 1e-6)
+                ))
+
+        seconds = time.time() - start
+        return dict(
+            steps=num_steps,
+            seconds=seconds,
+            steps_per_second=(num_steps / max(seconds, 1e-6))
+        )
@@ -0,0 +1,153 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import json
+import os
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import TensorForceError
+
+
+class InferenceAgent(object):
+    """
+    Lightweight agent which loads a frozen inference graph exported via `Agent.export_inference` into a plain
+    session and deterministically computes actions, without memory, optimizer, buffers or a monitored session.
+    """
+
+    def __init__(self, directory, session_config=None):
+        """
+        Loads the exported inference graph.
+
+        Args:
+            directory (str): Export directory.
+            session_config (dict): Options for a TensorFlow ConfigProto object (default: none).
+        """
+        with open(os.path.join(directory, 'inference.json'), 'r') as filehandle:
+            self.manifest = json.load(fp=filehandle)
+        graph_def = tf.GraphDef()
+        with open(os.path.join(directory, 'inference.pb'), 'rb') as filehandle:
+            graph_def.ParseFromString(filehandle.read())
+
+        self.unique_state = self.manifest['unique_state']
+        self.unique_action = self.manifest['unique_action']
+        self.states_spec = self.manifest['states']
+        self.state_names = sorted(self.manifest['states'])
+        self.internal_names = sorted(self.manifest['internals'])
+        self.action_names = sorted(self.manifest['actions'])
+        self.internals_init = {
+            name: np.asarray(self.manifest['internals'][name]['init'], dtype=np.float32)
+            for name in self.internal_names
+        }
+
+        self.graph = tf.Graph()
+        with self.graph.as_default():
+            # Actions are always deterministic.
+            input_map = dict()
+            deterministic = self.manifest['deterministic']
+            if any(node.name == deterministic.split(':')[0] for node in graph_def.node):
+                input_map[deterministic] = tf.constant(value=True, dtype=tf.bool)
+            tf.import_graph_def(graph_def=graph_def, input_map=input_map, name='inference')
+
+            def get_tensor(name):
+                return self.graph.get_tensor_by_name('inference/' + name)
+
+            feed_list = [get_tensor(self.manifest['states'][name]['tensor']) for name in self.state_names]
+            feed_list.extend(get_tensor(self.manifest['internals'][name]['tensor']) for name in self.internal_names)
+            fetch_list = [get_tensor(self.manifest['actions'][name]) for name in self.action_names]
+            fetch_list.extend(get_tensor(self.manifest['internals'][name]['output']) for name in self.internal_names)
+        self.graph.finalize()
+
+        if session_config is not None:
+            session_config = tf.ConfigProto(**session_config)
+        self.session = tf.Session(graph=self.graph, config=session_config)
+        self.session_callable = self.session.make_callable(fetches=fetch_list, feed_list=feed_list)
+
+        self.next_internals = None
+        self.reset()
+
+    def __str__(self):
+        return 'InferenceAgent'
+
+    def close(self):
+        self.session.close()
+
+    def reset(self):
+        """
+        Resets the internal states to their initial values (e.g. on episode start).
+        """
+        self.next_internals = dict(self.internals_init)
+
+    def act(self, states, internals=None, return_internals=False):
+        """
+        Returns the deterministic action(s) for the given state(s).
+
+        Args:
+            states (any): One state (usually a value tuple) or dict of states if multiple states are expected, or
+                a batch thereof.
+            internals (dict): Prior internal states (default: internal states of the previous unbatched act call,
+                or initial internal states for a batch of states).
+            return_internals (bool): Whether to additionally return the posterior internal states.
+
+        Returns:
+            Scalar value of the action or dict of multiple actions the agent wants to execute, and optionally the
+            dict of posterior internal states.
+        """
+        if self.unique_state:
+            states = dict(state=states)
+
+        name = self.state_names[0]
+        state = np.asarray(states[name])
+        batched = (state.ndim != len(self.states_spec[name]['shape']))
+
+        if internals is None:
+            if batched:
+                internals = {
+                    name: np.broadcast_to(internal, (state.shape[0],) + internal.shape)
+                    for name, internal in self.internals_init.items()
+                }
+            else:
+                internals = self.next_internals
+        elif set(internals) != set(self.internal_names):
+            raise TensorForceError("Invalid internal states {}.".format(sorted(internals)))
+
+        if batched:
+            args = [states[name] for name in self.state_names]
+            args.extend(internals[name] for name in self.internal_names)
+        else:
+            args = [(states[name],) for name in self.state_names]
+            args.extend((internals[name],) for name in self.internal_names)
+
+        values = self.session_callable(*args)
+
+        num_actions = len(self.action_names)
+        actions = dict(zip(self.action_names, values[:num_actions]))
+        next_internals = dict(zip(self.internal_names, values[num_actions:]))
+        if not batched:
+            actions = {name: action[0] for name, action in actions.items()}
+            next_internals = {name: internal[0] for name, internal in next_internals.items()}
+            self.next_internals = next_internals
+
+        if self.unique_action:
+            actions = actions['action']
+        if return_internals:
+            return actions, next_internals
+        else:
+            return actions
@@ -18,8 +18,14 @@ from __future__ import print_function
 from __future__ import division
 
 import inspect
+import logging
+import time
 
+import numpy as np
+
+from tensorforce import TensorForceError
 from tensorforce.agents.agent import Agent
+from tensorforce.experience_dataset import ExperienceDataset
 from tensorforce.meta_parameter_recorder import MetaParameterRecorder
 from tensorforce.contrib.sanity_check_specs import sanity_check_execution_spec
 
@@ -62,6 +68,9 @@ class LearningAgent(Agent):
                 - batch_size: integer (required).
                 - frequency: integer (default: batch_size).
                 - length: integer (optional if unit == 'sequences', default: 8).
+                - first_update: integer, first timestep/episode of an update (default: 0).
+                - repeat_update: integer, number of retrieval and optimization steps per update, run in one
+                  TensorFlow while loop (default: 1).
             memory (spec): Memory specification, see core.memories module for more information
                 (required).
             optimizer (spec): Optimizer specification, see core.optimizers module for more
@@ -192,3 +201,144 @@ class LearningAgent(Agent):
                 terminal=terminal,
                 reward=reward
             )
+
+    def import_experience_dataset(self, path, batch_size=10000, report_interval=None):
+        """
+        Imports experiences from an on-disk columnar dataset (see `ExperienceDataset`) in fixed-size batches,
+        so memory usage is bounded by the batch size instead of the dataset size.
+
+        Args:
+            path (str): Dataset directory or .npz file.
+            batch_size (int): Number of timesteps imported per session call (at most the memory capacity).
+            report_interval (int): Logs the import throughput every report_interval batches (default: never).
+
+        Returns:
+            Dict with number of imported timesteps, seconds and timesteps per second.
+        """
+        return self.stream_dataset(
+            path=path,
+            import_fn=self.model.import_experience,
+            capacity=self.model.memory.capacity,
+            batch_size=batch_size,
+            report_interval=report_interval
+        )
+
+    def save_experience(self, path, experiences):
+        """
+        Saves experiences as on-disk columnar dataset, which can be imported via `import_experience_dataset`.
+
+        Args:
+            path (str): Dataset directory, or file path ending with '.npz'.
+            experiences: Either a list of experience dicts (as for `import_experience`), or a dict with states,
+                internals, actions, terminal and reward entries, each a (dict of) column(s).
+        """
+        if isinstance(experiences, dict):
+            states = experiences['states']
+            internals = experiences.get('internals') or dict()
+            actions = experiences['actions']
+            terminal = experiences['terminal']
+            reward = experiences['reward']
+        else:
+            if self.unique_state:
+                states = [experience['states'] for experience in experiences]
+            else:
+                states = {
+                    name: [experience['states'][name] for experience in experiences]
+                    for name in experiences[0]['states']
+                }
+            if isinstance(experiences[0].get('internals'), dict):
+                internals = {
+                    name: [experience['internals'][name] for experience in experiences]
+                    for name in experiences[0]['internals']
+                }
+            else:
+                internals = dict()
+            if self.unique_action:
+                actions = [experience['actions'] for experience in experiences]
+            else:
+                actions = {
+                    name: [experience['actions'][name] for experience in experiences]
+                    for name in experiences[0]['actions']
+                }
+            terminal = [experience['terminal'] for experience in experiences]
+            reward = [experience['reward'] for experience in experiences]
+
+        if self.unique_state:
+            states = dict(state=states)
+        if self.unique_action:
+            actions = dict(action=actions)
+
+        ExperienceDataset.write(
+            path=path,
+            states=states,
+            internals=internals,
+            actions=actions,
+            terminal=terminal,
+            reward=reward
+        )
+
+    def stream_dataset(self, path, import_fn, capacity, batch_size, report_interval):
+        """
+        Feeds an experience dataset batch-wise to the given model import function. Internal states missing in
+        the dataset are set to their initial values. Batches are limited to the capacity of the memory imported
+        into, which cannot store more records at once.
+        """
+        batch_size = min(batch_size, capacity)
+
+        dataset = ExperienceDataset(path=path)
+        if dataset.names(kind='states') != sorted(self.model.states_spec):
+            raise TensorForceError("Dataset states {} do not match agent states {}.".format(
+                dataset.names(kind='states'), sorted(self.model.states_spec)
+            ))
+        if dataset.names(kind='actions') != sorted(self.model.actions_spec):
+            raise TensorForceError("Dataset actions {} do not match agent actions {}.".format(
+                dataset.names(kind='actions'), sorted(self.model.actions_spec)
+            ))
+
+        num_timesteps = 0
+        start = time.time()
+        for n, batch in enumerate(dataset.batches(batch_size=batch_size)):
+            size = batch['terminal'].shape[0]
+            for name in sorted(self.model.internals_spec):
+                if name not in batch['internals']:
+                    internal = np.asarray(self.model.internals_init[name])
+                    batch['internals'][name] = np.broadcast_to(internal, (size,) + internal.shape)
+
+            import_fn(**batch)
+            num_timesteps += size
+
+            if report_interval is not None and (n + 1) % report_interval == 0:
+                logging.getLogger(__name__).info('Imported {} of {} timesteps ({:.1f} timesteps/sec).'.format(
+                    num_timesteps, len(dataset), num_timesteps / max(time.time() - start, 1e-6)
+                ))
+
+        seconds = time.time() - start
+        return dict(
+            timesteps=num_timesteps,
+            seconds=seconds,
+            timesteps_per_second=(num_timesteps / max(seconds, 1e-6))
+        )
+
+    def save_memory(self, directory, chunk_size=65536):
+        """
+        Saves the replay memory content as chunked, memory-mappable .npy files, independent of model checkpoints.
+
+        Args:
+            directory (str): Directory to save the memory to.
+            chunk_size (int): Number of memory entries transferred per session call.
+
+        Returns:
+            Path of the memory manifest file.
+        """
+        return self.model.save_memory(directory=directory, chunk_size=chunk_size)
+
+    def restore_memory(self, directory, chunk_size=65536):
+        """
+        Restores the replay memory content saved via `save_memory`, e.g. to warm-start a new process without
+        re-collecting experience. Requires a memory of the same type and capacity.
+
+        Args:
+            directory (str): Directory containing the saved memory.
+            chunk_size (int): Number of memory entries transferred per session call.
+        """
+        self.model.restore_memory(directory=directory, chunk_size=chunk_size)
@@ -36,7 +36,8 @@ class ALE(Environment):
         loss_of_life_termination=False,
         loss_of_life_reward=0,
         display_screen=False,
-        seed=np.random.RandomState()
+        seed=np.random.RandomState(),
+        max_pooling=False
     ):
         """
         Initialize ALE.
@@ -49,6 +50,9 @@ class ALE(Environment):
             loss_of_life_reward: Reward/Penalty on loss of life (negative values are a penalty). Default 0.
             display_screen: Displays the emulator screen. Default False.
             seed: Random seed
+            max_pooling: Repeats the action for frame_skip frames within execute instead of via ALE, and returns
+                the elementwise maximum of the last two frames, also at terminal frames (removes flickering of
+                sprites). Default False.
         """
 
         self.ale = ALEInterface()
@@ -58,7 +62,8 @@ class ALE(Environment):
         self.ale.setInt(b'random_seed', seed.randint(0, 9999))
         self.ale.setFloat(b'repeat_action_probability', repeat_action_probability)
         self.ale.setBool(b'color_averaging', False)
-        self.ale.setInt(b'frame_skip', frame_skip)
+        # With max-pooling, frames are skipped in execute to retrieve the second-to-last frame.
+        self.ale.setInt(b'frame_skip', 1 if max_pooling else frame_skip)
 
         # All set commands must be done before loading the ROM.
         self.ale.loadROM(rom.encode())
@@ -68,6 +73,9 @@ class ALE(Environment):
         self.gamescreen = np.empty((height, width, 3), dtype=np.uint8)
 
         self.frame_skip = frame_skip
+        self.max_pooling = max_pooling
+        # Second-to-last frame for max-pooling.
+        self.previous_gamescreen = np.empty((height, width, 3), dtype=np.uint8)
 
         # Setup action converter.
         # ALE returns legal action indexes, convert these to just numbers.
@@ -97,18 +105,52 @@ class ALE(Environment):
         # Convert action to ale action.
         ale_action = self.action_inds[action]
 
+        if self.max_pooling:
+            return self.execute_max_pooling(ale_action=ale_action)
+
         # Get reward and process terminal & next state.
         rew = self.ale.act(ale_action)
+        rew += self.process_lives()
+
+        terminal = self.is_terminal
+        state_tp1 = self.current_state
+        return state_tp1, terminal, rew
+
+    def execute_max_pooling(self, ale_action):
+        """
+        Repeats the action for frame_skip frames (stops early at a terminal frame), returning the summed reward
+        and the elementwise maximum of the last two frames, like the `ActionRepeat` environment wrapper.
+        """
+        rew = 0
+        num_frames = 0
+        for frame in range(self.frame_skip):
+            if frame > 0:
+                # Any frame may turn out to be the second-to-last one if the episode ends early.
+                self.previous_gamescreen = self.ale.getScreenRGB(self.previous_gamescreen)
+            rew += self.ale.act(ale_action)
+            rew += self.process_lives()
+            num_frames += 1
+
+            if self.is_terminal:
+                break
+
+        terminal = self.is_terminal
+        state_tp1 = self.current_state
+        if num_frames > 1:
+            np.maximum(state_tp1, self.previous_gamescreen, out=state_tp1)
+        return state_tp1, terminal, rew
+
+    def process_lives(self):
+        """
+        Tracks loss of life and returns the loss-of-life reward, if any.
+        """
         if self.loss_of_life_termination or self.loss_of_life_reward != 0:
             new_lives = self.ale.lives()
             if new_lives < self.cur_lives:
                 self.cur_lives = new_lives
                 self.life_lost = True
-                rew += self.loss_of_life_reward
-
-        terminal = self.is_terminal
-        state_tp1 = self.current_state
-        return state_tp1, terminal, rew
+                return self.loss_of_life_reward
+        return 0
 
     @property
     def states(self):
@@ -0,0 +1,205 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import asyncio
+import socket
+import time
+
+from tensorforce import TensorForceError
+from tensorforce.contrib.remote_environment import RemoteEnvironment, MsgPackNumpyProtocol
+from tensorforce.contrib.unreal_engine import UE4Environment
+
+
+class AsyncMsgPackNumpyProtocol(MsgPackNumpyProtocol):
+    """
+    asyncio variant of the MsgPackNumpyProtocol for non-blocking sockets: `send` and `recv` are coroutines,
+    so many connections can be served concurrently from one event loop. Each connection requires its own
+    protocol object, since messages are received into the protocol's preallocated buffer.
+    """
+
+    async def send(self, message, socket_, loop=None):
+        """
+        Sends a message (dict) to the non-blocking socket.
+
+        Args:
+            message: The message dict (e.g. {"cmd": "reset"})
+            socket_: The python socket object to use.
+            loop: The event loop to use (default: current event loop).
+        """
+        if not socket_:
+            raise TensorForceError("No socket given in call to `send`!")
+        loop = loop or asyncio.get_event_loop()
+        await loop.sock_sendall(socket_, self.encode(message))
+
+    async def recv(self, socket_, encoding=None, loop=None):
+        """
+        Receives a message from the non-blocking socket, waiting without blocking the event loop.
+
+        Args:
+            socket_: The python socket object to use.
+            encoding (str): The encoding to use for unpacking messages from the socket.
+            loop: The event loop to use (default: current event loop).
+        Returns: The decoded (as dict) message received.
+        """
+        loop = loop or asyncio.get_event_loop()
+        await self.recv_into(socket_, memoryview(self.header), loop)
+        view = self.message_view(int(self.header))
+        await self.recv_into(socket_, view, loop)
+        return self.decode(view, encoding)
+
+    @staticmethod
+    async def recv_into(socket_, view, loop):
+        """
+        Fills the given buffer view with data from the non-blocking socket.
+        """
+        received_len = 0
+        while received_len < len(view):
+            data_len = await loop.sock_recv_into(socket_, view[received_len:])
+            if data_len == 0:
+                raise TensorForceError("No data of len {} received by socket.recv_into in call to method `recv` "
+                                       "(listener possibly closed)!".format(len(view) - received_len))
+            received_len += data_len
+
+
+class AsyncRemoteEnvironment(RemoteEnvironment):
+    """
+    Remote environment driven from an asyncio event loop: `connect`, `reset` and `execute` are coroutines,
+    so the requests of many remote environments are in flight at the same time (see AsyncRunner).
+    Subclasses implement `reset` and `execute` as coroutines on top of `request`.
+    """
+
+    def __init__(self, host="localhost", port=6025):
+        """
+        Args:
+            host (str): The hostname to connect to.
+            port (int): The port to connect to.
+        """
+        RemoteEnvironment.__init__(self, host, port)
+        self.protocol = AsyncMsgPackNumpyProtocol()
+
+    def __str__(self):
+        return "AsyncRemoteEnvironment({}:{}{})".format(self.host, self.port, " [connected]" if self.socket else "")
+
+    async def connect(self, timeout=600):
+        """
+        Starts the server tcp connection on the given host:port, without blocking the event loop.
+
+        Args:
+            timeout (int): The time (in seconds) for which we will attempt a connection to the remote
+                (every 5sec). After that (or if timeout is None or 0), an error is raised.
+        """
+        if self.socket:
+            raise TensorForceError("Already connected to {}:{}. Only one connection allowed at a time. "
+                                   "Close first by calling `close`!".format(self.host, self.port))
+
+        if timeout is None or timeout < 5:
+            timeout = 5
+
+        loop = asyncio.get_event_loop()
+        start_time = time.time()
+        while True:
+            socket_ = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            socket_.setblocking(False)
+            try:
+                await asyncio.wait_for(loop.sock_connect(socket_, (self.host, self.port)), timeout=5)
+                break
+            except (OSError, asyncio.TimeoutError) as e:
+                socket_.close()
+                if time.time() - start_time >= timeout:
+                    raise TensorForceError("Error when trying to connect to {}:{}: {}".format(self.host, self.port, e))
+            await asyncio.sleep(1)
+
+        # Small request messages should not wait for more data.
+        socket_.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket = socket_
+
+    async def request(self, message, encoding=None):
+        """
+        Sends a message and waits for the response of the remote.
+
+        Args:
+            message: The message dict (e.g. {"cmd": "reset"})
+            encoding (str): The encoding to use for unpacking the response.
+        Returns: The decoded (as dict) response.
+        """
+        await self.protocol.send(message, self.socket)
+        return await self.protocol.recv(self.socket, encoding)
+
+
+class AsyncUE4Environment(AsyncRemoteEnvironment, UE4Environment):
+    """
+    asyncio variant of the UE4Environment: `connect`, `seed`, `reset`, `set_state` and `execute` are coroutines.
+    """
+
+    def __init__(
+        self,
+        host="localhost",
+        port=6025,
+        discretize_actions=False,
+        delta_time=1/60,
+        num_ticks=4,
+        max_pool_frames=False
+    ):
+        """
+        Args:
+            host (str): The hostname to connect to.
+            port (int): The port to connect to.
+            discretize_actions (bool): Whether to treat axis-mappings defined in UE4 game as discrete actions.
+            delta_time (float): The fake delta time to use for each single game tick.
+            num_ticks (int): The number of ticks to be executed in a single act call (each tick will
+                repeat the same given actions).
+            max_pool_frames (bool): Whether the game returns the elementwise maximum of the observations of the
+                last two ticks instead of the last tick's observation (requires num_ticks > 1).
+        """
+        UE4Environment.__init__(
+            self,
+            host=host,
+            port=port,
+            connect=False,
+            discretize_actions=discretize_actions,
+            delta_time=delta_time,
+            num_ticks=num_ticks,
+            max_pool_frames=max_pool_frames
+        )
+        self.protocol = AsyncMsgPackNumpyProtocol()
+
+    def __str__(self):
+        return "AsyncUE4Environment({}:{}{})".format(self.host, self.port, "[connected; {}]".
+                                                     format(self.game_name) if self.socket else "")
+
+    async def connect(self, timeout=600):
+        await AsyncRemoteEnvironment.connect(self, timeout)
+
+        # Get action- and state-specs from our game.
+        response = await self.request({"cmd": "get_spec"}, "utf-8")
+        self.set_spec(response)
+
+    async def seed(self, seed=None):
+        if not seed:
+            seed = time.time()
+        await self.request({"cmd": "seed", "value": int(seed)}, "utf-8")
+        return seed
+
+    async def reset(self):
+        response = await self.request({"cmd": "reset"})
+        return self.extract_observation(response)
+
+    async def set_state(self, setters, **kwargs):
+        response = await self.request(self.build_set_message(setters, **kwargs))
+        return self.extract_observation(response)
+
+    async def execute(self, action):
+        response = await self.request(self.build_step_message(action))
+        return self.parse_step_response(response)
@@ -125,12 +125,57 @@ class MsgPackNumpyProtocol(object):
     def __init__(self, max_msg_len=8192):
         """
         Args:
-            max_msg_len (int): The maximum number of bytes to read from the socket.
+            max_msg_len (int): The initial size (in bytes) of the receive buffer, which grows on demand to fit
+                the largest message received.
         """
         self.max_msg_len = max_msg_len
+        # Preallocated receive buffer, messages are read into it via `recv_into` without intermediate copies.
+        self.buffer = bytearray(max_msg_len)
+        self.header = bytearray(8)
         # Make all msgpack methods use the numpy-aware de/encoders.
         mnp.patch()
 
+    def encode(self, message):
+        """
+        Encodes a message (dict) as 8-byte len header followed by the msgpack-numpy encoded dict.
+        """
+        if not isinstance(message, dict):
+            raise TensorForceError("Message to be sent must be a dict!")
+        message = msgpack.packb(message)
+        len_ = len(message)
+        # prepend 8-byte len field to all our messages
+        return bytes("{:08d}".format(len_), encoding="ascii") + message
+
+    def message_view(self, len_):
+        """
+        Returns a writable view of the first `len_` bytes of the receive buffer, which is enlarged if required.
+        """
+        if len_ > len(self.buffer):
+            self.buffer = bytearray(max(len_, 2 * len(self.buffer)))
+        return memoryview(self.buffer)[:len_]
+
+    def decode(self, view, encoding=None):
+        """
+        Decodes a received message body and checks its status.
+
+        Args:
+            view: Buffer containing the msgpack-numpy encoded message.
+            encoding (str): The encoding to use for unpacking the message.
+        Returns: The decoded (as dict) message.
+        """
+        if len(view) == 0:
+            raise TensorForceError("No message encoded in data stream (data stream had len=0)")
+        message = msgpack.unpackb(view, encoding=encoding)
+        sts = message.get("status", message.get(b"status"))
+        if sts:
+            if sts == "ok" or sts == b"ok":
+                return message
+            else:
+                raise TensorForceError("RemoteEnvironment server error: {}".
+                                       format(message.get("message", "not specified")))
+        else:
+            raise TensorForceError("Message without field 'status' received!")
+
     def send(self, message, socket_):
         """
         Sends a message (dict) to the socket. Message consists of a 8-byte len header followed by a msgpack-numpy
@@ -142,12 +187,7 @@ class MsgPackNumpyProtocol(object):
         """
         if not socket_:
             raise TensorForceError("No socket given in call to `send`!")
-        elif not isinstance(message, dict):
-            raise TensorForceError("Message to be sent must be a dict!")
-        message = msgpack.packb(message)
-        len_ = len(message)
-        # prepend 8-byte len field to all our messages
-        socket_.send(bytes("{:08d}".format(len_), encoding="ascii") + message)
+        socket_.sendall(self.encode(message))
 
     def recv(self, socket_, encoding=None):
         """
@@ -159,39 +199,22 @@ class MsgPackNumpyProtocol(object):
             encoding (str): The encoding to use for unpacking messages from the socket.
         Returns: The decoded (as dict) message received.
         """
-        unpacker = msgpack.Unpacker(encoding=encoding)
-
-        # Wait for an immediate response.
-        response = socket_.recv(8)  # get the length of the message
-        if response == b"":
-            raise TensorForceError("No data received by socket.recv in call to method `recv` " +
-                                   "(listener possibly closed)!")
-        orig_len = int(response)
+        # Wait for an immediate response, starting with the length of the message.
+        self.recv_into(socket_, memoryview(self.header))
+        view = self.message_view(int(self.header))
+        self.recv_into(socket_, view)
+        return self.decode(view, encoding)
+
+    @staticmethod
+    def recv_into(socket_, view):
+        """
+        Fills the given buffer view with data from the socket.
+        """
         received_len = 0
-        while True:
-            data = socket_.recv(min(orig_len - received_len, self.max_msg_len))
+        while received_len < len(view):
+            data_len = socket_.recv_into(view[received_len:])
             # There must be a response.
-            if not data:
-                raise TensorForceError("No data of len {} received by socket.recv in call to method `recv`!".
-                                       format(orig_len - received_len))
-            data_len = len(data)
+            if data_len == 0:
+                raise TensorForceError("No data of len {} received by socket.recv_into in call to method `recv` "
+                                       "(listener possibly closed)!".format(len(view) - received_len))
             received_len += data_len
-            unpacker.feed(data)
-
-            if received_len == orig_len:
-                break
-
-        # Get the data.
-        for message in unpacker:
-            sts = message.get("status", message.get(b"status"))
-            if sts:
-                if sts == "ok" or sts == b"ok":
-                    return message
-                else:
-                    raise TensorForceError("RemoteEnvironment server error: {}".
-                                           format(message.get("message", "not specified")))
-            else:
-                raise TensorForceError("Message without field 'status' received!")
-        raise TensorForceError("No message encoded in data stream (data stream had len={})".
-                               format(orig_len))
-
@@ -110,6 +110,13 @@ def sanity_check_execution_spec(execution_spec):
                 - task_index: integer (required).
                 - protocol: communication protocol (default: none, i.e. 'grpc').
             - session_config: dict with options for a TensorFlow ConfigProto object (default: None).
+            - act_fast_path: whether act calls use precompiled session callables, bypassing session hooks such as
+                saver and summary hooks on act calls (default: False, single execution only).
+            - buffering: "graph" (default) to buffer act records in num_parallel x batching_capacity variables,
+                "host" to stage them on the host, with memory tracking the actually outstanding steps.
+            - learner: "inline" (default) to update as part of observe, or dict(type="thread", replay_ratio=...) to
+                run updates in a background learner thread at the given ratio of retrieved to observed timesteps
+                (or episodes), by default batch_size / frequency (None: as fast as possible, single execution only).
 
     Returns: A cleaned-up (in-place) version of the given execution-spec.
     """
@@ -39,7 +39,8 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
         connect=True,
         discretize_actions=False,
         delta_time=1/60,
-        num_ticks=4
+        num_ticks=4,
+        max_pool_frames=False
     ):
         """
         Args:
@@ -52,7 +53,13 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
             delta_time (float): The fake delta time to use for each single game tick.
             num_ticks (int): The number of ticks to be executed in a single act call (each tick will
                 repeat the same given actions).
+            max_pool_frames (bool): Whether the game returns the elementwise maximum of the observations of the
+                last two ticks instead of the last tick's observation (requires num_ticks > 1). The rewards of all
+                ticks are summed by the game in either case.
         """
+        if max_pool_frames and num_ticks < 2:
+            raise TensorForceError("Max-pooling frames requires num_ticks > 1, got {}.".format(num_ticks))
+
         RemoteEnvironment.__init__(self, host, port)
 
         # RemoteEnvironment should send a name of the game upon connection.
@@ -64,6 +71,7 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
         self.discretized_actions = None
         self.delta_time = delta_time
         self.num_ticks = num_ticks
+        self.max_pool_frames = max_pool_frames
 
         # Our tcp messaging protocol to use (simple len-header + msgpack-numpy-body).
         self.protocol = MsgPackNumpyProtocol()
@@ -81,7 +89,12 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
         # Get action- and state-specs from our game.
         self.protocol.send({"cmd": "get_spec"}, self.socket)
         response = self.protocol.recv(self.socket, "utf-8")
+        self.set_spec(response)
 
+    def set_spec(self, response):
+        """
+        Sets the action- and observation-space descriptions from the game's response to the `get_spec` command.
+        """
         # Game's name
         self.game_name = response.get("game_name")  # keep non-mandatory for now
         # Observers
@@ -128,6 +141,15 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
         return self.extract_observation(response)
 
     def set_state(self, setters, **kwargs):
+        self.protocol.send(self.build_set_message(setters, **kwargs), self.socket)
+        # Wait for response.
+        response = self.protocol.recv(self.socket)
+        return self.extract_observation(response)
+
+    def build_set_message(self, setters, **kwargs):
+        """
+        Builds the `set` command message for the given setters.
+        """
         if "cmd" in kwargs:
             raise TensorForceError("Key 'cmd' must not be present in **kwargs to method `set`!")
 
@@ -146,11 +168,7 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
             if len(set_cmd) == 3 and not isinstance(set_cmd[2], bool):
                 raise TensorForceError("ERROR: 3rd item in setter-command must be of type bool ('is_relative' flag)!")
         message["setters"] = setters
-
-        self.protocol.send(message, self.socket)
-        # Wait for response.
-        response = self.protocol.recv(self.socket)
-        return self.extract_observation(response)
+        return message
 
     def execute(self, action):
         """
@@ -161,6 +179,15 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
         which are continuous actions
         like MoveForward with values between -1.0 (run backwards) and 1.0 (run forwards), 0.0 would mean: stop.
         """
+        self.protocol.send(self.build_step_message(action), self.socket)
+        # Wait for response (blocks).
+        response = self.protocol.recv(self.socket)
+        return self.parse_step_response(response)
+
+    def build_step_message(self, action):
+        """
+        Translates an action into the `step` command message for the UE4 game.
+        """
         action_mappings, axis_mappings = [], []
 
         # TODO: what if more than one actions are passed?
@@ -197,9 +224,15 @@ class UE4Environment(RemoteEnvironment, StateSettableEnvironment):
             actions=action_mappings,
             axes=axis_mappings
         )
-        self.protocol.send(message, self.socket)
-        # Wait for response (blocks).
-        response = self.protocol.recv(self.socket)
+        # Only sent if requested, so games not supporting max-pooling keep working.
+        if self.max_pool_frames:
+            message["max_pool_frames"] = True
+        return message
+
+    def parse_step_response(self, response):
+        """
+        Extracts observation, terminal flag and reward from the game's response to the `step` command.
+        """
         r = response.pop(b"_reward", 0.0)
         is_terminal = response.pop(b"_is_terminal", False)
 
@@ -17,13 +17,21 @@ from tensorforce.core.memories.memory import Memory
 from tensorforce.core.memories.queue import Queue
 from tensorforce.core.memories.latest import Latest
 from tensorforce.core.memories.replay import Replay
+from tensorforce.core.memories.stacked_frame_replay import StackedFrameReplay
+from tensorforce.core.memories.memmap_replay import MemmapReplay
+from tensorforce.core.memories.remote_replay import ReplayServer, RemoteReplay
 from tensorforce.core.memories.prioritized_replay import PrioritizedReplay
+from tensorforce.core.memories.sum_tree_prioritized_replay import SumTreePrioritizedReplay
 
 
 memories = dict(
     latest=Latest,
     replay=Replay,
-    prioritized_replay=PrioritizedReplay
+    stacked_frame_replay=StackedFrameReplay,
+    memmap_replay=MemmapReplay,
+    remote_replay=RemoteReplay,
+    prioritized_replay=PrioritizedReplay,
+    sum_tree_prioritized_replay=SumTreePrioritizedReplay
 )
 
 
@@ -33,5 +41,10 @@ __all__ = [
     'Queue',
     'Latest',
     'Replay',
-    'PrioritizedReplay'
+    'StackedFrameReplay',
+    'MemmapReplay',
+    'ReplayServer',
+    'RemoteReplay',
+    'PrioritizedReplay',
+    'SumTreePrioritizedReplay'
 ]
@@ -0,0 +1,328 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from collections import deque
+import os
+import threading
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import util
+from tensorforce import TensorForceError
+from tensorforce.core.memories import Memory
+
+
+class MemmapReplay(Memory):
+    """
+    Host-side replay memory which keeps its records in memory-mapped .npy files (one per column) instead of
+    TensorFlow variables, so the capacity is limited by disk instead of RAM, and the memory content persists
+    across restarts: an existing memory directory with matching columns is reopened. Store and retrieval are
+    NumPy functions embedded into the graph via `tf.py_func`, with the same semantics as the replay memory,
+    and are guarded by a lock, so stores and retrievals of different session calls do not interleave.
+    """
+
+    def __init__(
+        self,
+        states,
+        internals,
+        actions,
+        include_next_states,
+        capacity,
+        directory,
+        scope='memmap-replay',
+        summary_labels=None
+    ):
+        """
+        Memory-mapped replay memory.
+
+        Args:
+            states (dict): States specification.
+            internals (dict): Internal states specification.
+            actions (dict): Actions specification.
+            include_next_states (bool): Include subsequent state if true.
+            capacity (int): Memory capacity (number of state/internals/action/(next-state)? records).
+            directory (str): Directory of the memory-mapped column files (created if not existing).
+        """
+        self.capacity = capacity
+        self.directory = directory
+
+        super(MemmapReplay, self).__init__(
+            states=states,
+            internals=internals,
+            actions=actions,
+            include_next_states=include_next_states,
+            scope=scope,
+            summary_labels=summary_labels
+        )
+
+        self.columns_spec = self.setup_columns_spec()
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.columns = dict()
+        for column, _, _, shape, dtype in self.columns_spec:
+            self.columns[column] = self.open_column(column=column, shape=((capacity,) + shape), dtype=dtype)
+        # Memory index (next record to be overwritten) and number of stored records.
+        self.index = self.open_column(column='index', shape=(2,), dtype=np.int64)
+
+        # Indices of terminal records, from oldest to most recent.
+        self.terminal_indices = deque(self.stored_indices()[self.columns['terminal'][self.stored_indices()]])
+
+        # Store and retrieval functions may be called concurrently, for instance by a background learner thread.
+        self.lock = threading.Lock()
+
+    def setup_columns_spec(self):
+        """
+        Returns the memory columns as list of (column name, kind, component name, shape, dtype) tuples.
+        """
+        columns_spec = list()
+        for kind, spec in (('states', self.states_spec), ('internals', self.internals_spec),
+                           ('actions', self.actions_spec)):
+            for name in sorted(spec):
+                columns_spec.append((
+                    '{}-{}'.format(kind[:-1], name), kind, name, tuple(spec[name]['shape']),
+                    util.np_dtype(spec[name]['type'])
+                ))
+        columns_spec.append(('terminal', 'terminal', None, (), util.np_dtype('bool')))
+        columns_spec.append(('reward', 'reward', None, (), util.np_dtype('float')))
+        return columns_spec
+
+    def open_column(self, column, shape, dtype):
+        """
+        Opens the memory-mapped file of a column, or creates it if not existing.
+        """
+        path = os.path.join(self.directory, column + '.npy')
+        if not os.path.isfile(path):
+            return np.lib.format.open_memmap(filename=path, mode='w+', dtype=dtype, shape=shape)
+        array = np.lib.format.open_memmap(filename=path, mode='r+')
+        if array.shape != shape or array.dtype != dtype:
+            raise TensorForceError("Memory column {} has shape {} and type {}, expected {} and {}.".format(
+                path, array.shape, array.dtype, shape, np.dtype(dtype)
+            ))
+        return array
+
+    @property
+    def memory_index(self):
+        return int(self.index[0])
+
+    @property
+    def num_stored(self):
+        return int(self.index[1])
+
+    def stored_indices(self, start=0, end=None):
+        """
+        Returns the indices of stored records in [start, end), counted from the oldest record.
+        """
+        if end is None:
+            end = self.num_stored
+        oldest_index = (self.memory_index - self.num_stored) % self.capacity
+        return (oldest_index + np.arange(start, end)) % self.capacity
+
+    def flush(self):
+        """
+        Writes the memory content to disk.
+        """
+        with self.lock:
+            for column in sorted(self.columns):
+                self.columns[column].flush()
+            self.index.flush()
+
+    def np_store(self, *values):
+        with self.lock:
+            num_instances = values[-1].shape[0]
+            if num_instances > self.capacity:
+                raise TensorForceError("Number of stored instances ({}) exceeds capacity ({}).".format(
+                    num_instances, self.capacity
+                ))
+
+            # Remove terminal indices of overwritten records.
+            num_overwritten = max(self.num_stored + num_instances - self.capacity, 0)
+            if num_overwritten > 0:
+                overwritten = self.stored_indices(end=num_overwritten)
+                for _ in range(np.count_nonzero(self.columns['terminal'][overwritten])):
+                    self.terminal_indices.popleft()
+
+            # Write records in at most two contiguous slices.
+            start = self.memory_index
+            first = min(num_instances, self.capacity - start)
+            for (column, _, _, _, _), value in zip(self.columns_spec, values):
+                self.columns[column][start: start + first] = value[:first]
+                self.columns[column][:num_instances - first] = value[first:]
+
+            indices = (start + np.arange(num_instances)) % self.capacity
+            self.terminal_indices.extend(indices[values[-2]])
+
+            # Update index last, so an interrupted store leaves a consistent memory.
+            self.index[1] = min(self.num_stored + num_instances, self.capacity)
+            self.index[0] = (start + num_instances) % self.capacity
+            return np.int32(num_instances)
+
+    def np_sample_timesteps(self, n):
+        with self.lock:
+            num_stored = self.num_stored
+            if num_stored == 0:
+                return np.zeros(shape=(0,), dtype=np.int32)
+            oldest_index = (self.memory_index - num_stored) % self.capacity
+
+            if self.include_next_states:
+                # Ensure consistent next state semantics: sample exactly n records among the non-terminal ones,
+                # except the most recent record whose next state is not stored yet.
+                num_timesteps = num_stored - 1
+                terminal_offsets = (np.asarray(self.terminal_indices, dtype=np.int64) - oldest_index) % self.capacity
+                terminal_offsets = terminal_offsets[terminal_offsets < num_timesteps]
+                num_valid = num_timesteps - len(terminal_offsets)
+
+                if num_valid > 0:
+                    # Offset of the k-th non-terminal record: k plus the number of terminal records before it, where
+                    # the i-th terminal record (in order) is preceded by terminal_offsets[i] - i non-terminal ones.
+                    ranks = np.random.randint(num_valid, size=n)
+                    preceding = terminal_offsets - np.arange(len(terminal_offsets))
+                    offsets = ranks + np.searchsorted(preceding, ranks, side='right')
+                    return ((oldest_index + offsets) % self.capacity).astype(np.int32)
+
+            # Fall back to any records if there is no valid one yet.
+            offsets = np.random.randint(num_stored, size=n)
+            return ((oldest_index + offsets) % self.capacity).astype(np.int32)
+
+    def np_sample_episodes(self, n):
+        with self.lock:
+            num_episodes = len(self.terminal_indices)
+            if num_episodes == 0:
+                raise TensorForceError("Memory contains no complete episode.")
+            oldest_index = (self.memory_index - self.num_stored) % self.capacity
+
+            episodes = list()
+            for k in np.random.randint(num_episodes, size=n):
+                if k == 0:
+                    start = oldest_index
+                else:
+                    start = (self.terminal_indices[k - 1] + 1) % self.capacity
+                length = (self.terminal_indices[k] - start) % self.capacity + 1
+                episodes.append((start + np.arange(length)) % self.capacity)
+
+            return np.concatenate(episodes).astype(np.int32)
+
+    def np_sample_sequences(self, n, sequence_length):
+        with self.lock:
+            num_stored = self.num_stored
+            oldest_index = (self.memory_index - num_stored) % self.capacity
+            # Most recent record has no next state yet.
+            num_timesteps = num_stored - int(self.include_next_states)
+
+            # Episode segments [starts, ends] of stored offsets, where sequences may end with a terminal record but
+            # not contain one before.
+            terminal_offsets = (np.asarray(self.terminal_indices, dtype=np.int64) - oldest_index) % self.capacity
+            terminal_offsets = terminal_offsets[terminal_offsets < num_timesteps]
+            starts = np.concatenate(([0], terminal_offsets + 1))
+            ends = np.concatenate((terminal_offsets, [num_timesteps - 1]))
+            num_sequences = np.maximum(ends - starts - sequence_length + 2, 0)
+            cumulative = np.cumsum(num_sequences)
+            if num_stored == 0 or cumulative[-1] == 0:
+                raise TensorForceError("Memory contains no sequence of length {} within one episode.".format(
+                    sequence_length
+                ))
+
+            # Map uniform ranks among all valid sequences to their episode segment and start offset.
+            ranks = np.random.randint(cumulative[-1], size=n)
+            segments = np.searchsorted(cumulative, ranks, side='right')
+            offsets = starts[segments] + ranks - (cumulative[segments] - num_sequences[segments])
+            sequences = (oldest_index + offsets[:, None] + np.arange(sequence_length)) % self.capacity
+
+            return sequences.reshape(-1).astype(np.int32)
+
+    def np_retrieve_indices(self, indices):
+        with self.lock:
+            values = [self.columns[column_spec[0]][indices] for column_spec in self.columns_spec]
+            if self.include_next_states:
+                next_indices = (indices + 1) % self.capacity
+                values.extend(
+                    self.columns[column][next_indices]
+                    for column, kind, _, _, _ in self.columns_spec if kind in ('states', 'internals')
+                )
+            return values
+
+    def tf_initialize(self):
+        pass
+
+    def tf_store(self, states, internals, actions, terminal, reward):
+        values = [
+            {'states': states, 'internals': internals, 'actions': actions}[kind][name]
+            for _, kind, name, _, _ in self.columns_spec[:-2]
+        ]
+        values.extend((terminal, reward))
+        stored = tf.py_func(func=self.np_store, inp=values, Tout=util.tf_dtype('int'), stateful=True)
+
+        with tf.control_dependencies(control_inputs=(stored,)):
+            return tf.no_op()
+
+    def tf_retrieve_indices(self, indices):
+        """
+        Fetches experiences for given indices.
+
+        Args:
+            indices: Index tensor
+
+        Returns: Batch of experiences
+        """
+        column_specs = list(self.columns_spec)
+        if self.include_next_states:
+            column_specs.extend(
+                (column, 'next_' + kind, name, shape, dtype)
+                for column, kind, name, shape, dtype in self.columns_spec if kind in ('states', 'internals')
+            )
+
+        values = tf.py_func(
+            func=self.np_retrieve_indices,
+            inp=(indices,),
+            Tout=[util.tf_dtype(dtype) for _, _, _, _, dtype in column_specs],
+            stateful=True
+        )
+
+        batch = dict(states=dict(), internals=dict(), actions=dict())
+        if self.include_next_states:
+            batch['next_states'] = dict()
+            batch['next_internals'] = dict()
+        for (_, kind, name, shape, _), value in zip(column_specs, values):
+            value.set_shape((None,) + shape)
+            if name is None:
+                batch[kind] = value
+            else:
+                batch[kind][name] = value
+        return batch
+
+    def tf_retrieve_timesteps(self, n):
+        indices = tf.py_func(func=self.np_sample_timesteps, inp=(n,), Tout=util.tf_dtype('int'), stateful=True)
+        indices.set_shape((None,))
+        return self.tf_retrieve_indices(indices=indices)
+
+    def tf_retrieve_episodes(self, n):
+        indices = tf.py_func(func=self.np_sample_episodes, inp=(n,), Tout=util.tf_dtype('int'), stateful=True)
+        indices.set_shape((None,))
+        return self.tf_retrieve_indices(indices=indices)
+
+    def tf_retrieve_sequences(self, n, sequence_length):
+        indices = tf.py_func(
+            func=self.np_sample_sequences,
+            inp=(n, sequence_length),
+            Tout=util.tf_dtype('int'),
+            stateful=True
+        )
+        indices.set_shape((None,))
+        return self.tf_retrieve_indices(indices=indices)
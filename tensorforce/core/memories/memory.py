@@ -54,6 +54,7 @@ class Memory(object):
         self.retrieve_episodes = None
         self.retrieve_sequences = None
         self.update_batch = None
+        self.weight_losses = None
 
         self.setup_template_funcs()
 
@@ -100,6 +101,11 @@ class Memory(object):
             func_=self.tf_update_batch,
             custom_getter_=custom_getter
         )
+        self.weight_losses = tf.make_template(
+            name_=(self.scope + '/weight_losses'),
+            func_=self.tf_weight_losses,
+            custom_getter_=custom_getter
+        )
 
         return custom_getter
 
@@ -169,6 +175,19 @@ class Memory(object):
         """
         return tf.no_op()
 
+    def tf_weight_losses(self, loss_per_instance):
+        """
+        Weights the losses of the latest batch instances, for instance to correct for a non-uniform
+        sampling distribution.
+
+        Args:
+            loss_per_instance: Loss per instance tensor.
+
+        Returns:
+            Weighted loss per instance tensor.
+        """
+        return loss_per_instance
+
     def get_variables(self):
         """
         Returns the TensorFlow variables used by the memory.
@@ -178,6 +197,22 @@ class Memory(object):
         """
         return [self.variables[key] for key in sorted(self.variables)]
 
+    def get_unsaved_variables(self):
+        """
+        Returns the TensorFlow variables of the memory which are not saved in model checkpoints, since they are
+        rebuilt from the saved variables via `rebuild_unsaved_variables` (so checkpoints stay compatible).
+
+        Returns:
+            List of variables.
+        """
+        return list()
+
+    def rebuild_unsaved_variables(self):
+        """
+        Returns the op which rebuilds the unsaved variables from the other memory variables after a restore.
+        """
+        return tf.no_op()
+
     @staticmethod
     def from_spec(spec, kwargs=None):
         """
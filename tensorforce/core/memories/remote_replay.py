@@ -0,0 +1,391 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import os
+from multiprocessing import Process
+from multiprocessing.connection import Client, Listener
+import tempfile
+import threading
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from tensorforce import util
+from tensorforce import TensorForceError
+from tensorforce.core.memories import Memory, MemmapReplay
+
+
+class ReplayServer(Process):
+    """
+    Replay memory process shared by multiple agents: actor processes append experiences and learner processes
+    sample batches via `RemoteReplay` memories connected to the server, so acting and learning run on separate
+    cores. The server keeps the experiences in a `MemmapReplay` memory and serves each connection from its own
+    thread. Timesteps are optionally sampled according to priorities, updated from the losses of the learners,
+    which are kept in a sum tree so sampling and priority updates are logarithmic in the capacity.
+    """
+
+    def __init__(
+        self,
+        states,
+        internals,
+        actions,
+        include_next_states,
+        capacity,
+        directory=None,
+        address=('localhost', 6026),
+        authkey=None,
+        prioritized=False,
+        prioritization_weight=1.0
+    ):
+        """
+        Replay server.
+
+        Args:
+            states (dict): States specification.
+            internals (dict): Internal states specification.
+            actions (dict): Actions specification.
+            include_next_states (bool): Include subsequent state if true.
+            capacity (int): Memory capacity (number of state/internals/action/(next-state)? records).
+            directory (str): Directory of the memory-mapped column files (default: new temporary directory).
+            address (tuple): Host and port the server listens on.
+            authkey (bytes): Authentication key required from connecting memories (default: random key, available
+                as `authkey` attribute to pass on to the memories).
+            prioritized (bool): Whether timesteps are sampled according to priorities.
+            prioritization_weight (float): Prioritization weight, priorities are computed as
+                `loss ** prioritization_weight`.
+        """
+        super(ReplayServer, self).__init__()
+        self.daemon = True
+
+        self.states_spec = states
+        self.internals_spec = internals
+        self.actions_spec = actions
+        self.include_next_states = include_next_states
+        self.capacity = capacity
+        self.directory = directory
+        self.address = tuple(address)
+        # Connections exchange pickles, so they always have to be authenticated.
+        self.authkey = os.urandom(32) if authkey is None else authkey
+        self.prioritized = prioritized
+        self.prioritization_weight = prioritization_weight
+
+        # Smallest power of two greater or equal to the capacity, the leaves of the sum tree.
+        self.tree_capacity = 1
+        while self.tree_capacity < capacity:
+            self.tree_capacity *= 2
+        self.tree_depth = self.tree_capacity.bit_length() - 1
+
+        # Set in the server process.
+        self.memory = None
+        self.sum_tree = None  # Node n has children 2n and 2n+1, leaves start at tree_capacity.
+        self.max_priority = 1.0
+        # Latest record still waiting for its successor, or None.
+        self.pending_index = None
+        # Total number of stored records, and for each index the total when it was last written.
+        self.num_stores = 0
+        self.store_serials = None
+        # Guards the sum tree and store counters, the memory is guarded by its own lock.
+        self.lock = None
+        # Serializes stores, so the indices written by a store are known.
+        self.store_lock = None
+
+    def close(self):
+        """
+        Stops the server process.
+        """
+        self.terminate()
+        self.join()
+
+    def run(self):
+        self.initialize_memory()
+
+        listener = Listener(address=self.address, authkey=self.authkey)
+        while True:
+            connection = listener.accept()
+            thread = threading.Thread(target=self.serve, args=(connection,))
+            thread.daemon = True
+            thread.start()
+
+    def initialize_memory(self):
+        """
+        Creates the memory of the server, called in the server process.
+        """
+        self.memory = MemmapReplay(
+            states=self.states_spec,
+            internals=self.internals_spec,
+            actions=self.actions_spec,
+            include_next_states=self.include_next_states,
+            capacity=self.capacity,
+            directory=(self.directory or tempfile.mkdtemp()),
+            scope='replay-server'
+        )
+        if self.prioritized:
+            self.sum_tree = np.zeros(shape=(2 * self.tree_capacity,), dtype=np.float64)
+            self.store_serials = np.zeros(shape=(self.capacity,), dtype=np.int64)
+        self.lock = threading.Lock()
+        self.store_lock = threading.Lock()
+
+    def update_tree(self, indices, priorities):
+        """
+        Sets the priorities of the given memory indices and updates their paths to the root of the sum tree,
+        one tree level at a time (requires the lock).
+
+        Args:
+            indices: Memory indices, for duplicates the last priority is set.
+            priorities: Priorities, zero priorities exclude records from sampling.
+        """
+        nodes = np.asarray(indices, dtype=np.int64) + self.tree_capacity
+        self.sum_tree[nodes] = priorities
+        for _ in range(self.tree_depth):
+            nodes = np.unique(nodes // 2)
+            self.sum_tree[nodes] = self.sum_tree[2 * nodes] + self.sum_tree[2 * nodes + 1]
+
+    def sample_tree(self, n):
+        """
+        Samples n memory indices proportionally to their priorities, one per equally sized segment of the
+        total priority mass (requires the lock and a positive total priority).
+        """
+        masses = (np.arange(n) + np.random.uniform(size=n)) * self.sum_tree[1] / n
+
+        # Descend from the root, moving right if the mass exceeds the left subtree (and the right one is non-empty).
+        nodes = np.ones(shape=(n,), dtype=np.int64)
+        for _ in range(self.tree_depth):
+            left = 2 * nodes
+            left_sum = self.sum_tree[left]
+            go_right = np.logical_and(masses >= left_sum, self.sum_tree[left + 1] > 0.0)
+            masses = np.where(go_right, masses - left_sum, masses)
+            nodes = np.where(go_right, left + 1, left)
+        return nodes - self.tree_capacity
+
+    def serve(self, connection):
+        """
+        Answers the requests of one connected memory until it disconnects.
+        """
+        while True:
+            try:
+                command, args = connection.recv()
+            except EOFError:
+                connection.close()
+                return
+
+            try:
+                result = getattr(self, 'request_' + command)(*args)
+                connection.send(('ok', result))
+            except Exception as e:
+                logging.exception("Replay server request {} failed.".format(command))
+                connection.send(('error', str(e)))
+
+    def request_store(self, values):
+        with self.store_lock:
+            start = self.memory.memory_index
+            num_instances = self.memory.np_store(*values)
+            if not self.prioritized:
+                return num_instances
+
+            indices = (start + np.arange(num_instances)) % self.capacity
+            terminal = np.asarray(values[-2], dtype=np.bool_)
+            with self.lock:
+                # New experiences are sampled with maximum priority until their loss is known.
+                priorities = np.full(shape=(num_instances,), fill_value=self.max_priority)
+                update_indices = indices
+                if self.include_next_states:
+                    # Terminal records are never sampled, the latest record only once its successor is stored.
+                    priorities[terminal] = 0.0
+                    priorities[-1] = 0.0
+                    if self.pending_index is not None:
+                        update_indices = np.concatenate(([self.pending_index], indices))
+                        priorities = np.concatenate(([self.max_priority], priorities))
+                    self.pending_index = None if terminal[-1] else int(indices[-1])
+                self.update_tree(indices=update_indices, priorities=priorities)
+
+                self.num_stores += int(num_instances)
+                self.store_serials[indices] = self.num_stores
+        return num_instances
+
+    def request_sample_timesteps(self, n):
+        """
+        Returns the sampled indices, and the number of stored records at sampling time, which identifies the
+        indices overwritten since then when updating their priorities.
+        """
+        if not self.prioritized:
+            return self.memory.np_sample_timesteps(n=n), self.num_stores
+
+        with self.lock:
+            if self.sum_tree[1] <= 0.0:
+                return np.zeros(shape=(0,), dtype=np.int32), self.num_stores
+            return self.sample_tree(n=n).astype(np.int32), self.num_stores
+
+    def request_sample_episodes(self, n):
+        return self.memory.np_sample_episodes(n=n)
+
+    def request_sample_sequences(self, n, sequence_length):
+        return self.memory.np_sample_sequences(n=n, sequence_length=sequence_length)
+
+    def request_retrieve_indices(self, indices):
+        return self.memory.np_retrieve_indices(indices=indices)
+
+    def request_update_priorities(self, indices, loss_per_instance, num_stores):
+        if not self.prioritized or indices is None:
+            return
+
+        priorities = (np.abs(np.asarray(loss_per_instance)) + util.epsilon) ** self.prioritization_weight
+        with self.lock:
+            # Skip indices overwritten by new experiences since they were sampled.
+            valid = self.store_serials[indices] <= num_stores
+            indices = np.asarray(indices)[valid]
+            if len(indices) > 0:
+                self.update_tree(indices=indices, priorities=priorities[valid])
+                self.max_priority = max(self.max_priority, float(priorities[valid].max()))
+
+
+class RemoteReplay(MemmapReplay):
+    """
+    Replay memory which stores experiences to and retrieves batches from a `ReplayServer`, with the same
+    semantics as the memory-mapped replay memory of the server. Multiple agents in different processes can
+    share one server, for instance acting agents which only store experiences and a learning agent which only
+    retrieves batches (and updates priorities, if the server samples according to priorities).
+    """
+
+    def __init__(
+        self,
+        states,
+        internals,
+        actions,
+        include_next_states,
+        address=('localhost', 6026),
+        authkey=None,
+        timeout=60,
+        scope='remote-replay',
+        summary_labels=None
+    ):
+        """
+        Remote replay memory.
+
+        Args:
+            states (dict): States specification.
+            internals (dict): Internal states specification.
+            actions (dict): Actions specification.
+            include_next_states (bool): Include subsequent state if true, has to match the server.
+            address (tuple): Host and port of the replay server.
+            authkey (bytes): Authentication key of the replay server (required).
+            timeout (int): The time (in seconds) for which we will attempt to connect to the server.
+        """
+        if authkey is None:
+            raise TensorForceError("Remote replay requires the authentication key of the replay server.")
+
+        self.address = tuple(address)
+        self.authkey = authkey
+        self.timeout = timeout
+        # Connected on first use, since the memory may be created before the server is running.
+        self.connection = None
+        self.lock = threading.Lock()
+        # Memory indices of the last retrieved batch and number of stored records of the server at sampling
+        # time, for priority updates (guarded by the batch lock, since retrievals and priority updates may run
+        # concurrently, for instance in a background learner thread).
+        self.batch_indices = None
+        self.batch_num_stores = None
+        self.batch_lock = threading.Lock()
+
+        Memory.__init__(
+            self,
+            states=states,
+            internals=internals,
+            actions=actions,
+            include_next_states=include_next_states,
+            scope=scope,
+            summary_labels=summary_labels
+        )
+
+        self.columns_spec = self.setup_columns_spec()
+
+    def connect(self):
+        start_time = time.time()
+        while True:
+            try:
+                self.connection = Client(address=self.address, authkey=self.authkey)
+                return
+            except (IOError, OSError) as e:
+                if time.time() - start_time >= self.timeout:
+                    raise TensorForceError("Error when trying to connect to replay server {}:{}: {}".format(
+                        self.address[0], self.address[1], e
+                    ))
+                time.sleep(1)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def request(self, command, *args):
+        """
+        Sends a request to the replay server and waits for the result.
+        """
+        with self.lock:
+            if self.connection is None:
+                self.connect()
+            self.connection.send((command, args))
+            status, result = self.connection.recv()
+        if status != 'ok':
+            raise TensorForceError("Replay server error: {}".format(result))
+        return result
+
+    def np_store(self, *values):
+        return np.int32(self.request('store', values))
+
+    def np_sample_timesteps(self, n):
+        indices, num_stores = self.request('sample_timesteps', int(n))
+        with self.batch_lock:
+            self.batch_indices = indices
+            self.batch_num_stores = num_stores
+        return indices
+
+    def np_sample_episodes(self, n):
+        with self.batch_lock:
+            self.batch_indices = None
+        return self.request('sample_episodes', int(n))
+
+    def np_sample_sequences(self, n, sequence_length):
+        with self.batch_lock:
+            self.batch_indices = None
+        return self.request('sample_sequences', int(n), int(sequence_length))
+
+    def np_retrieve_indices(self, indices):
+        return self.request('retrieve_indices', indices)
+
+    def np_update_batch(self, loss_per_instance):
+        # Priorities of a batch are updated at most once, and only with losses of a batch of matching size.
+        with self.batch_lock:
+            indices, self.batch_indices = self.batch_indices, None
+            num_stores = self.batch_num_stores
+        if indices is not None and len(indices) == len(loss_per_instance):
+            self.request('update_priorities', indices, loss_per_instance, num_stores)
+        return np.int32(0)
+
+    def tf_update_batch(self, loss_per_instance):
+        updated = tf.py_func(
+            func=self.np_update_batch,
+            inp=(loss_per_instance,),
+            Tout=util.tf_dtype('int'),
+            stateful=True
+        )
+
+        with tf.control_dependencies(control_inputs=(updated,)):
+            return tf.no_op()
@@ -19,6 +19,7 @@ from __future__ import division
 
 import tensorflow as tf
 
+from tensorforce import util
 from tensorforce.core.memories import Queue
 
 
@@ -38,6 +39,11 @@ class Replay(Queue):
             include_next_states (bool): Include subsequent state if true.
             capacity (int): Memory capacity (number of state/internals/action/(next-state)? records).
         """
+        self.num_stored = None  # 0D (int) tensor: How many records do we have stored?
+        self.valid_indices = None  # 1D (int) tensor: Ring of memory indices of non-terminal records.
+        self.valid_start = None  # 0D (int) tensor: Ring position of the oldest valid index.
+        self.valid_count = None  # 0D (int) tensor: How many valid indices do we have stored?
+
         super(Replay, self).__init__(
             states=states,
             internals=internals,
@@ -48,52 +54,178 @@ class Replay(Queue):
             summary_labels=summary_labels
         )
 
+    def tf_initialize(self):
+        super(Replay, self).tf_initialize()
+
+        # Number of stored records
+        self.num_stored = tf.get_variable(
+            name='num-stored',
+            dtype=util.tf_dtype('int'),
+            initializer=0,
+            trainable=False
+        )
+
+        if self.include_next_states:
+            # Ring of memory indices of non-terminal records, in the order they were stored.
+            self.valid_indices = tf.get_variable(
+                name='valid-indices',
+                shape=(self.capacity,),
+                dtype=util.tf_dtype('int'),
+                initializer=tf.zeros_initializer(dtype=util.tf_dtype('int')),
+                trainable=False
+            )
+
+            # Ring position of the oldest valid index
+            self.valid_start = tf.get_variable(
+                name='valid-start',
+                dtype=util.tf_dtype('int'),
+                initializer=0,
+                trainable=False
+            )
+
+            # Number of valid indices
+            self.valid_count = tf.get_variable(
+                name='valid-count',
+                dtype=util.tf_dtype('int'),
+                initializer=0,
+                trainable=False
+            )
+
+    def get_unsaved_variables(self):
+        if not self.include_next_states:
+            return [self.num_stored]
+        return [self.num_stored, self.valid_indices, self.valid_start, self.valid_count]
+
+    def rebuild_unsaved_variables(self):
+        # The memory has wrapped around if its oldest terminal record is not before the memory index. Records
+        # after the memory index without a subsequent terminal there only belong to the oldest, already
+        # truncated episode, and are not recovered.
+        wrapped = tf.logical_and(x=(self.episode_count > 0), y=(self.episode_indices[0] >= self.memory_index))
+        num_stored = self.memory_index + tf.to_int32(x=wrapped) * (self.capacity - self.memory_index)
+        assignment = tf.assign(ref=self.num_stored, value=num_stored)
+
+        if not self.include_next_states:
+            with tf.control_dependencies(control_inputs=(assignment,)):
+                return tf.no_op()
+
+        # Non-terminal records among all stored ones, from the oldest to the most recent, as kept by tf_store.
+        indices = (self.memory_index - num_stored + tf.range(num_stored)) % self.capacity
+        valid = tf.boolean_mask(
+            tensor=indices,
+            mask=tf.logical_not(x=tf.gather(params=self.terminal_memory, indices=indices))
+        )
+        num_valid = tf.shape(input=valid)[0]
+
+        assignments = (
+            assignment,
+            tf.scatter_update(ref=self.valid_indices, indices=tf.range(num_valid), updates=valid),
+            tf.assign(ref=self.valid_start, value=0),
+            tf.assign(ref=self.valid_count, value=num_valid)
+        )
+        with tf.control_dependencies(control_inputs=assignments):
+            return tf.no_op()
+
+    def tf_store(self, states, internals, actions, terminal, reward):
+        if self.include_next_states:
+            stored = self.store_valid_indices(
+                states=states,
+                internals=internals,
+                actions=actions,
+                terminal=terminal,
+                reward=reward
+            )
+        else:
+            stored = super(Replay, self).tf_store(
+                states=states,
+                internals=internals,
+                actions=actions,
+                terminal=terminal,
+                reward=reward
+            )
+
+        with tf.control_dependencies(control_inputs=(stored,)):
+            num_instances = tf.shape(input=terminal)[0]
+            assignment = tf.assign(
+                ref=self.num_stored,
+                value=tf.minimum(x=(self.num_stored + num_instances), y=self.capacity)
+            )
+
+        with tf.control_dependencies(control_inputs=(assignment,)):
+            return tf.no_op()
+
+    def store_valid_indices(self, states, internals, actions, terminal, reward):
+        """
+        Stores the records like `Queue.tf_store` and keeps the ring of valid indices up to date.
+        """
+        num_instances = tf.shape(input=terminal)[0]
+        indices = tf.range(self.memory_index, self.memory_index + num_instances) % self.capacity
+
+        # Remove valid indices of overwritten records, which are the oldest ones in the ring.
+        num_oldest = tf.minimum(x=num_instances, y=self.valid_count)
+        oldest = tf.gather(
+            params=self.valid_indices,
+            indices=((self.valid_start + tf.range(num_oldest)) % self.capacity)
+        )
+        num_removed = tf.count_nonzero(
+            input_tensor=((oldest - self.memory_index) % self.capacity < num_instances),
+            dtype=util.tf_dtype('int')
+        )
+        assignment = tf.assign(ref=self.valid_start, value=((self.valid_start + num_removed) % self.capacity))
+        with tf.control_dependencies(control_inputs=(assignment,)):
+            assignment = tf.assign_sub(ref=self.valid_count, value=num_removed)
+
+        # Add valid indices of new non-terminal records.
+        with tf.control_dependencies(control_inputs=(assignment,)):
+            valid = tf.boolean_mask(tensor=indices, mask=tf.logical_not(x=terminal))
+            num_valid = tf.shape(input=valid)[0]
+            assignment = tf.scatter_update(
+                ref=self.valid_indices,
+                indices=((self.valid_start + self.valid_count + tf.range(num_valid)) % self.capacity),
+                updates=valid
+            )
+        with tf.control_dependencies(control_inputs=(assignment,)):
+            assignment = tf.assign_add(ref=self.valid_count, value=num_valid)
+
+        with tf.control_dependencies(control_inputs=(assignment,)):
+            return super(Replay, self).tf_store(
+                states=states,
+                internals=internals,
+                actions=actions,
+                terminal=terminal,
+                reward=reward
+            )
+
     def tf_retrieve_timesteps(self, n):
         num_timesteps = (self.memory_index - self.episode_indices[-1] - 2) % self.capacity + 1
         indices = tf.random_uniform(shape=(n,), maxval=num_timesteps, dtype=tf.int32)
         indices = (self.memory_index - 1 - indices) % self.capacity
 
         if self.include_next_states:
-            # Ensure consistent next state semantics for Q models.
-            terminal = tf.gather(params=self.terminal_memory, indices=indices)
-            indices = tf.boolean_mask(tensor=indices, mask=tf.logical_not(x=terminal))
-
-            # Simple rejection sampling in case masking out terminals yielded
-            # no indices.
-            def resample_fn():
-                def cond(sampled_indices):
-                    # Any index contained after masking?
-                    return tf.reduce_any(input_tensor=(sampled_indices >= 0))
-
-                def sampling_body(sampled_indices):
-                    # Resample. Note that we could also try up to fill
-                    # masked out indices.
-                    sampled_indices = tf.random_uniform(shape=(n,), maxval=num_timesteps, dtype=tf.int32)
-                    sampled_indices = (self.memory_index - 1 - sampled_indices) % self.capacity
-
-                    terminal = tf.gather(params=self.terminal_memory, indices=sampled_indices)
-                    sampled_indices = tf.boolean_mask(tensor=sampled_indices, mask=tf.logical_not(x=terminal))
-
-                    return sampled_indices
-
-                sampled_indices = tf.while_loop(
-                    cond=cond,
-                    body=sampling_body,
-                    loop_vars=[indices],
-                    maximum_iterations=10
-                )
-                return sampled_indices
-
-            # If there are still indices after masking, return these, otherwise resample.
-            indices = tf.cond(
-                pred=tf.reduce_any(input_tensor=(indices >= 0)),
-                true_fn=(lambda: indices),
-                false_fn=resample_fn
+            # Ensure consistent next state semantics for Q models: sample exactly n records among the non-terminal
+            # ones, except the most recent record whose next state is not stored yet.
+            newest_index = (self.memory_index - 1) % self.capacity
+            last_valid_index = tf.gather(
+                params=self.valid_indices,
+                indices=((self.valid_start + self.valid_count - 1) % self.capacity)
+            )
+            num_valid = self.valid_count - tf.to_int32(x=tf.logical_and(
+                x=(self.valid_count > 0),
+                y=tf.equal(x=last_valid_index, y=newest_index)
+            ))
+            valid_ranks = tf.random_uniform(shape=(n,), maxval=tf.maximum(x=num_valid, y=1), dtype=tf.int32)
+            valid_indices = tf.gather(
+                params=self.valid_indices,
+                indices=((self.valid_start + valid_ranks) % self.capacity)
+            )
+
+            # Fall back to any records if there is no valid one yet.
+            indices = tf.where(
+                condition=tf.fill(dims=(n,), value=(num_valid > 0)),
+                x=valid_indices,
+                y=indices
             )
-            return self.retrieve_indices(indices=indices)
-        else:
-            # No masking necessary if next-state semantics are not relevant.
-            return self.retrieve_indices(indices=indices)
+
+        return self.retrieve_indices(indices=indices)
 
     def tf_retrieve_episodes(self, n):
         asserts = [
@@ -107,19 +239,44 @@ class Replay(Queue):
         limits = tf.gather(params=self.episode_indices, indices=random_episode_indices) + 1
         limits += tf.where(
             condition=(starts < limits),
-            x=tf.constant(value=0, shape=(n,)),
-            y=tf.constant(value=self.capacity, shape=(n,))
+            x=tf.zeros_like(tensor=limits),
+            y=tf.fill(dims=tf.shape(input=limits), value=self.capacity)
         )
-        episodes = [tf.range(start=starts[k], limit=limits[k]) for k in range(n)]
-        indices = tf.concat(values=episodes, axis=0) % self.capacity
+        indices = self.ragged_range(starts=starts, limits=limits) % self.capacity
         return self.retrieve_indices(indices=indices)
 
     def tf_retrieve_sequences(self, n, sequence_length):
         num_sequences = (self.memory_index - self.episode_indices[0] - 2 - sequence_length + 1) % self.capacity + 1
         indices = tf.random_uniform(shape=(n,), maxval=num_sequences, dtype=tf.int32)
         indices = (self.memory_index - 1 - indices - sequence_length) % self.capacity
-        sequence_indices = [tf.range(start=indices[k], limit=(indices[k] + sequence_length)) for k in range(n)]
-        sequence_indices = tf.concat(values=sequence_indices, axis=0) % self.capacity  # tf.stack !!!!!
+        # Sequences of shape (n, sequence_length), dropping sequences which start with a terminal.
+        sequence_indices = tf.expand_dims(input=indices, axis=1) + tf.range(start=0, limit=sequence_length)
         terminal = tf.gather(params=self.terminal_memory, indices=indices)
         sequence_indices = tf.boolean_mask(tensor=sequence_indices, mask=tf.logical_not(x=terminal))
+        sequence_indices = tf.reshape(tensor=sequence_indices, shape=(-1,)) % self.capacity
         return self.retrieve_indices(indices=sequence_indices)
+
+    @staticmethod
+    def ragged_range(starts, limits):
+        """
+        Concatenation of the ranges [starts[k], limits[k]), as a graph of constant size independent of the
+        number of ranges (in contrast to one `tf.range` per range). Ranges are required to be non-empty.
+
+        Args:
+            starts: 1D int tensor of range starts.
+            limits: 1D int tensor of range limits.
+
+        Returns: 1D int tensor of concatenated ranges.
+        """
+        lengths = limits - starts
+        offsets = tf.cumsum(x=lengths, exclusive=True)
+        num_indices = tf.reduce_sum(input_tensor=lengths)
+        # Range number of each position: count of range offsets up to this position.
+        range_starts = tf.unsorted_segment_sum(
+            data=tf.ones_like(tensor=offsets),
+            segment_ids=offsets,
+            num_segments=num_indices
+        )
+        range_numbers = tf.cumsum(x=range_starts) - 1
+        positions = tf.range(start=0, limit=num_indices)
+        return tf.gather(params=(starts - offsets), indices=range_numbers) + positions
@@ -0,0 +1,156 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import tensorflow as tf
+
+from tensorforce import TensorForceError
+from tensorforce.core.memories import Replay
+
+
+class StackedFrameReplay(Replay):
+    """
+    Replay memory for states stacked by the `sequence` preprocessor, which stores only the most recent frame
+    of each stacked state and reconstructs the stacked states (and next states) on retrieval, from the
+    preceding frames of the same episode. This reduces the memory size of stacked states by a factor of
+    `stack_length`.
+    """
+
+    def __init__(
+        self,
+        states,
+        internals,
+        actions,
+        include_next_states,
+        capacity,
+        stack_length=4,
+        add_rank=False,
+        stacked_states=None,
+        scope='stacked-frame-replay',
+        summary_labels=None
+    ):
+        """
+        Stacked frame replay memory.
+
+        Args:
+            states (dict): States specification.
+            internals (dict): Internal states specification.
+            actions (dict): Actions specification.
+            include_next_states (bool): Include subsequent state if true.
+            capacity (int): Memory capacity (number of state/internals/action/(next-state)? records).
+            stack_length (int): Number of stacked frames, the `length` of the sequence preprocessor.
+            add_rank (bool): Whether frames are stacked along an added rank, the `add_rank` of the sequence
+                preprocessor.
+            stacked_states (list): Names of the stacked state components (default: all).
+        """
+        self.stack_length = stack_length
+        self.add_rank = add_rank
+        if stacked_states is None:
+            stacked_states = sorted(states)
+        self.stacked_states = list(stacked_states)
+
+        # Only single frames of stacked states are stored.
+        self.stacked_states_spec = dict()
+        states = dict(states)
+        for name in self.stacked_states:
+            if name not in states:
+                raise TensorForceError("Invalid stacked state {}.".format(name))
+            state = states[name]
+            shape = tuple(state['shape'])
+            if add_rank:
+                if len(shape) == 0 or shape[-1] != stack_length:
+                    raise TensorForceError("Invalid shape {} of stacked state {}.".format(shape, name))
+                frame_shape = shape[:-1]
+            else:
+                if len(shape) == 0 or shape[-1] % stack_length != 0:
+                    raise TensorForceError("Invalid shape {} of stacked state {}.".format(shape, name))
+                frame_shape = shape[:-1] + (shape[-1] // stack_length,)
+            self.stacked_states_spec[name] = state
+            states[name] = dict(state, shape=frame_shape)
+
+        super(StackedFrameReplay, self).__init__(
+            states=states,
+            internals=internals,
+            actions=actions,
+            include_next_states=include_next_states,
+            capacity=capacity,
+            scope=scope,
+            summary_labels=summary_labels
+        )
+
+    def tf_store(self, states, internals, actions, terminal, reward):
+        # The sequence preprocessor orders the stack as [t-1, t-2, ..., t-length+1, t], so the most recent frame
+        # is the last one.
+        states = dict(states)
+        for name in self.stacked_states:
+            if self.add_rank:
+                states[name] = states[name][..., -1]
+            else:
+                frame_size = self.states_spec[name]['shape'][-1]
+                states[name] = states[name][..., -frame_size:]
+
+        return super(StackedFrameReplay, self).tf_store(
+            states=states,
+            internals=internals,
+            actions=actions,
+            terminal=terminal,
+            reward=reward
+        )
+
+    def tf_retrieve_indices(self, indices):
+        batch = super(StackedFrameReplay, self).tf_retrieve_indices(indices=indices)
+
+        for name in self.stacked_states:
+            batch['states'][name] = self.stack_frames(name=name, indices=indices)
+
+        if self.include_next_states:
+            next_indices = (indices + 1) % self.capacity
+            for name in self.stacked_states:
+                batch['next_states'][name] = self.stack_frames(name=name, indices=next_indices)
+
+        return batch
+
+    def stack_frames(self, name, indices):
+        """
+        Reconstructs the stacked states for the given indices from the stored frames. Frames preceding the
+        start of an episode (or the oldest stored record) are replaced by its first frame, as done by the
+        sequence preprocessor.
+
+        Args:
+            name: State component name.
+            indices: Index tensor of the most recent frames.
+
+        Returns: Batch of stacked states.
+        """
+        oldest_index = (self.memory_index - self.num_stored) % self.capacity
+
+        frame_indices = [indices]
+        at_start = tf.equal(x=indices, y=oldest_index)
+        for _ in range(self.stack_length - 1):
+            previous_indices = (frame_indices[-1] - 1) % self.capacity
+            # A terminal previous record ends the previous episode.
+            at_start = tf.logical_or(x=at_start, y=tf.gather(params=self.terminal_memory, indices=previous_indices))
+            frame_indices.append(tf.where(condition=at_start, x=frame_indices[-1], y=previous_indices))
+            at_start = tf.logical_or(x=at_start, y=tf.equal(x=frame_indices[-1], y=oldest_index))
+
+        frames = [tf.gather(params=self.states_memory[name], indices=index) for index in frame_indices]
+        frames = frames[1:] + frames[:1]
+        if self.add_rank:
+            return tf.stack(values=frames, axis=-1)
+        else:
+            return tf.concat(values=frames, axis=-1)
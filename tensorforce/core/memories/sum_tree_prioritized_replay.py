@@ -0,0 +1,303 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import tensorflow as tf
+
+from tensorforce import util, TensorForceError
+from tensorforce.core.memories import Queue
+
+
+class SumTreePrioritizedReplay(Queue):
+    """
+    Prioritized replay memory which keeps priorities in a sum tree (and their minimum in a min tree),
+    so sampling and priority updates are logarithmic in the memory capacity. Experiences are stored
+    in insertion order like in a queue and are never re-sorted.
+    """
+
+    def __init__(
+        self,
+        states,
+        internals,
+        actions,
+        include_next_states,
+        capacity,
+        prioritization_weight=1.0,
+        importance_sampling_weight=0.4,
+        scope='sum-tree-prioritized-replay',
+        summary_labels=None
+    ):
+        """
+        Sum-tree prioritized experience replay.
+
+        Args:
+            states: States specification.
+            internals: Internal states specification.
+            actions: Actions specification.
+            include_next_states: Include subsequent state if true.
+            capacity: Memory capacity.
+            prioritization_weight: Prioritization weight (alpha), priorities are computed as
+                `loss ** prioritization_weight`.
+            importance_sampling_weight: Importance sampling weight (beta) used to correct the loss of
+                sampled experiences for the prioritization bias, 0.0 for no correction.
+        """
+        self.prioritization_weight = prioritization_weight
+        self.importance_sampling_weight = importance_sampling_weight
+
+        # Smallest power of two greater or equal to the capacity, the leaves of the trees.
+        self.tree_capacity = 1
+        while self.tree_capacity < capacity:
+            self.tree_capacity *= 2
+        self.tree_depth = self.tree_capacity.bit_length() - 1
+
+        self.sum_tree = None  # 1D tensor: Node n has children 2n and 2n+1, leaves start at tree_capacity.
+        self.min_tree = None  # 1D tensor
+        self.max_priority = None  # 0D tensor: Priority assigned to new experiences.
+        self.pending_index = None  # 0D (int) tensor: Latest timestep still waiting for its successor, or -1.
+        self.batch_indices = None  # 1D (int) tensor: Memory indices of the last retrieved batch.
+        self.batch_weights = None  # 1D tensor: Importance sampling weights of the last retrieved batch.
+        self.batch_size = None  # 0D (int) tensor: Size of the last retrieved batch.
+
+        super(SumTreePrioritizedReplay, self).__init__(
+            states=states,
+            internals=internals,
+            actions=actions,
+            include_next_states=include_next_states,
+            capacity=capacity,
+            scope=scope,
+            summary_labels=summary_labels
+        )
+
+    def tf_initialize(self):
+        super(SumTreePrioritizedReplay, self).tf_initialize()
+
+        # Sum tree
+        self.sum_tree = tf.get_variable(
+            name='sum-tree',
+            shape=(2 * self.tree_capacity,),
+            dtype=util.tf_dtype('float'),
+            initializer=tf.zeros_initializer(dtype=util.tf_dtype('float')),
+            trainable=False
+        )
+
+        # Min tree, empty leaves are infinite so they never determine the minimum.
+        self.min_tree = tf.get_variable(
+            name='min-tree',
+            shape=(2 * self.tree_capacity,),
+            dtype=util.tf_dtype('float'),
+            initializer=tf.constant_initializer(value=float('inf'), dtype=util.tf_dtype('float')),
+            trainable=False
+        )
+
+        # Max priority
+        self.max_priority = tf.get_variable(
+            name='max-priority',
+            dtype=util.tf_dtype('float'),
+            initializer=1.0,
+            trainable=False
+        )
+
+        # Pending index
+        self.pending_index = tf.get_variable(
+            name='pending-index',
+            dtype=util.tf_dtype('int'),
+            initializer=-1,
+            trainable=False
+        )
+
+        # Last batch
+        self.batch_indices = tf.get_variable(
+            name='batch-indices',
+            shape=(self.capacity,),
+            dtype=util.tf_dtype('int'),
+            initializer=tf.zeros_initializer(dtype=util.tf_dtype('int')),
+            trainable=False
+        )
+        self.batch_weights = tf.get_variable(
+            name='batch-weights',
+            shape=(self.capacity,),
+            dtype=util.tf_dtype('float'),
+            initializer=tf.ones_initializer(dtype=util.tf_dtype('float')),
+            trainable=False
+        )
+        self.batch_size = tf.get_variable(
+            name='batch-size',
+            dtype=util.tf_dtype('int'),
+            initializer=0,
+            trainable=False
+        )
+
+    def update_trees(self, indices, priorities):
+        """
+        Sets the priorities of the given memory indices and updates their paths to the root of the
+        sum and min tree, one tree level at a time.
+
+        Args:
+            indices: Memory index tensor.
+            priorities: Priority tensor, zero priorities exclude experiences from sampling.
+
+        Returns:
+            Update operation.
+        """
+        nodes = indices + self.tree_capacity
+        sum_tree = tf.scatter_update(ref=self.sum_tree, indices=nodes, updates=priorities)
+        min_tree = tf.scatter_update(
+            ref=self.min_tree,
+            indices=nodes,
+            updates=tf.where(
+                condition=(priorities > 0.0),
+                x=priorities,
+                y=tf.fill(dims=tf.shape(input=priorities), value=float('inf'))
+            )
+        )
+
+        # Parents are recomputed from both children, so duplicate indices are consistent.
+        for _ in range(self.tree_depth):
+            nodes = nodes // 2
+            left = 2 * nodes
+            sum_tree = tf.scatter_update(
+                ref=sum_tree,
+                indices=nodes,
+                updates=(tf.gather(params=sum_tree, indices=left) + tf.gather(params=sum_tree, indices=(left + 1)))
+            )
+            min_tree = tf.scatter_update(
+                ref=min_tree,
+                indices=nodes,
+                updates=tf.minimum(
+                    x=tf.gather(params=min_tree, indices=left),
+                    y=tf.gather(params=min_tree, indices=(left + 1))
+                )
+            )
+
+        with tf.control_dependencies(control_inputs=(sum_tree, min_tree)):
+            return tf.no_op()
+
+    def tf_store(self, states, internals, actions, terminal, reward):
+        num_instances = tf.shape(input=terminal)[0]
+        with tf.control_dependencies([tf.assert_less_equal(num_instances, self.capacity)]):
+            indices = tf.range(self.memory_index, self.memory_index + num_instances) % self.capacity
+
+        # New experiences are assigned the max priority so they are sampled at least once.
+        priorities = tf.fill(dims=(num_instances,), value=self.max_priority)
+
+        if self.include_next_states:
+            # The latest timestep can only be sampled once its successor is stored (unless terminal).
+            is_last = tf.equal(x=tf.range(num_instances), y=(num_instances - 1))
+            priorities = tf.where(
+                condition=tf.logical_or(x=tf.logical_not(x=is_last), y=terminal),
+                x=priorities,
+                y=tf.zeros_like(tensor=priorities)
+            )
+            is_pending = tf.greater_equal(x=self.pending_index, y=0)
+            indices_to_update = tf.concat(
+                values=(tf.boolean_mask(tensor=tf.expand_dims(input=self.pending_index, axis=0), mask=[is_pending]),
+                        indices),
+                axis=0
+            )
+            priorities = tf.concat(
+                values=(tf.boolean_mask(tensor=tf.expand_dims(input=self.max_priority, axis=0), mask=[is_pending]),
+                        priorities),
+                axis=0
+            )
+            updated = self.update_trees(indices=indices_to_update, priorities=priorities)
+
+            with tf.control_dependencies(control_inputs=(updated,)):
+                updated = tf.assign(
+                    ref=self.pending_index,
+                    value=tf.where(condition=terminal[-1], x=-1, y=indices[-1])
+                )
+
+        else:
+            updated = self.update_trees(indices=indices, priorities=priorities)
+
+        with tf.control_dependencies(control_inputs=(updated,)):
+            return super(SumTreePrioritizedReplay, self).tf_store(
+                states=states,
+                internals=internals,
+                actions=actions,
+                terminal=terminal,
+                reward=reward
+            )
+
+    def tf_retrieve_timesteps(self, n):
+        # Stratified sampling: one sample per equally sized segment of the total priority mass.
+        total_priority = self.sum_tree[1]
+        with tf.control_dependencies([tf.assert_greater(x=total_priority, y=0.0, message="nothing stored yet")]):
+            masses = tf.cast(x=tf.range(n), dtype=util.tf_dtype('float')) + tf.random_uniform(shape=(n,))
+        masses = masses * total_priority / tf.cast(x=n, dtype=util.tf_dtype('float'))
+
+        # Descend from the root, moving right if the mass exceeds the left subtree (and the right one is non-empty).
+        nodes = tf.ones(shape=(n,), dtype=util.tf_dtype('int'))
+        for _ in range(self.tree_depth):
+            left = 2 * nodes
+            left_sum = tf.gather(params=self.sum_tree, indices=left)
+            right_sum = tf.gather(params=self.sum_tree, indices=(left + 1))
+            go_right = tf.logical_and(x=(masses >= left_sum), y=(right_sum > 0.0))
+            masses = tf.where(condition=go_right, x=(masses - left_sum), y=masses)
+            nodes = tf.where(condition=go_right, x=(left + 1), y=left)
+        indices = nodes - self.tree_capacity
+
+        # Importance sampling weights, normalized by the weight of the minimum priority.
+        priorities = tf.gather(params=self.sum_tree, indices=nodes)
+        weights = (priorities / self.min_tree[1]) ** (-self.importance_sampling_weight)
+
+        assignments = list()
+        assignments.append(tf.assign(ref=self.batch_indices[:n], value=indices))
+        assignments.append(tf.assign(ref=self.batch_weights[:n], value=weights))
+        assignments.append(tf.assign(ref=self.batch_size, value=n))
+
+        with tf.control_dependencies(control_inputs=assignments):
+            return self.retrieve_indices(indices=indices)
+
+    def tf_retrieve_episodes(self, n):
+        raise TensorForceError("Retrieving episodes is not supported by sum-tree prioritized replay.")
+
+    def tf_retrieve_sequences(self, n, sequence_length):
+        raise TensorForceError("Retrieving sequences is not supported by sum-tree prioritized replay.")
+
+    def tf_update_batch(self, loss_per_instance):
+        """
+        Updates the priorities of the last retrieved batch to `loss ** prioritization_weight`.
+        Losses which do not originate from the last retrieved batch are ignored.
+
+        Args:
+            loss_per_instance: Loss per instance tensor.
+        """
+        num_instances = tf.shape(input=loss_per_instance)[0]
+
+        def update():
+            priorities = (tf.abs(x=loss_per_instance) + util.epsilon) ** self.prioritization_weight
+            updated = self.update_trees(indices=self.batch_indices[:num_instances], priorities=priorities)
+            with tf.control_dependencies(control_inputs=(updated,)):
+                assignment = tf.assign(
+                    ref=self.max_priority,
+                    value=tf.maximum(x=self.max_priority, y=tf.reduce_max(input_tensor=priorities))
+                )
+            with tf.control_dependencies(control_inputs=(assignment,)):
+                return tf.no_op()
+
+        return tf.cond(pred=tf.equal(x=num_instances, y=self.batch_size), true_fn=update, false_fn=tf.no_op)
+
+    def tf_weight_losses(self, loss_per_instance):
+        num_instances = tf.shape(input=loss_per_instance)[0]
+        weights = tf.cond(
+            pred=tf.equal(x=num_instances, y=self.batch_size),
+            true_fn=(lambda: self.batch_weights[:num_instances]),
+            false_fn=(lambda: tf.ones_like(tensor=loss_per_instance))
+        )
+        return loss_per_instance * weights
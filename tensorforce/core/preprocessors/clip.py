@@ -31,5 +31,8 @@ class Clip(Preprocessor):
         self.max_value = max_value
         super(Clip, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
+    def is_stateless(self):
+        return True
+
     def tf_process(self, tensor):
         return tf.clip_by_value(t=tensor, clip_value_min=self.min_value, clip_value_max=self.max_value)
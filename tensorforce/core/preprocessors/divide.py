@@ -29,5 +29,8 @@ class Divide(Preprocessor):
         self.scale = scale
         super(Divide, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
+    def is_stateless(self):
+        return True
+
     def tf_process(self, tensor):
         return tensor / self.scale
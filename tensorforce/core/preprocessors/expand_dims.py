@@ -35,6 +35,9 @@ class ExpandDims(Preprocessor):
         position = self.axis if self.axis >= 0 else len(shape) + self.axis + 1
         return shape[:position] + (1,) + shape[position:]
 
+    def is_stateless(self):
+        return True
+
     def tf_process(self, tensor):
         # Expand tensor.
         return tf.expand_dims(input=tensor, axis=self.axis)
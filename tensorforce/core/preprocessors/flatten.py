@@ -36,6 +36,9 @@ class Flatten(Preprocessor):
             return -1, util.prod(shape[1:])
         return util.prod(shape),
 
+    def is_stateless(self):
+        return True
+
     def tf_process(self, tensor):
         # Flatten tensor
         return tf.reshape(tensor=tensor, shape=self.processed_shape(util.shape(tensor)))
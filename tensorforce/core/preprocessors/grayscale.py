@@ -38,6 +38,9 @@ class Grayscale(Preprocessor):
         self.remove_rank = remove_rank
         super(Grayscale, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
+    def is_stateless(self):
+        return True
+
     def tf_process(self, tensor):
         weights = tf.reshape(tensor=self.weights, shape=(tuple(1 for _ in range(util.rank(tensor) - 1)) + (3,)))
         weighted_sum = tf.reduce_sum(input_tensor=(weights * tensor), axis=-1, keepdims=(not self.remove_rank))
@@ -30,6 +30,9 @@ class ImageResize(Preprocessor):
         self.size = (width, height)
         super(ImageResize, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
+    def is_stateless(self):
+        return True
+
     def tf_process(self, tensor):
         return tf.image.resize_images(images=tensor, size=self.size)
 
@@ -31,6 +31,9 @@ class Normalize(Preprocessor):
     def __init__(self, shape, scope='normalize', summary_labels=()):
         super(Normalize, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
+    def is_stateless(self):
+        return True
+
     def tf_process(self, tensor):
         # Min/max across every axis except batch dimension.
         min_value = tensor
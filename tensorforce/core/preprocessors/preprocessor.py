@@ -91,6 +91,16 @@ class Preprocessor(object):
         """
         return shape
 
+    def is_stateless(self):
+        """
+        Whether the preprocessor has no state and processes batch instances independently, so it can
+        equivalently be applied to a batch of stored states when retrieved from memory.
+
+        Returns:
+            True if stateless.
+        """
+        return False
+
     def get_variables(self):
         """
         Returns the TensorFlow variables used by the preprocessor.
@@ -122,33 +132,50 @@ class PreprocessorStack(object):
             fetches.extend(processor.reset() or [])
         return fetches
 
-    def process(self, tensor):
+    def process(self, tensor, start=0, end=None):
         """
         Process state.
 
         Args:
             tensor: tensor to process
+            start: index of the first preprocessor to apply
+            end: index after the last preprocessor to apply (default: all)
 
         Returns: processed state
 
         """
-        for processor in self.preprocessors:
+        for processor in self.preprocessors[start:end]:
             tensor = processor.process(tensor=tensor)
         return tensor
 
-    def processed_shape(self, shape):
+    def processed_shape(self, shape, start=0, end=None):
         """
         Shape of preprocessed state given original shape.
 
         Args:
             shape: original state shape
+            start: index of the first preprocessor to apply
+            end: index after the last preprocessor to apply (default: all)
 
         Returns: processed state shape
         """
-        for processor in self.preprocessors:
+        for processor in self.preprocessors[start:end]:
             shape = processor.processed_shape(shape=shape)
         return shape
 
+    def stateless_index(self):
+        """
+        Index of the first preprocessor from which on all preprocessors are stateless, hence can be applied
+        to stored states on retrieval.
+
+        Returns:
+            Index (number of preprocessors if the last one is not stateless).
+        """
+        index = len(self.preprocessors)
+        while index > 0 and self.preprocessors[index - 1].is_stateless():
+            index -= 1
+        return index
+
     def get_variables(self):
         return [variable for preprocessor in self.preprocessors for variable in preprocessor.get_variables()]
 
@@ -38,6 +38,9 @@ class Standardize(Preprocessor):
         self.across_batch = across_batch
         super(Standardize, self).__init__(shape=shape, scope=scope, summary_labels=summary_labels)
 
+    def is_stateless(self):
+        return not self.across_batch
+
     def tf_process(self, tensor):
         if self.across_batch:
             axes = tuple(range(util.rank(tensor)))
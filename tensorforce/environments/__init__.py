@@ -15,6 +15,8 @@
 
 
 from tensorforce.environments.environment import Environment
+from tensorforce.environments.action_repeat import ActionRepeat
+from tensorforce.environments.process_environment import ProcessEnvironment, SharedStateMemory
 
 # had to take out MinimalTest due to circular dependency
-__all__ = ['Environment']
+__all__ = ['Environment', 'ActionRepeat', 'ProcessEnvironment', 'SharedStateMemory']
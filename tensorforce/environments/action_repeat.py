@@ -0,0 +1,110 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.environments.environment import Environment
+
+
+class ActionRepeat(Environment):
+    """
+    Environment wrapper which repeats each action for a number of frames inside the environment, returning the
+    summed reward and (optionally) the elementwise maximum of the last two frames, as commonly done for Atari
+    games to remove flickering. In contrast to the `repeat_actions` argument of the runners, one `execute` call
+    covers all repeated frames, so wrapping the environment before it is moved to a worker process (see
+    `ProcessEnvironment`) or behind a remote connection saves a round trip per repeated frame.
+    """
+
+    def __init__(self, environment, repeat=4, max_pool=True):
+        """
+        Action repeat wrapper.
+
+        Args:
+            environment (Environment): The wrapped environment.
+            repeat (int): Number of frames each action is repeated for (stops early at a terminal frame).
+            max_pool (bool): Whether the returned state is the elementwise maximum of the last two frames (also
+                at a terminal frame), otherwise the last frame.
+        """
+        if repeat < 1:
+            raise TensorForceError("Invalid action repeat {}, has to be at least 1.".format(repeat))
+
+        self.environment = environment
+        self.repeat = repeat
+        self.max_pool = max_pool
+
+    def __str__(self):
+        return 'ActionRepeat({}, {})'.format(self.environment, self.repeat)
+
+    def close(self):
+        self.environment.close()
+
+    def seed(self, seed):
+        return self.environment.seed(seed=seed)
+
+    def reset(self):
+        return self.environment.reset()
+
+    def execute(self, action):
+        previous_state = None
+        state = None
+        terminal = False
+        reward = 0.0
+
+        for _ in range(self.repeat):
+            if self.max_pool and state is not None:
+                # Environments may reuse their state buffer for the next frame.
+                previous_state = self.copy_state(state)
+            state, terminal, step_reward = self.environment.execute(action=action)
+            reward += step_reward
+            if terminal:
+                break
+
+        if self.max_pool and previous_state is not None:
+            state = self.max_pool_states(previous_state, state)
+
+        return state, terminal, reward
+
+    @staticmethod
+    def copy_state(state):
+        """
+        Copy of a state, per component for dicts of states.
+        """
+        if isinstance(state, dict):
+            return {name: np.copy(state[name]) for name in state}
+        else:
+            return np.copy(state)
+
+    @staticmethod
+    def max_pool_states(previous_state, state):
+        """
+        Elementwise maximum of two states, per component for dicts of states.
+        """
+        if isinstance(state, dict):
+            return {name: np.maximum(previous_state[name], state[name]) for name in state}
+        else:
+            return np.maximum(previous_state, state)
+
+    @property
+    def states(self):
+        return self.environment.states
+
+    @property
+    def actions(self):
+        return self.environment.actions
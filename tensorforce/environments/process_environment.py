@@ -0,0 +1,433 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import multiprocessing
+import traceback
+
+import numpy as np
+
+from tensorforce import TensorForceError, util
+from tensorforce.environments.environment import Environment
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:
+    resource_tracker = None
+
+
+class SharedStateMemory(object):
+    """
+    Preallocated shared-memory arrays of shape (num_slots, num_environments, *state_shape) per state, into which
+    process environment workers directly write their states. The parent process reads them as numpy views
+    without copying, and `batch` yields the states of all environments for a slot as one batch.
+
+    A state view is valid until the same slot of the environment is written again, so with the default of
+    two slots, the states of one step remain valid while the next step is executed.
+    """
+
+    def __init__(self, states, num_environments, num_slots=2):
+        """
+        Allocates the shared-memory blocks.
+
+        Args:
+            states: States specification of the environments (as returned by `Environment.states`).
+            num_environments (int): Number of environments writing to the memory.
+            num_slots (int): Number of ring slots per environment.
+        """
+        if shared_memory is None:
+            raise TensorForceError("SharedStateMemory requires multiprocessing.shared_memory (Python >= 3.8).")
+
+        self.unique_state = ('shape' in states)
+        if self.unique_state:
+            states = dict(state=states)
+
+        self.states_spec = dict()
+        for name, state in states.items():
+            shape = state['shape']
+            if isinstance(shape, int):
+                shape = (shape,)
+            self.states_spec[name] = dict(shape=tuple(shape), type=state.get('type', 'float'))
+
+        self.num_environments = num_environments
+        self.num_slots = num_slots
+        self.owner = True
+        self.num_attached = 0
+
+        self.blocks = dict()
+        for name, state in self.states_spec.items():
+            size = int(np.prod(self.array_shape(name=name))) * np.dtype(util.np_dtype(state['type'])).itemsize
+            self.blocks[name] = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.setup_arrays()
+
+    def array_shape(self, name):
+        return (self.num_slots, self.num_environments) + self.states_spec[name]['shape']
+
+    def setup_arrays(self):
+        self.arrays = {
+            name: np.ndarray(
+                shape=self.array_shape(name=name),
+                dtype=util.np_dtype(self.states_spec[name]['type']),
+                buffer=self.blocks[name].buf
+            ) for name in self.states_spec
+        }
+
+    def __getstate__(self):
+        # Workers attach to the existing blocks by name instead of pickling their content.
+        return dict(
+            states_spec=self.states_spec,
+            unique_state=self.unique_state,
+            num_environments=self.num_environments,
+            num_slots=self.num_slots,
+            block_names={name: block.name for name, block in self.blocks.items()}
+        )
+
+    def __setstate__(self, state):
+        self.states_spec = state['states_spec']
+        self.unique_state = state['unique_state']
+        self.num_environments = state['num_environments']
+        self.num_slots = state['num_slots']
+        self.owner = False
+        self.num_attached = 0
+        self.blocks = {
+            name: shared_memory.SharedMemory(name=block_name) for name, block_name in state['block_names'].items()
+        }
+        self.setup_arrays()
+
+    def write(self, slot, index, state):
+        """
+        Writes the state of an environment to the given slot.
+        """
+        if self.unique_state:
+            self.arrays['state'][slot, index] = state
+        else:
+            for name, array in self.arrays.items():
+                array[slot, index] = state[name]
+
+    def read(self, slot, index):
+        """
+        Returns a view of the state of an environment in the given slot.
+        """
+        if self.unique_state:
+            return self.arrays['state'][slot, index]
+        else:
+            return {name: array[slot, index] for name, array in self.arrays.items()}
+
+    def batch(self, slot):
+        """
+        Returns a view of the states of all environments in the given slot, as a batch.
+        """
+        if self.unique_state:
+            return self.arrays['state'][slot]
+        else:
+            return {name: array[slot] for name, array in self.arrays.items()}
+
+    def close(self):
+        """
+        Releases the shared memory (and frees it, if called from the creating process).
+        """
+        if self.blocks is None:
+            return
+        self.arrays = None
+        for block in self.blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                # Views still referenced elsewhere, mapping is released once they are garbage-collected.
+                pass
+            if self.owner:
+                block.unlink()
+        self.blocks = None
+
+
+def environment_worker(connection, environment, kwargs):
+    """
+    Target function of the worker process: creates the environment and serves requests received via the
+    connection until a 'close' request arrives. Exceptions are sent back as formatted traceback. If a
+    shared state memory is attached, states are written to the requested slot instead of being sent back.
+
+    Args:
+        connection: Child end of the pipe to the parent process.
+        environment: Environment object, or callable (e.g. Environment subclass) creating the environment.
+        kwargs: Keyword arguments for the environment callable.
+    """
+    try:
+        if not isinstance(environment, Environment):
+            environment = environment(**(kwargs or dict()))
+    except Exception:
+        connection.send(('error', traceback.format_exc()))
+        connection.close()
+        return
+    connection.send(('ok', (str(environment), environment.states, environment.actions)))
+
+    memory = None
+    index = None
+
+    while True:
+        try:
+            command, argument, slot = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        try:
+            if command == 'execute':
+                result = environment.execute(action=argument)
+                if memory is not None:
+                    memory.write(slot=slot, index=index, state=result[0])
+                    result = (None,) + tuple(result[1:])
+            elif command == 'reset':
+                result = environment.reset()
+                if memory is not None:
+                    memory.write(slot=slot, index=index, state=result)
+                    result = None
+            elif command == 'seed':
+                result = environment.seed(seed=argument)
+            elif command == 'attach':
+                if memory is not None:
+                    memory.close()
+                memory, index = argument
+                result = None
+            elif command == 'close':
+                environment.close()
+                if memory is not None:
+                    memory.close()
+                connection.send(('ok', None))
+                break
+            else:
+                raise TensorForceError("Unknown environment worker command: {}".format(command))
+        except Exception:
+            connection.send(('error', traceback.format_exc()))
+        else:
+            connection.send(('ok', result))
+
+    connection.close()
+
+
+class ProcessEnvironment(Environment):
+    """
+    Environment wrapper which runs the wrapped environment in a separate worker process and forwards
+    `reset`/`execute` calls via a pipe. Stepping Python-heavy environments hence is not serialized by the GIL
+    of the process holding the model, e.g. when used with the `ThreadedRunner` or `ParallelRunner`.
+
+    Besides the blocking `Environment` interface, `reset_async`/`execute_async` followed by `wait` allow
+    to step multiple process environments concurrently from a single thread.
+
+    Large states (e.g. images) can be transferred without pickling by attaching a `SharedStateMemory`, in
+    which case returned states are views of the requested slot of the shared memory.
+    """
+
+    def __init__(self, environment, kwargs=None, start_method=None):
+        """
+        Starts the worker process and creates the wrapped environment within it.
+
+        Args:
+            environment: Environment object or callable (e.g. Environment subclass) returning an environment.
+                Has to be picklable unless the 'fork' start method is used.
+            kwargs (dict): Keyword arguments passed to the environment callable.
+            start_method (str): Multiprocessing start method ('fork', 'spawn' or 'forkserver', default: platform
+                default).
+        """
+        if start_method is None:
+            context = multiprocessing
+        else:
+            context = multiprocessing.get_context(method=start_method)
+
+        if shared_memory is not None and resource_tracker is not None:
+            # Forked workers need to share the resource tracker of this process, otherwise their own tracker
+            # unlinks attached shared memory once they terminate.
+            resource_tracker.ensure_running()
+
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(
+            target=environment_worker,
+            args=(worker_connection, environment, kwargs)
+        )
+        self.process.daemon = True
+        self.process.start()
+        worker_connection.close()
+
+        self.closed = False
+        self.shared_memory = None
+        self.index = None
+        self.slot = 0
+        self.pending_slot = None
+
+        # Worker reports name and specification once created, as they do not change.
+        self.pending = 'initialize'
+        self.name, self._states, self._actions = self.wait()
+
+    def __str__(self):
+        return 'ProcessEnvironment({})'.format(self.name)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            if self.pending is not None:
+                self.wait()
+            self.connection.send(('close', None, None))
+            self.pending = 'close'
+            self.wait()
+        except (EOFError, IOError, TensorForceError):
+            pass
+        self.connection.close()
+        self.process.join(timeout=5.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        if self.shared_memory is not None:
+            self.shared_memory.num_attached -= 1
+            if self.shared_memory.num_attached == 0:
+                self.shared_memory.close()
+            self.shared_memory = None
+
+    def attach_shared_memory(self, memory, index):
+        """
+        Attaches a shared state memory, to which the worker subsequently writes its states. The memory is
+        closed once all environments attached to it are closed.
+
+        Args:
+            memory (SharedStateMemory): Shared state memory.
+            index (int): Environment index within the shared state memory.
+        """
+        if index >= memory.num_environments:
+            raise TensorForceError("Invalid shared state memory index {} for {} environments.".format(
+                index, memory.num_environments
+            ))
+        self.send(command='attach', argument=(memory, index))
+        self.wait()
+        memory.num_attached += 1
+        self.shared_memory = memory
+        self.index = index
+
+    def seed(self, seed):
+        self.send(command='seed', argument=seed)
+        return self.wait()
+
+    def reset(self):
+        self.reset_async()
+        return self.wait()
+
+    def execute(self, action):
+        self.execute_async(action=action)
+        return self.wait()
+
+    def reset_async(self, slot=None):
+        """
+        Requests an environment reset without waiting for the result, which is retrieved via `wait`.
+
+        Args:
+            slot (int): Shared state memory slot to write the state to (default: next slot).
+        """
+        self.send(command='reset', slot=slot)
+
+    def execute_async(self, action, slot=None):
+        """
+        Requests the execution of an action without waiting for the result, which is retrieved via `wait`.
+
+        Args:
+            action: Action to execute.
+            slot (int): Shared state memory slot to write the state to (default: next slot).
+        """
+        self.send(command='execute', argument=action, slot=slot)
+
+    def wait(self):
+        """
+        Waits for the result of the pending request.
+
+        Returns:
+            Result of the pending request, e.g. tuple of (next state, bool indicating terminal, reward) for
+            `execute_async`.
+        """
+        if self.pending is None:
+            raise TensorForceError("No pending request to wait for.")
+        command = self.pending
+        self.pending = None
+
+        try:
+            status, result = self.connection.recv()
+        except EOFError:
+            raise TensorForceError("Environment worker process terminated during '{}' request.".format(command))
+
+        if status == 'error':
+            raise TensorForceError(
+                "Environment worker process raised an exception during '{}' request:\n{}".format(command, result)
+            )
+
+        if self.shared_memory is not None:
+            if command == 'execute':
+                result = (self.shared_memory.read(slot=self.pending_slot, index=self.index),) + tuple(result[1:])
+            elif command == 'reset':
+                result = self.shared_memory.read(slot=self.pending_slot, index=self.index)
+        return result
+
+    def send(self, command, argument=None, slot=None):
+        if self.closed:
+            raise TensorForceError("Environment is closed.")
+        if self.pending is not None:
+            raise TensorForceError("Environment still has a pending '{}' request.".format(self.pending))
+        if self.shared_memory is not None and command in ('execute', 'reset'):
+            if slot is None:
+                slot = self.slot
+            self.slot = (slot + 1) % self.shared_memory.num_slots
+        self.connection.send((command, argument, slot))
+        self.pending = command
+        self.pending_slot = slot
+
+    @property
+    def states(self):
+        return self._states
+
+    @property
+    def actions(self):
+        return self._actions
+
+    @staticmethod
+    def create_pool(environment, num_environments, kwargs=None, start_method=None, shared_states=False, num_slots=2):
+        """
+        Creates a list of process environments, each one with its own worker process.
+
+        Args:
+            environment: Callable (e.g. Environment subclass) returning an environment.
+            num_environments (int): Number of environments.
+            kwargs (dict): Keyword arguments passed to the environment callable.
+            start_method (str): Multiprocessing start method.
+            shared_states (bool): Whether states are transferred via a common `SharedStateMemory`.
+            num_slots (int): Number of shared state memory slots per environment.
+
+        Returns:
+            List of ProcessEnvironment objects.
+        """
+        environments = [
+            ProcessEnvironment(environment=environment, kwargs=kwargs, start_method=start_method)
+            for _ in range(num_environments)
+        ]
+        if shared_states:
+            memory = SharedStateMemory(
+                states=environments[0].states,
+                num_environments=num_environments,
+                num_slots=num_slots
+            )
+            for index, process_environment in enumerate(environments):
+                process_environment.attach_shared_memory(memory=memory, index=index)
+        return environments
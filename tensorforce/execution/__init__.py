@@ -13,9 +13,11 @@
 # limitations under the License.
 # ==============================================================================
 
+from tensorforce.execution.statistics import RingBuffer, RunStatistics, RunTimings
 from tensorforce.execution.base_runner import BaseRunner
 from tensorforce.execution.runner import Runner, SingleRunner, DistributedTFRunner
 from tensorforce.execution.threaded_runner import ThreadedRunner, WorkerAgentGenerator
 from tensorforce.execution.parallel_runner import ParallelRunner
+from tensorforce.execution.act_server import ActServer
 
-__all__ = ['BaseRunner', 'SingleRunner', 'DistributedTFRunner', 'Runner', 'ThreadedRunner', 'WorkerAgentGenerator', 'ParallelRunner']
+__all__ = ['BaseRunner', 'SingleRunner', 'DistributedTFRunner', 'Runner', 'ThreadedRunner', 'WorkerAgentGenerator', 'ParallelRunner', 'ActServer', 'RingBuffer', 'RunStatistics', 'RunTimings']
@@ -0,0 +1,253 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+from collections import deque
+import threading
+import time
+
+import numpy as np
+from six.moves import queue
+
+from tensorforce import TensorForceError
+
+try:
+    from concurrent.futures import Future
+except ImportError:
+    Future = None
+
+
+class ActServer(object):
+    """
+    Request-coalescing inference server on top of an agent: single-state act requests submitted by many
+    threads (or asyncio clients via `asyncio.wrap_future`) are collected for up to a latency budget, answered
+    by one batched independent act call, and the resulting actions are scattered back to the requests.
+
+    Internal states (e.g. of LSTM networks) are kept per client id, so each client observes the same internal
+    state sequence as with its own agent. Requests of a client are processed in submission order, at most one
+    per batch.
+    """
+
+    def __init__(self, agent, max_batch_size=None, latency_budget=0.002, deterministic=False):
+        """
+        Initializes the act server (call `start` before submitting requests).
+
+        Args:
+            agent (Agent): Agent to act with, exclusively used by the server thread.
+            max_batch_size (int): Maximum number of requests per batched act (default: batching capacity
+                of the agent's model).
+            latency_budget (float): Maximum time in seconds the first request of a batch waits for further
+                requests.
+            deterministic (bool): Whether actions are computed deterministically.
+        """
+        if Future is None:
+            raise TensorForceError("ActServer requires concurrent.futures (Python >= 3.2).")
+
+        self.agent = agent
+        if max_batch_size is None:
+            max_batch_size = self.agent.model.batching_capacity
+        elif max_batch_size > self.agent.model.batching_capacity:
+            raise TensorForceError("Maximum batch size ({}) exceeds batching capacity ({}).".format(
+                max_batch_size, self.agent.model.batching_capacity
+            ))
+        self.max_batch_size = max_batch_size
+        self.latency_budget = latency_budget
+        self.deterministic = deterministic
+
+        self.requests = queue.Queue()
+        self.deferred = deque()
+        self.client_internals = dict()
+        # Held by the server thread from reading to writing back the internal states of a batch, so a reset
+        # either precedes or follows a request and is not overwritten.
+        self.internals_lock = threading.Lock()
+        self.thread = None
+
+        self.num_requests = 0
+        self.num_batches = 0
+
+    def start(self):
+        """
+        Starts the server thread.
+        """
+        if self.thread is not None:
+            raise TensorForceError("ActServer already started.")
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stops the server thread after processing all submitted requests.
+        """
+        if self.thread is None:
+            return
+        self.requests.put(None)
+        self.thread.join()
+        self.thread = None
+
+    def submit(self, states, client_id=None):
+        """
+        Submits an act request for a single state.
+
+        Args:
+            states (any): One state (usually a value tuple) or dict of states if multiple states are expected.
+            client_id: Hashable client identifier, required to keep internal states per client.
+
+        Returns:
+            Future resolving to the action (or dict of actions) for the given state.
+        """
+        future = Future()
+        if self.agent.unique_state:
+            states = dict(state=states)
+        self.requests.put((client_id, states, future))
+        return future
+
+    def act(self, states, client_id=None, timeout=None):
+        """
+        Submits an act request and waits for its result.
+        """
+        return self.submit(states=states, client_id=client_id).result(timeout=timeout)
+
+    def reset_client(self, client_id):
+        """
+        Resets the internal states of a client (e.g. on episode start).
+        """
+        with self.internals_lock:
+            self.client_internals.pop(client_id, None)
+
+    @property
+    def average_batch_size(self):
+        return self.num_requests / max(self.num_batches, 1)
+
+    def serve(self):
+        """
+        Target function of the server thread.
+        """
+        while True:
+            batch = self.collect_batch()
+            if batch is None:
+                break
+            if len(batch) > 0:
+                self.process_batch(batch=batch)
+
+    def collect_batch(self):
+        """
+        Collects requests until the batch is full or the latency budget of its first request has passed.
+
+        Returns:
+            List of requests, or None if the server should stop.
+        """
+        batch = list()
+        clients = set()
+        # Requests deferred again keep their order relative to all later requests.
+        redeferred = deque()
+        deferred = deque()
+
+        def add(request, deferred):
+            client_id = request[0]
+            if client_id is not None and client_id in clients:
+                # Only one request per client per batch, to process internal states sequentially.
+                deferred.append(request)
+            else:
+                clients.add(client_id)
+                batch.append(request)
+
+        while len(self.deferred) > 0 and len(batch) < self.max_batch_size:
+            add(request=self.deferred.popleft(), deferred=redeferred)
+
+        if len(batch) == 0:
+            request = self.requests.get()
+            if request is None:
+                return None
+            add(request=request, deferred=deferred)
+
+        deadline = time.time() + self.latency_budget
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.time()
+            if timeout <= 0.0:
+                break
+            try:
+                request = self.requests.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if request is None:
+                # Stop after remaining requests are processed.
+                self.requests.put(None)
+                break
+            add(request=request, deferred=deferred)
+
+        redeferred.extend(self.deferred)
+        redeferred.extend(deferred)
+        self.deferred = redeferred
+        return batch
+
+    def process_batch(self, batch):
+        """
+        Computes the actions for a batch of requests via one batched act call and resolves their futures.
+        """
+        with self.internals_lock:
+            actions = self.act_batch(batch=batch)
+        if actions is None:
+            return
+
+        # Futures are resolved without the lock held, so clients can reset their internal states right away.
+        for n, (_, _, future) in enumerate(batch):
+            if self.agent.unique_action:
+                future.set_result(actions['action'][n])
+            else:
+                future.set_result({name: actions[name][n] for name in sorted(actions)})
+
+        self.num_requests += len(batch)
+        self.num_batches += 1
+
+    def act_batch(self, batch):
+        """
+        Runs the batched act call and updates the internal states of the clients (called with the internals lock
+        held).
+
+        Returns:
+            Dict of batched actions, or None if the act call failed (futures are then resolved with the exception).
+        """
+        try:
+            states = {
+                name: np.stack([request[1][name] for request in batch])
+                for name in sorted(batch[0][1])
+            }
+            internals_init = self.agent.model.internals_init
+            internals = {
+                name: np.stack([
+                    self.client_internals.get(request[0], internals_init)[name] for request in batch
+                ]) for name in sorted(internals_init)
+            }
+
+            actions, next_internals, _ = self.agent.model.act(
+                states=states,
+                internals=internals,
+                deterministic=self.deterministic,
+                independent=True
+            )
+
+        except Exception as exception:
+            for _, _, future in batch:
+                future.set_exception(exception)
+            return None
+
+        for n, (client_id, _, _) in enumerate(batch):
+            if client_id is not None and len(next_internals) > 0:
+                self.client_internals[client_id] = {name: next_internals[name][n] for name in next_internals}
+        return actions
@@ -0,0 +1,308 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from inspect import getargspec
+import time
+
+import numpy as np
+from tqdm import tqdm
+
+from tensorforce import TensorForceError
+from tensorforce.execution.parallel_runner import ParallelRunner
+
+
+class AsyncRunner(ParallelRunner):
+    """
+    Runner driving multiple environments from one event loop. Environment steps are in flight concurrently,
+    and whenever environments are waiting for actions, their states are batched into one act call which runs
+    in a worker thread, so environment I/O overlaps with `Agent.act` and slow environments (stragglers) do not
+    hold back the others. Agent calls are serialized in the worker thread, in the order of the per-environment
+    step sequence. Asyncio environments (e.g. AsyncRemoteEnvironment) are awaited directly, synchronous
+    environments run in a thread pool with one thread per environment.
+    """
+
+    def __init__(self, agent, environment, repeat_actions=1, history=None, id_=0, loop=None, latency_history=10000,
+                 statistics=None, timings=None):
+        """
+        Initialize an AsyncRunner object (one Agent/multiple Environments).
+
+        Args:
+            environment (Environment or List[Environment]): Environments, either connected ones with coroutine
+                `reset` and `execute` methods or synchronous ones, each one uses its own parallel buffer of the
+                agent (requires `num_parallel` >= number of environments).
+            id_ (int): The ID of this Runner (for distributed TF runs).
+            loop: Event loop to run on (default: new event loop).
+            latency_history (int): Number of most recent reset/execute latencies recorded per environment.
+        """
+        super(AsyncRunner, self).__init__(agent, environment, repeat_actions, history, id_, statistics, timings)
+
+        self.synchronous = [
+            not asyncio.iscoroutinefunction(environment.execute) for environment in self.environment
+        ]
+        for environment, synchronous in zip(self.environment, self.synchronous):
+            if synchronous == asyncio.iscoroutinefunction(environment.reset):
+                raise TensorForceError("Environment {} mixes coroutine and synchronous methods.".format(environment))
+
+        self.loop = loop or asyncio.new_event_loop()
+        # Single worker thread, to serialize all agent calls.
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        # One thread per synchronous environment.
+        if any(self.synchronous):
+            self.environment_executor = ThreadPoolExecutor(max_workers=sum(self.synchronous))
+        else:
+            self.environment_executor = None
+
+        # Latencies (sec) of the most recent reset and execute calls per environment.
+        self.reset_latencies = [deque(maxlen=latency_history) for _ in self.environment]
+        self.execute_latencies = [deque(maxlen=latency_history) for _ in self.environment]
+
+    def close(self):
+        super(AsyncRunner, self).close()
+        self.executor.shutdown()
+        if self.environment_executor is not None:
+            self.environment_executor.shutdown()
+
+    async def call_environment(self, n, method, **kwargs):
+        """
+        Calls an environment method, in the environment thread pool if the environment is synchronous, and
+        records its latency.
+        """
+        environment = self.environment[n]
+        start = time.time()
+        if self.synchronous[n]:
+            result = await asyncio.get_event_loop().run_in_executor(
+                self.environment_executor, partial(getattr(environment, method), **kwargs)
+            )
+        else:
+            result = await getattr(environment, method)(**kwargs)
+        latency = time.time() - start
+        if method == 'reset':
+            self.reset_latencies[n].append(latency)
+        else:
+            self.execute_latencies[n].append(latency)
+        # Environment calls overlap, so their accumulated time may exceed the wall time.
+        self.timings.add(method, latency)
+        return result
+
+    def timed_act(self, **kwargs):
+        start = time.time()
+        actions = self.act_environments(**kwargs)
+        self.timings.add('act', time.time() - start)
+        return actions
+
+    def timed_observe(self, **kwargs):
+        start = time.time()
+        update_time = self.agent.update_time
+        self.agent.observe(**kwargs)
+        self.timings.add_observe(observe=(time.time() - start), update=(self.agent.update_time - update_time))
+
+    async def reset_environment(self, n):
+        state = await self.call_environment(n=n, method='reset')
+        return n, state, None, None
+
+    async def execute_environment(self, n, action):
+        state, terminal, reward = await self.call_environment(n=n, method='execute', action=action)
+        for _ in range(self.repeat_actions - 1):
+            if terminal:
+                break
+            state, terminal, step_reward = await self.call_environment(n=n, method='execute', action=action)
+            reward += step_reward
+        return n, state, terminal, reward
+
+    def latency_histograms(self, bins=(0.0, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0, float('inf'))):
+        """
+        Returns histograms of the recorded reset and execute latencies per environment, to identify stragglers.
+
+        Args:
+            bins: Bin edges in seconds, or number of bins (see `np.histogram`).
+
+        Returns:
+            List of dicts (one per environment) with `reset` and `execute` tuples of counts and bin edges, and
+            the `mean` and `max` execute latency.
+        """
+        histograms = list()
+        for reset_latencies, execute_latencies in zip(self.reset_latencies, self.execute_latencies):
+            histograms.append(dict(
+                reset=np.histogram(a=np.asarray(reset_latencies), bins=bins),
+                execute=np.histogram(a=np.asarray(execute_latencies), bins=bins),
+                mean=(float(np.mean(execute_latencies)) if len(execute_latencies) > 0 else None),
+                max=(float(np.max(execute_latencies)) if len(execute_latencies) > 0 else None)
+            ))
+        return histograms
+
+    def run(self, num_timesteps=None, num_episodes=None, max_episode_timesteps=None, deterministic=False,
+            episode_finished=None, summary_report=None, summary_interval=None, testing=False, sleep=None):
+        """
+        Runs `run_async` on the runner's event loop until completion.
+        """
+        self.loop.run_until_complete(self.run_async(
+            num_timesteps=num_timesteps,
+            num_episodes=num_episodes,
+            max_episode_timesteps=max_episode_timesteps,
+            deterministic=deterministic,
+            episode_finished=episode_finished,
+            testing=testing
+        ))
+
+    async def run_async(self, num_timesteps=None, num_episodes=None, max_episode_timesteps=None,
+                        deterministic=False, episode_finished=None, testing=False):
+        """
+        Coroutine executing the run, for use within an already running event loop.
+        """
+        # figure out whether we are using the deprecated way of "episode_finished" reporting
+        old_episode_finished = False
+        if episode_finished is not None and len(getargspec(episode_finished).args) == 1:
+            old_episode_finished = True
+
+        loop = asyncio.get_event_loop()
+
+        # Keep track of episode reward and episode length for statistics.
+        self.start_time = time.time()
+
+        self.agent.reset()
+        # Discard unfinished episodes of a previous run, all environments start new episodes.
+        self.agent.reset_buffers()
+
+        if num_episodes is not None:
+            num_episodes += self.agent.episode
+
+        if num_timesteps is not None:
+            num_timesteps += self.agent.timestep
+
+        # Update global counters.
+        self.global_episode = self.agent.episode  # global value (across all agents)
+        self.global_timestep = self.agent.timestep  # global value (across all agents)
+
+        num_environments = len(self.environment)
+        states = [None for _ in range(num_environments)]
+        episode_rewards = [0.0 for _ in range(num_environments)]
+        episode_start_times = [None for _ in range(num_environments)]
+        self.current_timestep = [0 for _ in range(num_environments)]
+
+        # Environment requests in flight (resets yield a terminal value of None).
+        pending = set(
+            asyncio.ensure_future(self.reset_environment(n=n)) for n in range(num_environments)
+        )
+        # Environments waiting for an action, and the act call in progress with its environments.
+        ready = list()
+        act_future = None
+        act_indices = None
+        observe_futures = list()
+
+        with tqdm(total=num_episodes) as pbar:
+            should_stop = False
+            while True:
+                if act_future is None and len(ready) > 0 and not should_stop:
+                    act_indices = ready
+                    ready = list()
+                    act_future = loop.run_in_executor(self.executor, partial(
+                        self.timed_act,
+                        states=[states[n] for n in act_indices],
+                        indices=act_indices,
+                        deterministic=deterministic
+                    ))
+
+                waiting = set(pending)
+                if act_future is not None:
+                    waiting.add(act_future)
+                if len(waiting) == 0:
+                    break
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if act_future in done:
+                    actions = act_future.result()
+                    for i, n in enumerate(act_indices):
+                        pending.add(asyncio.ensure_future(self.execute_environment(n=n, action=actions[i])))
+                    act_future = None
+
+                for future in done & pending:
+                    pending.remove(future)
+                    n, state, terminal, reward = future.result()
+                    states[n] = state
+
+                    if terminal is None:
+                        episode_rewards[n] = 0.0
+                        episode_start_times[n] = time.time()
+                        self.current_timestep[n] = 0
+                        ready.append(n)
+                        continue
+
+                    if max_episode_timesteps is not None and self.current_timestep[n] >= max_episode_timesteps:
+                        terminal = True
+
+                    if not testing:
+                        # Queued before the next act call of this environment.
+                        observe_futures.append(loop.run_in_executor(self.executor, partial(
+                            self.timed_observe, terminal=terminal, reward=reward, index=n
+                        )))
+
+                    self.global_timestep += 1
+                    self.current_timestep[n] += 1
+                    episode_rewards[n] += reward
+
+                    if not terminal:
+                        ready.append(n)
+                        continue
+
+                    # Update our episode stats.
+                    time_passed = time.time() - episode_start_times[n]
+                    self.record_episode(
+                        episode_reward=episode_rewards[n],
+                        episode_timesteps=self.current_timestep[n],
+                        episode_time=time_passed
+                    )
+
+                    self.global_episode += 1
+                    pbar.update(1)
+                    self.report_timings()
+
+                    # Check, whether we should stop this run.
+                    if episode_finished is not None:
+                        # deprecated way (passing in only runner object):
+                        if old_episode_finished:
+                            if not episode_finished(self):
+                                should_stop = True
+                        # new unified way (passing in BaseRunner AND some worker ID):
+                        elif not episode_finished(self, self.id):
+                            should_stop = True
+                    if num_episodes is not None and self.global_episode >= num_episodes:
+                        should_stop = True
+
+                    if num_environments == 1:
+                        # Internal states and stateful preprocessing (single environment only) start anew,
+                        # queued before the next act call.
+                        observe_futures.append(loop.run_in_executor(self.executor, self.agent.reset))
+
+                    if not should_stop:
+                        # Start the next episode of this environment.
+                        pending.add(asyncio.ensure_future(self.reset_environment(n=n)))
+
+                # Raise exceptions of finished observe calls.
+                for future in observe_futures:
+                    if future.done():
+                        future.result()
+                observe_futures = [future for future in observe_futures if not future.done()]
+
+                if (num_timesteps is not None and self.global_timestep >= num_timesteps) or self.agent.should_stop():
+                    should_stop = True
+
+            await asyncio.gather(*observe_futures)
+
+            if num_episodes is not None:
+                pbar.update(max(num_episodes - self.global_episode, 0))
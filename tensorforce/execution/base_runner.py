@@ -17,13 +17,15 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+from tensorforce.execution.statistics import RunStatistics, RunTimings
+
 
 class BaseRunner(object):
     """
     Base class for all runner classes.
     Implements the `run` method.
     """
-    def __init__(self, agent, environment, repeat_actions=1, history=None):
+    def __init__(self, agent, environment, repeat_actions=1, history=None, statistics=None, timings=None):
         """
         Args:
             agent (Agent): Agent object (or list of Agent objects) to use for the run.
@@ -33,6 +35,15 @@ class BaseRunner(object):
                 as a sum in the following call to Agent's `observe` method.
             history (dict): A dictionary containing an already run experiment's results. Keys should be:
                 episode_rewards (list of rewards), episode_timesteps (lengths of episodes), episode_times (run-times)
+            statistics (dict): Episode statistics specification (see `RunStatistics`), with the following
+                attributes (default: none):
+                - capacity: number of most recent episodes kept in memory (default: 100000).
+                - directory: directory to periodically flush all episode statistics to (default: none).
+                - flush_interval: number of episodes per flushed chunk file (default: capacity).
+            timings (dict): Per-phase timings specification (see `RunTimings`), with the following attributes
+                (default: none):
+                - path: local metrics file to periodically append the timings to (default: none).
+                - interval: minimum number of seconds between two metrics file entries (default: 60).
         """
         self.agent = agent
         self.environment = environment
@@ -43,10 +54,15 @@ class BaseRunner(object):
 
         self.start_time = None  # TODO: is this necessary here? global start time (episode?, overall?)
 
-        # lists of episode data (rewards, wall-times/timesteps)
-        self.episode_rewards = None  # list of accumulated episode rewards
-        self.episode_timesteps = None  # list of total timesteps taken in the episodes
-        self.episode_times = None  # list of durations for the episodes
+        # Bounded ring buffers of the most recent episode data (rewards, wall-times/timesteps)
+        self.statistics_spec = statistics or dict()
+        self.statistics = None
+        self.episode_rewards = None  # accumulated episode rewards
+        self.episode_timesteps = None  # total timesteps taken in the episodes
+        self.episode_times = None  # durations for the episodes
+
+        # Accumulated wall time per phase (act, execute, observe, update, ...), available via `timings.summary()`.
+        self.timings = RunTimings(**(timings or dict()))
 
         self.reset(history)
 
@@ -59,12 +75,32 @@ class BaseRunner(object):
             history (dict): A dictionary containing an already run experiment's results. Keys should be:
                 episode_rewards (list of rewards), episode_timesteps (lengths of episodes), episode_times (run-times)
         """
-        if not history:
-            history = dict()
+        # Continue the flushed chunk files of a previous run.
+        start_episode = 0
+        if self.statistics is not None:
+            self.statistics.flush()
+            start_episode = self.statistics.num_flushed
+
+        self.statistics = RunStatistics(history=history, start_episode=start_episode, **self.statistics_spec)
+        self.episode_rewards = self.statistics['episode_rewards']
+        self.episode_timesteps = self.statistics['episode_timesteps']
+        self.episode_times = self.statistics['episode_times']
+
+    def record_episode(self, episode_reward, episode_timesteps, episode_time):
+        """
+        Records the statistics of a finished episode.
+        """
+        self.statistics.append(
+            episode_reward=episode_reward,
+            episode_timesteps=episode_timesteps,
+            episode_time=episode_time
+        )
 
-        self.episode_rewards = history.get("episode_rewards", list())
-        self.episode_timesteps = history.get("episode_timesteps", list())
-        self.episode_times = history.get("episode_times", list())
+    def report_timings(self, force=False):
+        """
+        Appends the per-phase timings to the metrics file, if due (or forced).
+        """
+        self.timings.report(force=force, episode=self.global_episode, timestep=self.global_timestep)
 
     def close(self):
         """
@@ -17,9 +17,12 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+from tensorforce import TensorForceError
 from tensorforce.execution.base_runner import BaseRunner
+from tensorforce.execution.statistics import RingBuffer
 
 import time
+import numpy as np
 from six.moves import xrange
 import warnings
 from inspect import getargspec
@@ -27,27 +30,113 @@ from tqdm import tqdm
 
 class ParallelRunner(BaseRunner):
     """
-    Simple runner for non-realtime single-process execution.
+    Runner for non-realtime single-process execution of multiple environments, where the states of
+    all environments are batched into a single act call per step.
     """
 
-    def __init__(self, agent, environment, repeat_actions=1, history=None, id_=0):
+    def __init__(self, agent, environment, repeat_actions=1, history=None, id_=0, statistics=None, timings=None):
         """
-        Initialize a single Runner object (one Agent/one Environment).
+        Initialize a ParallelRunner object (one Agent/multiple Environments).
 
         Args:
+            environment (Environment or List[Environment]): Environments to execute in parallel, each one
+                uses its own parallel buffer of the agent (requires `num_parallel` >= number of environments).
             id_ (int): The ID of this Runner (for distributed TF runs).
         """
-        super(ParallelRunner, self).__init__(agent, environment, repeat_actions, history)
+        if not isinstance(environment, (list, tuple)):
+            environment = [environment]
+        super(ParallelRunner, self).__init__(agent, list(environment), repeat_actions, history, statistics, timings)
 
         self.id = id_  # the worker's ID in a distributed run (default=0)
-        self.current_timestep = None  # the time step in the current episode
-        self.episode_actions = []
-        self.num_parallel = self.agent.execution['num_parallel']
-        print('ParallelRunner with {} parallel buffers.'.format(self.num_parallel))
+        self.current_timestep = None  # the time step in the current episode, per environment
+        self.episode_actions = RingBuffer(capacity=self.statistics.capacity, dtype=object)
+        self.num_parallel = self.agent.model.num_parallel
+
+        if len(self.environment) > self.num_parallel:
+            raise TensorForceError("Number of environments ({}) exceeds number of parallel buffers ({}).".format(
+                len(self.environment), self.num_parallel
+            ))
+        if len(self.environment) > self.agent.model.batching_capacity:
+            raise TensorForceError("Number of environments ({}) exceeds batching capacity ({}).".format(
+                len(self.environment), self.agent.model.batching_capacity
+            ))
+        if len(self.environment) > 1 and len(self.agent.model.internals_spec) > 0:
+            raise TensorForceError("ParallelRunner does not support models with internal states "
+                                   "for multiple environments.")
+        if len(self.environment) > 1 and any(
+            preprocessing.stateless_index() > 0 for preprocessing in self.agent.model.states_preprocessing.values()
+        ):
+            raise TensorForceError("ParallelRunner does not support stateful states preprocessing "
+                                   "for multiple environments.")
+
+        print('ParallelRunner with {} environments and {} parallel buffers.'.format(
+            len(self.environment), self.num_parallel
+        ))
 
     def close(self):
+        self.statistics.flush()
+        self.report_timings(force=True)
         self.agent.close()
-        self.environment.close()
+        for environment in self.environment:
+            environment.close()
+
+    def batch_states(self, states):
+        """
+        Stacks the states of all environments into one batch.
+
+        Args:
+            states (list): List of states (or dicts of states), one per environment.
+
+        Returns:
+            Batch of states (or dict of batches of states).
+        """
+        if self.agent.unique_state:
+            return np.stack(states)
+        else:
+            return {name: np.stack([state[name] for state in states]) for name in sorted(states[0])}
+
+    def act_environments(self, states, indices, deterministic, batch=None):
+        """
+        Computes the actions of the given environments in one act call. A single environment acts unbatched,
+        with the internal states of its current episode.
+
+        Args:
+            states (list): List of states (or dicts of states), one per environment.
+            indices (list): Parallel buffer indices of the environments.
+            deterministic (bool): Whether actions are computed deterministically.
+            batch: Batch of the states if already available (default: stacked states).
+
+        Returns:
+            List of actions (or dicts of actions), one per environment.
+        """
+        if len(self.environment) == 1:
+            return [self.agent.act(states=states[0], deterministic=deterministic, index=indices[0])]
+        if batch is None:
+            batch = self.batch_states(states)
+        actions = self.agent.act(states=batch, deterministic=deterministic, index=indices)
+        return [self.unbatch_actions(actions=actions, n=i) for i in xrange(len(indices))]
+
+    def unbatch_actions(self, actions, n):
+        """
+        Extracts the action of the environment with the given index from a batch of actions.
+        """
+        if self.agent.unique_action:
+            return actions[n]
+        else:
+            return {name: actions[name][n] for name in sorted(actions)}
+
+    def shared_state_memory(self):
+        """
+        Returns the shared state memory of the environments if all of them write to the same memory, in
+        order of their index, otherwise None.
+        """
+        shared_memory = getattr(self.environment[0], 'shared_memory', None)
+        if shared_memory is None or shared_memory.num_environments != len(self.environment):
+            return None
+        for n, environment in enumerate(self.environment):
+            if getattr(environment, 'shared_memory', None) is not shared_memory or environment.index != n:
+                return None
+        return shared_memory
 
     # TODO: make average reward another possible criteria for runner-termination
     def run(self, num_timesteps=None, num_episodes=None, max_episode_timesteps=None, deterministic=False, episode_finished=None, summary_report=None, summary_interval=None, timesteps=None, episodes=None, testing=False, sleep=None
@@ -77,6 +166,8 @@ class ParallelRunner(BaseRunner):
         self.start_time = time.time()
 
         self.agent.reset()
+        # Discard unfinished episodes of a previous run, all environments start new episodes.
+        self.agent.reset_buffers()
 
         if num_episodes is not None:
             num_episodes += self.agent.episode
@@ -84,72 +175,148 @@ class ParallelRunner(BaseRunner):
         if num_timesteps is not None:
             num_timesteps += self.agent.timestep
 
+        # Update global counters.
+        self.global_episode = self.agent.episode  # global value (across all agents)
+        self.global_timestep = self.agent.timestep  # global value (across all agents)
+
+        # Each environment n acts and observes via parallel buffer n.
+        num_environments = len(self.environment)
+        indices = list(xrange(num_environments))
+
+        # Environments supporting asynchronous requests (e.g. ProcessEnvironment) are stepped concurrently.
+        asynchronous = [hasattr(environment, 'execute_async') for environment in self.environment]
+
+        # If all environments write to one shared state memory, its slots are directly used as batch.
+        shared_memory = self.shared_state_memory()
+        slot = 0
+        start = time.time()
+        for n, environment in enumerate(self.environment):
+            if shared_memory is not None:
+                environment.reset_async(slot=slot)
+            elif asynchronous[n]:
+                environment.reset_async()
+        states = [
+            environment.wait() if asynchronous[n] else environment.reset()
+            for n, environment in enumerate(self.environment)
+        ]
+        self.timings.add('reset', time.time() - start)
+        episode_rewards = [0.0 for _ in indices]
+        episode_start_times = [time.time() for _ in indices]
+        self.current_timestep = [0 for _ in indices]
+
         # add progress bar
         with tqdm(total=num_episodes) as pbar:
-            # episode loop
-            index = 0
-            while True:
-                episode_start_time = time.time()
-                state = self.environment.reset()
-                self.agent.reset()
-
-                # Update global counters.
-                self.global_episode = self.agent.episode  # global value (across all agents)
-                self.global_timestep = self.agent.timestep  # global value (across all agents)
-
-                episode_reward = 0
-                self.current_timestep = 0
-
-                # time step (within episode) loop
-                while True:
-                    action = self.agent.act(states=state, deterministic=deterministic, index=index)
-
-                    reward = 0
-                    for _ in xrange(self.repeat_actions):
-                        state, terminal, step_reward = self.environment.execute(action=action)
-                        reward += step_reward
+            # time step loop (one step of all environments)
+            should_stop = False
+            while not should_stop:
+                if shared_memory is None:
+                    batch = None
+                else:
+                    batch = shared_memory.batch(slot=slot)
+                    slot = (slot + 1) % shared_memory.num_slots
+                start = time.time()
+                actions = self.act_environments(
+                    states=states, indices=indices, deterministic=deterministic, batch=batch
+                )
+                self.timings.add('act', time.time() - start)
+
+                for n, environment in enumerate(self.environment):
+                    if shared_memory is not None:
+                        environment.execute_async(action=actions[n], slot=slot)
+                    elif asynchronous[n]:
+                        environment.execute_async(action=actions[n])
+
+                for n, environment in enumerate(self.environment):
+                    action = actions[n]
+
+                    start = time.time()
+                    if asynchronous[n]:
+                        state, terminal, reward = environment.wait()
+                    else:
+                        state, terminal, reward = environment.execute(action=action)
+                    for _ in xrange(self.repeat_actions - 1):
                         if terminal:
                             break
+                        if shared_memory is None:
+                            state, terminal, step_reward = environment.execute(action=action)
+                        else:
+                            environment.execute_async(action=action, slot=slot)
+                            state, terminal, step_reward = environment.wait()
+                        reward += step_reward
 
-                    if max_episode_timesteps is not None and self.current_timestep >= max_episode_timesteps:
+                    if max_episode_timesteps is not None and self.current_timestep[n] >= max_episode_timesteps:
                         terminal = True
 
+                    execute_end = time.time()
+                    self.timings.add('execute', execute_end - start)
+
+                    update_time = self.agent.update_time
                     if not testing:
-                        self.agent.observe(terminal=terminal, reward=reward, index=index)
+                        self.agent.observe(terminal=terminal, reward=reward, index=n)
+                    self.timings.add_observe(
+                        observe=(time.time() - execute_end),
+                        update=(self.agent.update_time - update_time)
+                    )
 
                     self.global_timestep += 1
-                    self.current_timestep += 1
-                    episode_reward += reward
+                    self.current_timestep[n] += 1
+                    episode_rewards[n] += reward
 
-                    if terminal or self.agent.should_stop():  # TODO: should_stop also terminate?
-                        break
+                    if not terminal:
+                        states[n] = state
+                        continue
 
-                    if sleep is not None:
-                        time.sleep(sleep)
+                    # Update our episode stats.
+                    time_passed = time.time() - episode_start_times[n]
+                    self.record_episode(
+                        episode_reward=episode_rewards[n],
+                        episode_timesteps=self.current_timestep[n],
+                        episode_time=time_passed
+                    )
+                    if hasattr(environment, 'conv_action'):
+                        self.episode_actions.append(environment.conv_action)
 
-                index = (index + 1) % self.num_parallel
+                    self.global_episode += 1
+                    pbar.update(1)
+                    self.report_timings()
 
-                # Update our episode stats.
-                time_passed = time.time() - episode_start_time
-                self.episode_rewards.append(episode_reward)
-                self.episode_timesteps.append(self.current_timestep)
-                self.episode_times.append(time_passed)
-                self.episode_actions.append(self.environment.conv_action)
+                    # Check, whether we should stop this run.
+                    if episode_finished is not None:
+                        # deprecated way (passing in only runner object):
+                        if old_episode_finished:
+                            if not episode_finished(self):
+                                should_stop = True
+                        # new unified way (passing in BaseRunner AND some worker ID):
+                        elif not episode_finished(self, self.id):
+                            should_stop = True
+                    if num_episodes is not None and self.global_episode >= num_episodes:
+                        should_stop = True
 
-                self.global_episode += 1
-                pbar.update(1)
+                    # Start the next episode of this environment.
+                    start = time.time()
+                    if shared_memory is None:
+                        states[n] = environment.reset()
+                    else:
+                        environment.reset_async(slot=slot)
+                        states[n] = environment.wait()
+                    if num_environments == 1:
+                        # Internal states and stateful preprocessing (single environment only) start anew.
+                        self.agent.reset()
+                    self.timings.add('reset', time.time() - start)
+                    episode_rewards[n] = 0.0
+                    episode_start_times[n] = time.time()
+                    self.current_timestep[n] = 0
 
-                # Check, whether we should stop this run.
-                if episode_finished is not None:
-                    # deprecated way (passing in only runner object):
-                    if old_episode_finished:
-                        if not episode_finished(self):
-                            break
-                    # new unified way (passing in BaseRunner AND some worker ID):
-                    elif not episode_finished(self, self.id):
-                        break
-                if (num_episodes is not None and self.global_episode >= num_episodes) or \
-                        (num_timesteps is not None and self.global_timestep >= num_timesteps) or \
-                        self.agent.should_stop():
-                    break
-            pbar.update(num_episodes - self.global_episode)
+                if (num_timesteps is not None and self.global_timestep >= num_timesteps) or self.agent.should_stop():
+                    should_stop = True
+
+                if sleep is not None:
+                    time.sleep(sleep)
+
+            if num_episodes is not None:
+                pbar.update(max(num_episodes - self.global_episode, 0))
+
+    # keep backwards compatibility
+    @property
+    def episode_timestep(self):
+        return self.current_timestep
@@ -30,19 +30,21 @@ class Runner(BaseRunner):
     Simple runner for non-realtime single-process execution.
     """
 
-    def __init__(self, agent, environment, repeat_actions=1, history=None, id_=0):
+    def __init__(self, agent, environment, repeat_actions=1, history=None, id_=0, statistics=None, timings=None):
         """
         Initialize a single Runner object (one Agent/one Environment).
 
         Args:
             id_ (int): The ID of this Runner (for distributed TF runs).
         """
-        super(Runner, self).__init__(agent, environment, repeat_actions, history)
+        super(Runner, self).__init__(agent, environment, repeat_actions, history, statistics, timings)
 
         self.id = id_  # the worker's ID in a distributed run (default=0)
         self.current_timestep = None  # the time step in the current episode
 
     def close(self):
+        self.statistics.flush()
+        self.report_timings(force=True)
         self.agent.close()
         self.environment.close()
 
@@ -89,6 +91,7 @@ class Runner(BaseRunner):
                 episode_start_time = time.time()
                 state = self.environment.reset()
                 self.agent.reset()
+                self.timings.add('reset', time.time() - episode_start_time)
 
                 # Update global counters.
                 self.global_episode = self.agent.episode  # global value (across all agents)
@@ -99,7 +102,9 @@ class Runner(BaseRunner):
 
                 # time step (within episode) loop
                 while True:
+                    start = time.time()
                     action = self.agent.act(states=state, deterministic=deterministic)
+                    act_end = time.time()
 
                     reward = 0
                     for _ in xrange(self.repeat_actions):
@@ -111,8 +116,16 @@ class Runner(BaseRunner):
                     if max_episode_timesteps is not None and self.current_timestep >= max_episode_timesteps:
                         terminal = True
 
+                    execute_end = time.time()
+                    update_time = self.agent.update_time
                     if not testing:
                         self.agent.observe(terminal=terminal, reward=reward)
+                    self.timings.add_step(
+                        act=(act_end - start),
+                        execute=(execute_end - act_end),
+                        observe=(time.time() - execute_end),
+                        update=(self.agent.update_time - update_time)
+                    )
 
                     self.global_timestep += 1
                     self.current_timestep += 1
@@ -126,12 +139,15 @@ class Runner(BaseRunner):
 
                 # Update our episode stats.
                 time_passed = time.time() - episode_start_time
-                self.episode_rewards.append(episode_reward)
-                self.episode_timesteps.append(self.current_timestep)
-                self.episode_times.append(time_passed)
+                self.record_episode(
+                    episode_reward=episode_reward,
+                    episode_timesteps=self.current_timestep,
+                    episode_time=time_passed
+                )
 
                 self.global_episode += 1
                 pbar.update(1)
+                self.report_timings()
 
                 # Check, whether we should stop this run.
                 if episode_finished is not None:
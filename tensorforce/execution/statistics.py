@@ -0,0 +1,308 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from tensorforce import TensorForceError
+
+
+class RingBuffer(object):
+    """
+    Fixed-capacity, array-backed sequence of the most recently appended values, which otherwise behaves like a
+    list of them (appending, `len`, indexing, slicing and iteration), plus rolling statistics over the most
+    recent values.
+    """
+
+    def __init__(self, capacity, dtype=np.float64, values=()):
+        """
+        Ring buffer.
+
+        Args:
+            capacity (int): Maximum number of values kept.
+            dtype: NumPy dtype of the values (object for arbitrary values).
+            values (iterable): Initial values (only the most recent `capacity` values are kept).
+        """
+        if capacity <= 0:
+            raise TensorForceError("Invalid ring buffer capacity: {}.".format(capacity))
+        self.capacity = capacity
+        self.values = np.zeros(shape=(capacity,), dtype=dtype)
+        self.index = 0  # Position of the next value.
+        self.size = 0  # Number of values stored.
+        self.num_appended = 0  # Number of values appended in total.
+        for value in values:
+            self.append(value)
+
+    def append(self, value):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.num_appended += 1
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def to_array(self, window=None):
+        """
+        Returns the most recent `window` values (default: all stored values), oldest first.
+        """
+        size = self.size if window is None else min(window, self.size)
+        indices = (self.index - size + np.arange(size)) % self.capacity
+        return self.values[indices]
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.to_array())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.to_array()[key]
+        if key < -self.size or key >= self.size:
+            raise IndexError("Ring buffer index out of range.")
+        return self.values[(self.index - self.size + key % self.size) % self.capacity]
+
+    def __repr__(self):
+        return repr(list(self.to_array()))
+
+    def mean(self, window=None):
+        return float(np.mean(self.to_array(window=window))) if self.size > 0 else None
+
+    def min(self, window=None):
+        return self.to_array(window=window).min() if self.size > 0 else None
+
+    def max(self, window=None):
+        return self.to_array(window=window).max() if self.size > 0 else None
+
+    def quantile(self, q, window=None):
+        """
+        Returns the q-quantile(s) (0 <= q <= 1) of the most recent `window` values.
+        """
+        return np.percentile(self.to_array(window=window), q=(np.asarray(q) * 100.0)) if self.size > 0 else None
+
+
+class RunStatistics(object):
+    """
+    Per-episode statistics of a runner (reward, timesteps and duration), kept in ring buffers of bounded size,
+    optionally flushed periodically as columnar .npz chunk files so that the complete history is preserved on
+    disk.
+    """
+
+    columns = ('episode_rewards', 'episode_timesteps', 'episode_times')
+    dtypes = dict(episode_rewards=np.float64, episode_timesteps=np.int64, episode_times=np.float64)
+
+    def __init__(self, capacity=100000, directory=None, flush_interval=None, history=None, start_episode=0):
+        """
+        Run statistics.
+
+        Args:
+            capacity (int): Number of most recent episodes kept in memory.
+            directory (str): Directory to flush chunk files to (default: no flushing).
+            flush_interval (int): Number of episodes per chunk file (default: capacity).
+            history (dict): Results of an already run experiment to resume, with lists of values per column.
+            start_episode (int): Number of episodes flushed before the history, to continue chunk numbering.
+        """
+        self.capacity = capacity
+        self.directory = directory
+        self.flush_interval = flush_interval or capacity
+        self.start_episode = start_episode
+        if self.flush_interval > self.capacity:
+            raise TensorForceError("Statistics flush interval exceeds capacity.")
+
+        history = history or dict()
+        self.buffers = {
+            column: RingBuffer(capacity=capacity, dtype=self.dtypes[column], values=history.get(column, ()))
+            for column in self.columns
+        }
+        # Episodes already contained in history are not flushed again.
+        self.num_flushed = start_episode + self.buffers['episode_rewards'].num_appended
+
+        if self.directory is not None and not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def __getitem__(self, column):
+        return self.buffers[column]
+
+    @property
+    def num_episodes(self):
+        """
+        Number of episodes recorded in total, including flushed and history episodes.
+        """
+        return self.start_episode + self.buffers['episode_rewards'].num_appended
+
+    def append(self, episode_reward, episode_timesteps, episode_time):
+        """
+        Records an episode, and flushes a chunk file if flush_interval episodes have not been flushed yet.
+        """
+        self.buffers['episode_rewards'].append(episode_reward)
+        self.buffers['episode_timesteps'].append(episode_timesteps)
+        self.buffers['episode_times'].append(episode_time)
+
+        if self.directory is not None and self.num_episodes - self.num_flushed >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the episodes recorded since the last flush as a chunk file 'episodes-<first episode>.npz'.
+        """
+        if self.directory is None:
+            return
+        num_unflushed = self.num_episodes - self.num_flushed
+        if num_unflushed == 0:
+            return
+        np.savez(
+            os.path.join(self.directory, 'episodes-{:012d}.npz'.format(self.num_flushed)),
+            **{column: self.buffers[column].to_array(window=num_unflushed) for column in self.columns}
+        )
+        self.num_flushed += num_unflushed
+
+    def summary(self, window=100):
+        """
+        Returns mean, min, max and median of each column over the most recent `window` episodes.
+        """
+        summary = dict()
+        for column in self.columns:
+            buffer = self.buffers[column]
+            summary[column] = dict(
+                mean=buffer.mean(window=window),
+                min=buffer.min(window=window),
+                max=buffer.max(window=window),
+                median=buffer.quantile(q=0.5, window=window)
+            )
+        return summary
+
+    @staticmethod
+    def load(directory):
+        """
+        Loads and concatenates all chunk files flushed to the given directory.
+
+        Returns:
+            Dict of arrays per column, which can be passed as history to resume a run.
+        """
+        filenames = sorted(
+            filename for filename in os.listdir(directory)
+            if filename.startswith('episodes-') and filename.endswith('.npz')
+        )
+        chunks = [np.load(os.path.join(directory, filename)) for filename in filenames]
+        return {
+            column: np.concatenate([chunk[column] for chunk in chunks]) if len(chunks) > 0 else np.zeros((0,))
+            for column in RunStatistics.columns
+        }
+
+
+class RunTimings(object):
+    """
+    Accumulated wall time of a runner per phase: environment `reset` (including agent reset), `act`, environment
+    `execute`, `observe` excluding updates, `update` (observe calls which triggered an update) and `save`
+    (checkpointing by the runner). Optionally appends the timings as a JSON line to a local metrics file at
+    most every `interval` seconds.
+    """
+
+    phases = ('reset', 'act', 'execute', 'observe', 'update', 'save')
+
+    def __init__(self, path=None, interval=60.0):
+        """
+        Run timings.
+
+        Args:
+            path (str): Metrics file to append timings to (default: none).
+            interval (float): Minimum number of seconds between two metrics file entries.
+        """
+        self.path = path
+        self.interval = interval
+
+        self.totals = {phase: 0.0 for phase in self.phases}
+        self.counts = {phase: 0 for phase in self.phases}
+        self.start_time = time.time()
+        self.last_write = self.start_time
+        # Runner threads add timings concurrently.
+        self.lock = threading.Lock()
+
+    def add(self, phase, seconds):
+        with self.lock:
+            self.totals[phase] += seconds
+            self.counts[phase] += 1
+
+    def add_step(self, act, execute, observe, update=0.0):
+        """
+        Adds the timings of one timestep, where observe includes update.
+        """
+        with self.lock:
+            self.totals['act'] += act
+            self.counts['act'] += 1
+            self.totals['execute'] += execute
+            self.counts['execute'] += 1
+            self.totals['observe'] += observe - update
+            self.counts['observe'] += 1
+            if update > 0.0:
+                self.totals['update'] += update
+                self.counts['update'] += 1
+
+    def add_observe(self, observe, update=0.0):
+        """
+        Adds the timing of one observe call, which includes update.
+        """
+        with self.lock:
+            self.totals['observe'] += observe - update
+            self.counts['observe'] += 1
+            if update > 0.0:
+                self.totals['update'] += update
+                self.counts['update'] += 1
+
+    def summary(self):
+        """
+        Returns total seconds, number of calls, mean seconds per call and fraction of wall time per phase, and
+        the wall time since the timings were created.
+        """
+        wall_time = max(time.time() - self.start_time, 1e-6)
+        with self.lock:
+            summary = {
+                phase: dict(
+                    total=self.totals[phase],
+                    count=self.counts[phase],
+                    mean=(self.totals[phase] / self.counts[phase] if self.counts[phase] > 0 else 0.0),
+                    fraction=(self.totals[phase] / wall_time)
+                ) for phase in self.phases
+            }
+        summary['wall_time'] = wall_time
+        return summary
+
+    def report(self, force=False, **info):
+        """
+        Appends the timings summary (plus the given info, e.g. episode and timestep counters) as a JSON line to
+        the metrics file, if at least `interval` seconds passed since the last entry or if forced.
+        """
+        if self.path is None:
+            return
+        now = time.time()
+        if not force and now - self.last_write < self.interval:
+            return
+        self.last_write = now
+        entry = dict(info)
+        entry['time'] = now
+        entry['timings'] = self.summary()
+        with open(self.path, 'a') as metrics_file:
+            # NumPy scalars (e.g. counters returned by the model) as Python values.
+            metrics_file.write(json.dumps(entry, default=(lambda value: value.item())) + '\n')
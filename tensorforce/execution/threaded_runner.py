@@ -24,6 +24,8 @@ import threading
 import time
 import warnings
 
+import numpy as np
+
 from tensorforce import TensorForceError
 from tensorforce.execution.base_runner import BaseRunner
 from tensorforce.agents.learning_agent import LearningAgent
@@ -36,7 +38,7 @@ class ThreadedRunner(BaseRunner):
     """
 
     def __init__(self, agent, environment, repeat_actions=1, save_path=None, save_episodes=None, save_frequency=None,
-                 save_frequency_unit=None, agents=None, environments=None):
+                 save_frequency_unit=None, agents=None, environments=None, statistics=None, timings=None):
         """
         Initialize a ThreadedRunner object.
 
@@ -47,6 +49,8 @@ class ThreadedRunner(BaseRunner):
             save_frequency_unit (str): "s" (sec), "t" (timesteps), "e" (episodes)
             agents (List[Agent]): Deprecated: List of Agent objects. Use `agent`, instead.
             environments (List[Environment]): Deprecated: List of Environment objects. Use `environment`, instead.
+            statistics (dict): Episode statistics specification (see `BaseRunner`).
+            timings (dict): Per-phase timings specification (see `BaseRunner`).
         """
         if agents is not None:
             warnings.warn("WARNING: `agents` parameter is deprecated, use `agent` instead.",
@@ -56,7 +60,7 @@ class ThreadedRunner(BaseRunner):
             warnings.warn("WARNING: `environments` parameter is deprecated, use `environments` instead.",
                           category=DeprecationWarning)
             environment = environments
-        super(ThreadedRunner, self).__init__(agent, environment, repeat_actions)
+        super(ThreadedRunner, self).__init__(agent, environment, repeat_actions, statistics=statistics, timings=timings)
 
         if len(agent) != len(environment):
             raise TensorForceError("Each agent must have its own environment. Got {a} agents and {e} environments.".
@@ -81,6 +85,8 @@ class ThreadedRunner(BaseRunner):
         self.time = None
 
     def close(self):
+        self.statistics.flush()
+        self.report_timings(force=True)
         self.agent[0].close()  # only close first agent as we just have one shared model
         for e in self.environment:
             e.close()
@@ -97,12 +103,17 @@ class ThreadedRunner(BaseRunner):
         episodes=None,
         max_timesteps=None,
         testing=False,
-        sleep=None
+        sleep=None,
+        observe_batch_size=None
     ):
         """
         Executes this runner by starting all Agents in parallel (each one in one thread).
 
         Args:
+            observe_batch_size (int): If given, each worker accumulates its transitions locally and inserts them
+                with one atomic observe call per episode end or per observe_batch_size timesteps, instead of one
+                call per timestep (default: none). Timestep- and sequence-based updates are not affected: an
+                atomic observe runs one update per multiple of the update frequency passed by the timestep.
             episodes (int): Deprecated; see num_episodes.
             max_timesteps (int): Deprecated; see max_episode_timesteps.
         """
@@ -138,7 +149,8 @@ class ThreadedRunner(BaseRunner):
                                             "max_episode_timesteps": max_episode_timesteps,
                                             "episode_finished": episode_finished,
                                             "testing": testing,
-                                            "sleep": sleep})
+                                            "sleep": sleep,
+                                            "observe_batch_size": observe_batch_size})
                    for t in range(len(self.agent))]
 
         # Start threads.
@@ -170,10 +182,13 @@ class ThreadedRunner(BaseRunner):
                         do_save = False
 
                     if do_save:
+                        start = time.time()
                         self.agent[0].save_model(self.save_path)
+                        self.timings.add('save', time.time() - start)
                         # Make sure next save is later than right now.
                         while next_save < current:
                             next_save += self.save_frequency
+                self.report_timings()
                 time.sleep(1)
 
         except KeyboardInterrupt:
@@ -186,7 +201,8 @@ class ThreadedRunner(BaseRunner):
         print('All threads stopped')
 
     def _run_single(self, thread_id, agent, environment, deterministic=False,
-                    max_episode_timesteps=-1, episode_finished=None, testing=False, sleep=None):
+                    max_episode_timesteps=-1, episode_finished=None, testing=False, sleep=None,
+                    observe_batch_size=None):
         """
         The target function for a thread, runs an agent and environment until signaled to stop.
         Adds rewards to shared episode rewards list.
@@ -199,6 +215,8 @@ class ThreadedRunner(BaseRunner):
             episode_finished (callable): Function called after each episode that takes an episode summary spec and
                 returns False, if this single run should terminate after this episode.
                 Can be used e.g. to set a particular mean reward threshold.
+            observe_batch_size (int): Number of transitions inserted per atomic observe call (at most, episode
+                ends are always inserted).
         """
 
         # figure out whether we are using the deprecated way of "episode_finished" reporting
@@ -209,16 +227,24 @@ class ThreadedRunner(BaseRunner):
         episode = 0
         # Run this single worker (episode loop) as long as global count thresholds have not been reached.
         while not self.should_stop:
+            start = time.time()
             state = environment.reset()
             agent.reset()
+            self.timings.add('reset', time.time() - start)
             self.global_timestep, self.global_episode = agent.timestep, agent.episode
             episode_reward = 0
 
+            # Transitions accumulated for batched atomic observe calls.
+            transitions = list()
+
             # Time step (within episode) loop
             time_step = 0
             time_start = time.time()
             while True:
-                action, internals, states = agent.act(states=state, deterministic=deterministic, buffered=False)
+                start = time.time()
+                action, _, internals = agent.act(states=state, deterministic=deterministic, buffered=False)
+                act_end = time.time()
+                observed_state = state
                 reward = 0
                 for repeat in xrange(self.repeat_actions):
                     state, terminal, step_reward = environment.execute(action=action)
@@ -226,16 +252,31 @@ class ThreadedRunner(BaseRunner):
                     if terminal:
                         break
 
+                execute_end = time.time()
+                update_time = agent.update_time
                 if not testing:
-                    # agent.observe(reward=reward, terminal=terminal)
-                    # Insert everything at once.
-                    agent.atomic_observe(
-                        states=state,
-                        actions=action,
-                        internals=internals,
-                        reward=reward,
-                        terminal=terminal
-                    )
+                    if observe_batch_size is None:
+                        # agent.observe(reward=reward, terminal=terminal)
+                        # Insert everything at once.
+                        agent.atomic_observe(
+                            states=observed_state,
+                            actions=action,
+                            internals=internals,
+                            reward=reward,
+                            terminal=terminal
+                        )
+                    else:
+                        transitions.append((observed_state, action, internals, reward, terminal))
+                        if terminal or len(transitions) == observe_batch_size or \
+                                time_step + 1 == max_episode_timesteps:
+                            self._atomic_observe_batch(agent=agent, transitions=transitions)
+                            transitions = list()
+                self.timings.add_step(
+                    act=(act_end - start),
+                    execute=(execute_end - act_end),
+                    observe=(time.time() - execute_end),
+                    update=(agent.update_time - update_time)
+                )
 
                 if sleep is not None:
                     time.sleep(sleep)
@@ -248,15 +289,20 @@ class ThreadedRunner(BaseRunner):
 
                 # Abort the episode (discard its results) when global says so.
                 if self.should_stop:
+                    # Insert pending transitions, which are otherwise lost.
+                    if len(transitions) > 0:
+                        self._atomic_observe_batch(agent=agent, transitions=transitions)
                     return
 
             self.global_timestep += time_step
 
             # Avoid race condition where order in episode_rewards won't match order in episode_timesteps.
             self.episode_list_lock.acquire()
-            self.episode_rewards.append(episode_reward)
-            self.episode_timesteps.append(time_step)
-            self.episode_times.append(time.time() - time_start)
+            self.record_episode(
+                episode_reward=episode_reward,
+                episode_timesteps=time_step,
+                episode_time=(time.time() - time_start)
+            )
             self.episode_list_lock.release()
 
             if episode_finished is not None:
@@ -276,6 +322,30 @@ class ThreadedRunner(BaseRunner):
 
             episode += 1
 
+    @staticmethod
+    def _atomic_observe_batch(agent, transitions):
+        """
+        Inserts a list of (states, actions, internals, reward, terminal) transitions with one atomic observe call.
+        """
+        states, actions, internals, reward, terminal = zip(*transitions)
+        if agent.unique_state:
+            states = np.asarray(states)
+        else:
+            states = {name: np.asarray([state[name] for state in states]) for name in states[0]}
+        if agent.unique_action:
+            actions = np.asarray(actions)
+        else:
+            actions = {name: np.asarray([action[name] for action in actions]) for name in actions[0]}
+        internals = {name: np.asarray([internal[name] for internal in internals]) for name in internals[0]}
+
+        agent.atomic_observe(
+            states=states,
+            actions=actions,
+            internals=internals,
+            reward=np.asarray(reward),
+            terminal=np.asarray(terminal)
+        )
+
     # Backwards compatibility for deprecated properties (in case someone directly references these).
     @property
     def agents(self):
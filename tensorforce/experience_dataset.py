@@ -0,0 +1,181 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+from tensorforce import TensorForceError
+
+
+class ExperienceDataset(object):
+    """
+    Columnar on-disk experience dataset, with one column per state/internal/action component plus terminal
+    and reward columns. A dataset is either a directory of .npy files (one per column) or a single uncompressed
+    .npz file, as written by `write` (compressed archives have to be converted to directories via `write`).
+    Columns are read memory-mapped in both cases, and batches are read as contiguous slices, so memory usage is
+    bounded by the batch size.
+
+    Column names are 'states.<name>', 'internals.<name>', 'actions.<name>', 'terminal' and 'reward'.
+    """
+
+    def __init__(self, path):
+        """
+        Opens an experience dataset.
+
+        Args:
+            path (str): Dataset directory or .npz file.
+        """
+        self.path = path
+
+        if os.path.isdir(path):
+            self.columns = dict()
+            for filename in sorted(os.listdir(path)):
+                if filename.endswith('.npy'):
+                    self.columns[filename[:-4]] = np.load(os.path.join(path, filename), mmap_mode='r')
+        elif os.path.isfile(path):
+            self.columns = self.memmap_npz(path=path)
+        else:
+            raise TensorForceError("Experience dataset {} does not exist.".format(path))
+
+        if 'terminal' not in self.columns or 'reward' not in self.columns:
+            raise TensorForceError("Experience dataset requires terminal and reward columns.")
+        self.num_timesteps = self.columns['terminal'].shape[0]
+
+        for name in self.columns:
+            if self.columns[name].shape[0] != self.num_timesteps:
+                raise TensorForceError("Experience dataset column {} has length {}, expected {}.".format(
+                    name, self.columns[name].shape[0], self.num_timesteps
+                ))
+
+    @staticmethod
+    def memmap_npz(path):
+        """
+        Memory-maps the columns of an uncompressed .npz file, which are stored as contiguous .npy files within
+        the archive (`np.load` reads npz columns completely on each access).
+
+        Args:
+            path (str): .npz file.
+
+        Returns:
+            Dict of memory-mapped columns.
+        """
+        columns = dict()
+        with zipfile.ZipFile(path) as archive, open(path, 'rb') as filehandle:
+            for info in archive.infolist():
+                if not info.filename.endswith('.npy'):
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise TensorForceError("Experience dataset {} is compressed, convert it to a directory via "
+                                           "ExperienceDataset.write.".format(path))
+
+                # The local file header (30 bytes) is followed by the file name and extra field.
+                filehandle.seek(info.header_offset)
+                name_length, extra_length = struct.unpack('<HH', filehandle.read(30)[26:30])
+                filehandle.seek(info.header_offset + 30 + name_length + extra_length)
+                if np.lib.format.read_magic(filehandle) == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(filehandle)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(filehandle)
+                if dtype.hasobject:
+                    raise TensorForceError("Experience dataset column {} has object type.".format(info.filename))
+
+                name = info.filename[:-4]
+                if int(np.prod(shape)) == 0:
+                    columns[name] = np.empty(shape=shape, dtype=dtype)
+                else:
+                    columns[name] = np.memmap(
+                        filename=path, dtype=dtype, mode='r', offset=filehandle.tell(), shape=shape,
+                        order=('F' if fortran_order else 'C')
+                    )
+        return columns
+
+    def names(self, kind):
+        """
+        Returns the sorted component names of the given column kind ('states', 'internals' or 'actions').
+        """
+        prefix = kind + '.'
+        return sorted(name[len(prefix):] for name in self.columns if name.startswith(prefix))
+
+    def batches(self, batch_size, start=0, end=None):
+        """
+        Iterates over the dataset in contiguous batches.
+
+        Args:
+            batch_size (int): Number of timesteps per batch (the last batch may be smaller).
+            start (int): First timestep.
+            end (int): End timestep (default: dataset size).
+
+        Returns:
+            Generator of dicts with states, internals, actions, terminal and reward entries.
+        """
+        if end is None:
+            end = self.num_timesteps
+        states = self.names(kind='states')
+        internals = self.names(kind='internals')
+        actions = self.names(kind='actions')
+
+        for index in range(start, end, batch_size):
+            limit = min(index + batch_size, end)
+            yield dict(
+                states={name: self.columns['states.' + name][index: limit] for name in states},
+                internals={name: self.columns['internals.' + name][index: limit] for name in internals},
+                actions={name: self.columns['actions.' + name][index: limit] for name in actions},
+                terminal=self.columns['terminal'][index: limit],
+                reward=self.columns['reward'][index: limit]
+            )
+
+    def __len__(self):
+        return self.num_timesteps
+
+    @staticmethod
+    def write(path, states, internals, actions, terminal, reward):
+        """
+        Writes experience columns to a dataset. Columns can themselves be memory-mapped arrays, so datasets can
+        be converted without loading them completely.
+
+        Args:
+            path (str): Dataset directory, or file path ending with '.npz'.
+            states (dict): Dict of state columns.
+            internals (dict): Dict of internal state columns.
+            actions (dict): Dict of action columns.
+            terminal: Terminal column.
+            reward: Reward column.
+        """
+        columns = dict(terminal=terminal, reward=reward)
+        for kind, components in (('states', states), ('internals', internals), ('actions', actions)):
+            for name, column in components.items():
+                columns[kind + '.' + name] = column
+
+        if path.endswith('.npz'):
+            np.savez(path, **{name: np.asarray(column) for name, column in columns.items()})
+            return
+
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        for name, column in columns.items():
+            column = np.asanyarray(column)
+            array = np.lib.format.open_memmap(
+                filename=os.path.join(path, name + '.npy'), mode='w+', dtype=column.dtype, shape=column.shape
+            )
+            array[:] = column
+            array.flush()
+            del array
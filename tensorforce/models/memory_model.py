@@ -17,6 +17,12 @@ from __future__ import absolute_import
 from __future__ import print_function
 from __future__ import division
 
+import json
+import os
+import threading
+import time
+
+import numpy as np
 import tensorflow as tf
 
 from tensorforce import util, TensorForceError
@@ -64,7 +70,12 @@ class MemoryModel(Model):
             device (str): The name of the device to run the graph of this model on.
             saver (spec): Dict specifying whether and how to save the model's parameters.
             summarizer (spec): Dict specifying which tensorboard summaries should be created and added to the graph.
-            execution (spec): Dict specifying whether and how to do distributed training on the model's graph.
+            execution (spec): Dict specifying whether and how to do distributed training on the model's graph,
+                optionally with a `learner` entry dict(type='thread', replay_ratio=...) to run updates in a
+                background learner thread instead of as part of observe, at the given ratio of retrieved to
+                observed timesteps (or episodes), by default batch_size / frequency of the update mode (None for
+                updates as fast as possible). Updates and the memory stores of observe calls are serialized,
+                so acting proceeds while the learner thread updates, but observing waits for the running update.
             batching_capacity (int): Batching capacity.
             variable_noise (float): The stddev value of a Normal distribution used for adding random
                 noise to the model's output (for each batch, noise can be toggled and - if active - will be resampled).
@@ -76,20 +87,54 @@ class MemoryModel(Model):
             reward_preprocessing (spec): Dict specifying whether and how to preprocess rewards coming
                 from the Environment (e.g. reward normalization).
             update_mode (spec): Update mode.
-            memory (spec): Memory.
+            memory (spec): Memory, optionally with a `raw_states` flag to store states before the stateless
+                part of their preprocessing, which is instead applied to retrieved batches (e.g. to store compact
+                uint8 images instead of processed float images).
             optimizer (spec): Dict specifying the tf optimizer to use for tuning the model's trainable parameters.
             discount (float): The RL reward discount factor (gamma).
         """
         self.update_mode = update_mode
+        if isinstance(memory, dict) and 'raw_states' in memory:
+            memory = dict(memory)
+            self.raw_states = memory.pop('raw_states')
+        else:
+            self.raw_states = False
         self.memory_spec = memory
         self.optimizer_spec = optimizer
 
+        # Background learner thread running updates decoupled from observe.
+        learner = execution.get('learner')
+        if learner is None or learner == 'inline':
+            self.learner_spec = None
+        else:
+            if not isinstance(learner, dict):
+                learner = dict(type=learner)
+            if learner.get('type') != 'thread':
+                raise TensorForceError("Invalid learner: {}.".format(learner))
+            if execution['type'] != 'single':
+                raise TensorForceError("Learner thread requires single execution.")
+            self.learner_spec = learner
+        self.learner_update_output = None
+        self.learner_thread = None
+        self.learner_condition = threading.Condition()
+        # Serializes update and observe session calls, which read and write the same memory variables.
+        self.learner_lock = threading.Lock()
+        self.learner_stop = False
+        self.learner_exception = None
+        self.learner_start_time = None
+        self.num_observed_timesteps = 0
+        self.num_observed_episodes = 0
+        self.num_updates = 0
+        self.update_time = 0.0
+
         # Discount
         assert discount is None or discount >= 0.0
         self.discount = discount
 
         self.memory = None
         self.optimizer = None
+        # Timestep up to which update points were counted by atomic observes.
+        self.update_timestep = None
 
         self.fn_discounted_cumulative_reward = None
         self.fn_reference = None
@@ -99,6 +144,13 @@ class MemoryModel(Model):
         self.fn_optimization = None
         self.fn_import_experience = None
 
+        # Chunked read/assign operations per memory variable, for saving/restoring the memory content.
+        self.memory_chunk_start = None
+        self.memory_chunk_end = None
+        self.memory_chunk_read = None
+        self.memory_chunk_value = None
+        self.memory_chunk_assign = None
+
         super(MemoryModel, self).__init__(
             states=states,
             actions=actions,
@@ -114,6 +166,78 @@ class MemoryModel(Model):
             reward_preprocessing=reward_preprocessing
         )
 
+        if self.learner_spec is not None:
+            self.learner_start_time = time.time()
+            self.learner_thread = threading.Thread(target=self.run_learner)
+            self.learner_thread.daemon = True
+            self.learner_thread.start()
+
+    def setup_deferred_preprocessing(self):
+        """
+        Determines per state the point in its preprocessing stack from which on all preprocessors are stateless
+        and the state is most compact. States are buffered and stored in memory in this form, and the remaining
+        preprocessors are applied to batches retrieved from memory.
+        """
+        for name in sorted(self.states_preprocessing):
+            preprocessing = self.states_preprocessing[name]
+            num_preprocessors = len(preprocessing.preprocessors)
+            best_index = num_preprocessors
+            best_size = self.state_bytes(*self.buffered_state_spec(name=name))
+
+            for index in range(preprocessing.stateless_index(), num_preprocessors):
+                self.deferred_preprocessing[name] = index
+                size = self.state_bytes(*self.buffered_state_spec(name=name))
+                if size < best_size:
+                    best_index = index
+                    best_size = size
+
+            if best_index < num_preprocessors:
+                self.deferred_preprocessing[name] = best_index
+            else:
+                self.deferred_preprocessing.pop(name, None)
+
+    @staticmethod
+    def state_bytes(shape, dtype):
+        return util.prod(shape) * np.dtype(util.np_dtype(dtype)).itemsize
+
+    def transition_bytes(self):
+        """
+        Returns the number of bytes per transition stored in memory, with fully processed states and with states
+        as actually stored (which differs if the memory `raw_states` flag is set).
+
+        Returns:
+            Dict with processed and stored number of bytes.
+        """
+        size = self.state_bytes(shape=(), dtype='bool') + self.state_bytes(shape=(), dtype='float')
+        for spec in (self.internals_spec, self.actions_spec):
+            for name in sorted(spec):
+                size += self.state_bytes(shape=spec[name]['shape'], dtype=spec[name]['type'])
+
+        processed = stored = size
+        for name in sorted(self.states_spec):
+            processed += self.state_bytes(shape=self.states_spec[name]['shape'], dtype=self.states_spec[name]['type'])
+            stored += self.state_bytes(*self.buffered_state_spec(name=name))
+
+        return dict(processed=processed, stored=stored)
+
+    def process_deferred_states(self, states):
+        """
+        Applies the deferred part of the preprocessing to a batch of states retrieved from memory.
+
+        Args:
+            states (dict): Dict of stored state tensors.
+
+        Returns: Dict of processed state tensors.
+        """
+        states = dict(states)
+        for name in sorted(self.deferred_preprocessing):
+            index = self.deferred_preprocessing[name]
+            state = states[name]
+            if index == 0 and self.states_spec[name]['unprocessed_type'] == 'uint8':
+                state = tf.to_float(x=state)
+            states[name] = self.states_preprocessing[name].process(tensor=state, start=index)
+        return states
+
     def as_local_model(self):
         """
         Makes sure our optimizer is wrapped into the global_optimizer meta. This is only relevant for distributed RL.
@@ -132,10 +256,16 @@ class MemoryModel(Model):
         custom_getter = super(MemoryModel, self).setup_components_and_tf_funcs(custom_getter)
 
         # Memory
+        if self.raw_states:
+            self.setup_deferred_preprocessing()
+        memory_states = dict()
+        for name in sorted(self.states_spec):
+            shape, dtype = self.buffered_state_spec(name=name)
+            memory_states[name] = dict(self.states_spec[name], shape=shape, type=dtype)
         self.memory = Memory.from_spec(
             spec=self.memory_spec,
             kwargs=dict(
-                states=self.states_spec,
+                states=memory_states,
                 internals=self.internals_spec,
                 actions=self.actions_spec,
                 summary_labels=self.summary_labels
@@ -194,6 +324,14 @@ class MemoryModel(Model):
         super(MemoryModel, self).tf_initialize()
         self.memory.initialize()
 
+        self.update_timestep = tf.get_variable(
+            name='update-timestep',
+            shape=(),
+            dtype=tf.int64,
+            initializer=tf.constant_initializer(value=0, dtype=tf.int64),
+            trainable=False
+        )
+
     #def tf_discounted_cumulative_reward(self, terminal, reward, discount, final_reward=0.0):
     #    """
     #    Creates the TensorFlow operations for calculating the discounted cumulative rewards
@@ -405,6 +543,8 @@ class MemoryModel(Model):
         # Returns no-op.
         updated = self.memory.update_batch(loss_per_instance=loss_per_instance)
         with tf.control_dependencies(control_inputs=(updated,)):
+            # Importance weighting of the batch instances, if provided by the memory.
+            loss_per_instance = self.memory.weight_losses(loss_per_instance=loss_per_instance)
             loss = tf.reduce_mean(input_tensor=loss_per_instance, axis=0)
 
             # Loss without regularization summary.
@@ -490,10 +630,11 @@ class MemoryModel(Model):
         )
         return self.optimizer.minimize(**arguments)
 
-    def tf_observe_timestep(self, states, internals, actions, terminal, reward):
+    def tf_observe_timestep(self, states, internals, actions, terminal, reward, count_updates=False):
         """
         Creates and returns the op that - if frequency condition is hit - pulls a batch from the memory
-        and does one optimization step.
+        and does one optimization step. If count_updates is set, timestep- and sequence-based updates run once
+        per multiple of the update frequency which the timestep passed since the last atomic observe.
         """
         # Store timestep in memory
         stored = self.memory.store(
@@ -504,6 +645,10 @@ class MemoryModel(Model):
             reward=reward
         )
 
+        if self.learner_spec is not None:
+            # Optimization runs in the learner thread.
+            return stored
+
         # Periodic optimization
         with tf.control_dependencies(control_inputs=(stored,)):
             unit = self.update_mode['unit']
@@ -549,29 +694,99 @@ class MemoryModel(Model):
             else:
                 raise TensorForceError("Invalid update unit: {}.".format(unit))
 
-            def true_fn():
+            num_updates = 1
+            if count_updates and unit != 'episodes':
+                # Update points passed since the last atomic observe, at or after the first possible update.
                 if unit == 'timesteps':
-                    # Timestep-based batch
-                    batch = self.memory.retrieve_timesteps(n=batch_size)
-                elif unit == 'episodes':
-                    # Episode-based batch
-                    batch = self.memory.retrieve_episodes(n=batch_size)
-                elif unit == 'sequences':
-                    # Timestep-sequence-based batch
-                    batch = self.memory.retrieve_sequences(n=batch_size, sequence_length=sequence_length)
-
-                # Do not calculate gradients for memory-internal operations.
-                batch = util.map_tensors(
-                    fn=(lambda tensor: tf.stop_gradient(input=tensor)),
-                    tensors=batch
+                    first_timestep = max(batch_size, first_update)
+                else:
+                    first_timestep = max(batch_size + self.update_mode.get('length', 8) - 1, first_update)
+                previous_timestep = tf.maximum(x=self.update_timestep, y=(first_timestep - 1))
+                num_updates = tf.maximum(
+                    x=(self.timestep // frequency - previous_timestep // frequency),
+                    y=tf.zeros_like(tensor=self.timestep)
                 )
+                with tf.control_dependencies(control_inputs=(num_updates,)):
+                    assignment = tf.assign(
+                        ref=self.update_timestep,
+                        value=tf.maximum(x=self.update_timestep, y=self.timestep)
+                    )
+                with tf.control_dependencies(control_inputs=(assignment,)):
+                    num_updates = tf.to_int32(x=num_updates)
+                    optimize = tf.greater(x=num_updates, y=0)
 
-                optimize = self.fn_optimization(**batch)
+            def true_fn():
+                optimize = self.update_from_memory(num_updates=num_updates)
                 with tf.control_dependencies(control_inputs=(optimize,)):
                     return tf.logical_and(x=True, y=True)
 
             return tf.cond(pred=optimize, true_fn=true_fn, false_fn=tf.no_op)
 
+    def update_from_memory(self, num_updates=1):
+        """
+        Creates the op which retrieves a batch from memory according to the update mode, and does one
+        optimization step, or `repeat_update` consecutive retrieval and optimization steps in a TensorFlow while
+        loop.
+
+        Args:
+            num_updates: Number of consecutive updates (int, or 0D int tensor of a value of at least 1).
+        """
+        unit = self.update_mode['unit']
+        batch_size = self.update_mode['batch_size']
+        repeat_update = self.update_mode.get('repeat_update', 1)
+
+        def update():
+            if unit == 'timesteps':
+                # Timestep-based batch
+                batch = self.memory.retrieve_timesteps(n=batch_size)
+            elif unit == 'episodes':
+                # Episode-based batch
+                batch = self.memory.retrieve_episodes(n=batch_size)
+            elif unit == 'sequences':
+                # Timestep-sequence-based batch
+                sequence_length = self.update_mode.get('length', 8)
+                batch = self.memory.retrieve_sequences(n=batch_size, sequence_length=sequence_length)
+            else:
+                raise TensorForceError("Invalid update unit: {}.".format(unit))
+
+            # Do not calculate gradients for memory-internal operations.
+            batch = util.map_tensors(
+                fn=(lambda tensor: tf.stop_gradient(input=tensor)),
+                tensors=batch
+            )
+
+            if len(self.deferred_preprocessing) > 0:
+                batch['states'] = self.process_deferred_states(states=batch['states'])
+                if 'next_states' in batch:
+                    batch['next_states'] = self.process_deferred_states(states=batch['next_states'])
+
+            return self.fn_optimization(**batch)
+
+        # First step outside of the loop, so optimizer variables are created outside of the loop context.
+        optimization = update()
+
+        num_steps = num_updates * repeat_update
+        if not isinstance(num_steps, int) or num_steps > 1:
+            def body(iteration):
+                optimization = update()
+                with tf.control_dependencies(control_inputs=(optimization,)):
+                    return iteration + 1
+
+            def cond(iteration):
+                return iteration < num_steps - 1
+
+            with tf.control_dependencies(control_inputs=(optimization,)):
+                iteration = tf.constant(value=0, dtype=util.tf_dtype('int'))
+                optimization = tf.while_loop(
+                    cond=cond,
+                    body=body,
+                    loop_vars=(iteration,),
+                    back_prop=False,
+                    parallel_iterations=1
+                )
+
+        return optimization
+
     def tf_import_experience(self, states, internals, actions, terminal, reward):
         """
         Imports experiences into the TensorFlow memory structure. Can be used to import
@@ -593,9 +808,9 @@ class MemoryModel(Model):
         )
 
     def create_operations(self, states, internals, actions, terminal, reward, deterministic, independent, index):
-        # Import experience operation.
+        # Import experience operation (states are stored as buffered).
         self.import_experience_output = self.fn_import_experience(
-            states=states,
+            states={name: self.buffered_states.get(name, states[name]) for name in states},
             internals=internals,
             actions=actions,
             terminal=terminal,
@@ -613,6 +828,40 @@ class MemoryModel(Model):
             index=index
         )
 
+        if self.learner_spec is not None:
+            self.learner_update_output = self.update_from_memory()
+
+        # Memory save/restore operations (created last, so all memory variables exist).
+        self.create_memory_chunk_operations()
+
+    def create_memory_chunk_operations(self):
+        """
+        Creates operations to read and assign chunks [start, end) along the first dimension of every memory
+        variable, which are used to save and restore the memory content without a single huge fetch/feed.
+        """
+        with tf.name_scope(name='memory-chunks'):
+            self.memory_chunk_start = tf.placeholder(dtype=util.tf_dtype('int'), shape=(), name='start')
+            self.memory_chunk_end = tf.placeholder(dtype=util.tf_dtype('int'), shape=(), name='end')
+            self.memory_chunk_read = dict()
+            self.memory_chunk_value = dict()
+            self.memory_chunk_assign = dict()
+
+            for name in sorted(self.memory.variables):
+                variable = self.memory.variables[name]
+                shape = tuple(variable.get_shape().as_list())
+                self.memory_chunk_value[name] = tf.placeholder(
+                    dtype=variable.dtype.base_dtype,
+                    shape=(shape if len(shape) == 0 else (None,) + shape[1:])
+                )
+                if len(shape) == 0:
+                    self.memory_chunk_read[name] = tf.identity(input=variable)
+                    self.memory_chunk_assign[name] = tf.assign(ref=variable, value=self.memory_chunk_value[name])
+                else:
+                    self.memory_chunk_read[name] = variable[self.memory_chunk_start: self.memory_chunk_end]
+                    self.memory_chunk_assign[name] = variable[self.memory_chunk_start: self.memory_chunk_end].assign(
+                        value=self.memory_chunk_value[name]
+                    )
+
     def get_variables(self, include_submodules=False, include_nontrainable=False):
         model_variables = super(MemoryModel, self).get_variables(
             include_submodules=include_submodules,
@@ -632,6 +881,19 @@ class MemoryModel(Model):
 
         return model_variables
 
+    def get_unsaved_variables(self):
+        return super(MemoryModel, self).get_unsaved_variables() + [self.update_timestep] + \
+            self.memory.get_unsaved_variables()
+
+    def rebuild_unsaved_variables(self):
+        # Update points up to the restored timestep count as passed.
+        assignment = tf.assign(ref=self.update_timestep, value=self.timestep)
+        return tf.group(
+            super(MemoryModel, self).rebuild_unsaved_variables(),
+            assignment,
+            self.memory.rebuild_unsaved_variables()
+        )
+
     def import_experience(self, states, internals, actions, terminal, reward):
         """
         Stores experiences.
@@ -647,3 +909,259 @@ class MemoryModel(Model):
         )
 
         self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
+
+    def save_memory(self, directory, chunk_size=65536):
+        """
+        Saves the memory content to the given directory, as one memory-mappable .npy file per memory variable
+        plus a json manifest. Variables are transferred in chunks of the given size along their first dimension,
+        so memory usage stays bounded independent of the memory capacity.
+
+        Args:
+            directory: Directory to save the memory to (created if not existing).
+            chunk_size: Number of rows per transferred chunk.
+
+        Returns:
+            Path of the manifest file.
+        """
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        manifest = dict(memory=type(self.memory).__name__, variables=dict())
+        # Consistent snapshot with respect to the learner thread.
+        with self.learner_lock:
+            for n, name in enumerate(sorted(self.memory.variables)):
+                variable = self.memory.variables[name]
+                shape = tuple(variable.get_shape().as_list())
+                dtype = np.dtype(variable.dtype.base_dtype.as_numpy_dtype)
+                filename = 'memory-{}.npy'.format(n)
+                array = np.lib.format.open_memmap(
+                    filename=os.path.join(directory, filename), mode='w+', dtype=dtype, shape=shape
+                )
+
+                if len(shape) == 0:
+                    array[()] = self.session.run(fetches=self.memory_chunk_read[name])
+                else:
+                    for start in range(0, shape[0], chunk_size):
+                        end = min(start + chunk_size, shape[0])
+                        array[start: end] = self.session.run(
+                            fetches=self.memory_chunk_read[name],
+                            feed_dict={self.memory_chunk_start: start, self.memory_chunk_end: end}
+                        )
+                array.flush()
+                del array
+
+                manifest['variables'][name] = dict(file=filename, shape=list(shape), dtype=dtype.str)
+
+        path = os.path.join(directory, 'memory.json')
+        with open(path, 'w') as filehandle:
+            json.dump(obj=manifest, fp=filehandle, indent=2, sort_keys=True)
+        return path
+
+    def restore_memory(self, directory, chunk_size=65536):
+        """
+        Restores the memory content from a directory written by `save_memory`. The memory needs to be of the
+        same type and capacity. Files are memory-mapped and assigned in chunks.
+
+        Args:
+            directory: Directory containing the saved memory.
+            chunk_size: Number of rows per transferred chunk.
+        """
+        with open(os.path.join(directory, 'memory.json'), 'r') as filehandle:
+            manifest = json.load(fp=filehandle)
+
+        if manifest['memory'] != type(self.memory).__name__:
+            raise TensorForceError("Saved memory of type {} does not match memory of type {}.".format(
+                manifest['memory'], type(self.memory).__name__
+            ))
+        if set(manifest['variables']) != set(self.memory.variables):
+            raise TensorForceError("Saved memory variables do not match memory variables.")
+
+        with self.learner_lock:
+            for name in sorted(self.memory.variables):
+                variable = self.memory.variables[name]
+                shape = tuple(variable.get_shape().as_list())
+                array = np.load(os.path.join(directory, manifest['variables'][name]['file']), mmap_mode='r')
+                if array.shape != shape:
+                    raise TensorForceError("Saved memory variable {} has shape {}, expected {}.".format(
+                        name, array.shape, shape
+                    ))
+
+                if len(shape) == 0:
+                    self.session.run(
+                        fetches=self.memory_chunk_assign[name],
+                        feed_dict={self.memory_chunk_value[name]: array[()]}
+                    )
+                else:
+                    for start in range(0, shape[0], chunk_size):
+                        end = min(start + chunk_size, shape[0])
+                        self.session.run(
+                            fetches=self.memory_chunk_assign[name].op,
+                            feed_dict={
+                                self.memory_chunk_start: start,
+                                self.memory_chunk_end: end,
+                                self.memory_chunk_value[name]: array[start: end]
+                            }
+                        )
+                del array
+
+    def observe(self, terminal, reward, index=0):
+        if self.learner_spec is None:
+            return super(MemoryModel, self).observe(terminal=terminal, reward=reward, index=index)
+
+        with self.learner_lock:
+            episode = super(MemoryModel, self).observe(terminal=terminal, reward=reward, index=index)
+        self.notify_learner(terminal=terminal)
+        return episode
+
+    def atomic_observe(self, states, actions, internals, terminal, reward, index=0):
+        if self.learner_spec is None:
+            return super(MemoryModel, self).atomic_observe(
+                states=states,
+                actions=actions,
+                internals=internals,
+                terminal=terminal,
+                reward=reward,
+                index=index
+            )
+
+        with self.learner_lock:
+            episode = super(MemoryModel, self).atomic_observe(
+                states=states,
+                actions=actions,
+                internals=internals,
+                terminal=terminal,
+                reward=reward,
+                index=index
+            )
+        self.notify_learner(terminal=terminal)
+        return episode
+
+    def update_due(self, timestep, episode, terminal):
+        # Python counterpart of the update condition of tf_observe_timestep.
+        if self.learner_spec is not None:
+            return False
+
+        unit = self.update_mode['unit']
+        batch_size = self.update_mode['batch_size']
+        frequency = self.update_mode.get('frequency', batch_size)
+        first_update = self.update_mode.get('first_update', 0)
+
+        if unit == 'episodes':
+            return episode % frequency == 0 and np.any(terminal) and episode >= max(batch_size, first_update)
+        elif unit == 'sequences':
+            batch_size += self.update_mode.get('length', 8) - 1
+        return timestep % frequency == 0 and timestep >= max(batch_size, first_update)
+
+    def close(self):
+        if self.learner_thread is not None:
+            with self.learner_condition:
+                self.learner_stop = True
+                self.learner_condition.notify()
+            self.learner_thread.join()
+            self.learner_thread = None
+        super(MemoryModel, self).close()
+
+    def notify_learner(self, terminal):
+        """
+        Counts observed timesteps and episodes, and wakes up the learner thread.
+        """
+        if self.learner_exception is not None:
+            exception = self.learner_exception
+            self.learner_exception = None
+            raise exception
+        terminal = np.asarray(terminal)
+        with self.learner_condition:
+            self.num_observed_timesteps += int(terminal.size)
+            self.num_observed_episodes += int(np.count_nonzero(terminal))
+            self.learner_condition.notify()
+
+    def learner_ready(self):
+        """
+        Whether the learner thread should run another update, based on the number of observed units of the
+        update mode and the replay ratio.
+        """
+        unit = self.update_mode['unit']
+        batch_size = self.update_mode['batch_size']
+        frequency = self.update_mode.get('frequency', batch_size)
+        first_update = self.update_mode.get('first_update', 0)
+
+        if unit == 'episodes':
+            num_observed = self.num_observed_episodes
+            num_required = batch_size
+        else:
+            num_observed = self.num_observed_timesteps
+            num_required = batch_size
+            if unit == 'sequences':
+                num_required += self.update_mode.get('length', 8) - 1
+        if num_observed < max(num_required, first_update):
+            return False
+
+        # Default replay ratio corresponds to the update frequency of inline updates.
+        replay_ratio = self.learner_spec.get('replay_ratio', batch_size / frequency)
+        if replay_ratio is None:
+            return True
+        return self.num_updates * self.update_mode.get('repeat_update', 1) * batch_size < \
+            replay_ratio * num_observed
+
+    def run_learner(self):
+        """
+        Learner thread loop, which runs updates whenever ready until the model is closed.
+        """
+        while True:
+            with self.learner_condition:
+                while not self.learner_stop and not self.learner_ready():
+                    self.learner_condition.wait()
+                if self.learner_stop:
+                    return
+
+            try:
+                with self.learner_lock:
+                    start_time = time.time()
+                    self.session.run(fetches=self.learner_update_output)
+                    update_time = time.time() - start_time
+            except Exception as exception:
+                # Re-raised by the next observe call.
+                self.learner_exception = exception
+                return
+
+            with self.learner_condition:
+                self.update_time += update_time
+                self.num_updates += 1
+
+    def learner_statistics(self):
+        """
+        Returns acting and learning throughput of the background learner thread.
+
+        Returns:
+            Dict with the number of observed timesteps/episodes and updates, observed timesteps, updates and
+            retrieved timesteps per second since the model was created, the actual replay ratio of retrieved to
+            observed units, and the total time spent in updates.
+        """
+        if self.learner_spec is None:
+            raise TensorForceError("Learner statistics require a learner thread.")
+
+        with self.learner_condition:
+            num_observed_timesteps = self.num_observed_timesteps
+            num_observed_episodes = self.num_observed_episodes
+            num_updates = self.num_updates
+            update_time = self.update_time
+
+        unit = self.update_mode['unit']
+        batch_size = self.update_mode['batch_size']
+        elapsed_time = max(time.time() - self.learner_start_time, util.epsilon)
+        num_observed = num_observed_episodes if unit == 'episodes' else num_observed_timesteps
+        num_batches = num_updates * self.update_mode.get('repeat_update', 1)
+        num_retrieved = num_batches * batch_size
+        if unit == 'sequences':
+            num_retrieved *= self.update_mode.get('length', 8)
+
+        return dict(
+            observed_timesteps=num_observed_timesteps,
+            observed_episodes=num_observed_episodes,
+            updates=num_batches,
+            timesteps_per_second=(num_observed_timesteps / elapsed_time),
+            updates_per_second=(num_batches / elapsed_time),
+            retrieved_per_second=(num_retrieved / elapsed_time),
+            replay_ratio=(num_batches * batch_size / max(num_observed, 1)),
+            update_time=update_time
+        )
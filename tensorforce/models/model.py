@@ -18,6 +18,7 @@ from __future__ import print_function
 from __future__ import division
 
 from copy import deepcopy
+import json
 import os
 
 import numpy as np
@@ -99,6 +100,10 @@ class Model(object):
                 offline-debug session into the given directory.
             execution: (dict)
                 - num_parallel: (int) number of parallel episodes
+                - buffering: (str) where act records are buffered until observe, 'graph' (default) for variables of
+                  size num_parallel x batching_capacity, 'host' for NumPy staging of the actually outstanding steps
+                - learner: (str or dict) 'inline' (default) for updates as part of observe, or dict(type='thread',
+                  replay_ratio=...) for updates in a background learner thread (memory models only)
         """
         # Network crated from network in distribution_model.py
         # Needed for named_tensor access
@@ -145,21 +150,40 @@ class Model(object):
         # For offline debugging purposes. Off by default.
         self.tf_session_dump_dir = tf_session_dump_dir
 
+        # Precompiled act calls via the raw session (bypassing monitored session hooks, which are still run by
+        # observe/update calls), opt-in and not used for distributed execution or session dumping.
+        self.act_fast_path = self.execution_spec.get('act_fast_path', False) and \
+            self.execution_type == 'single' and self.tf_session_dump_dir == ''
+        self.act_callables = dict()
+
         # Model's (tensorflow) buffers (states, actions, internals):
         # One record is inserted into these buffers when act(independent=False) method is called.
         self.num_parallel = self.execution_spec.get('num_parallel')
         if self.num_parallel is None:
             self.num_parallel = 1
 
+        # Act records are either buffered in graph variables, or staged on the host and fed to observe.
+        self.buffering = self.execution_spec.get('buffering', 'graph')
+        if self.buffering not in ('graph', 'host'):
+            raise TensorForceError("Invalid buffering mode: {}.".format(self.buffering))
+        self.list_host_buffer = [self.empty_host_buffer() for _ in range(self.num_parallel)]
+        self.buffered_states_input = dict()
+        self.act_buffered_states = dict()
+
         # self.list_states_buffer = [dict() for _ in range(self.num_parallel)]
         # self.list_internals_buffer = [dict() for _ in range(self.num_parallel)]
         # self.list_actions_buffer = [dict() for _ in range(self.num_parallel)]
         self.list_states_buffer = dict()
         self.list_internals_buffer = dict()
+        # States buffered before the deferred part of their preprocessing, which is instead applied on retrieval
+        # from memory: index of the first deferred preprocessor and buffered state tensor per state name.
+        self.deferred_preprocessing = dict()
+        self.buffered_states = dict()
         self.list_actions_buffer = dict()
         self.list_buffer_index = [None for _ in range(self.num_parallel)]
         self.episode_output = None
         self.episode_index_input = None
+        self.episode_indices_input = None
         # else:
         #     self.states_buffer = dict()
         #     self.internals_buffer = dict()
@@ -230,6 +254,8 @@ class Model(object):
         self.timestep_output = None
         # Add an explicit reset op with no dependencies
         self.list_buffer_index_reset_op = None
+        # Rebuilds variables not saved in checkpoints after a restore.
+        self.unsaved_variables_rebuild_op = None
 
         # Setup Model (create and build graph (local and global if distributed), server, session, etc..).
         self.setup()
@@ -312,6 +338,8 @@ class Model(object):
                     index=episode_index
                 )
 
+                self.unsaved_variables_rebuild_op = self.rebuild_unsaved_variables()
+
                 # Add all summaries specified in summary_labels
                 if 'inputs' in self.summary_labels or 'states' in self.summary_labels:
                     for name in sorted(states):
@@ -495,6 +523,12 @@ class Model(object):
                 self.states_spec[name]['shape'] = preprocessing.processed_shape(shape=self.states_spec[name]['unprocessed_shape'])
                 self.states_preprocessing[name] = preprocessing
 
+        # Compact uint8 states are converted to float before preprocessing.
+        for name in sorted(self.states_spec):
+            self.states_spec[name]['unprocessed_type'] = self.states_spec[name]['type']
+            if self.states_spec[name]['type'] == 'uint8':
+                self.states_spec[name]['type'] = 'float'
+
         # Actions
         for name in sorted(self.actions_spec):
             self.actions_input[name] = tf.placeholder(
@@ -607,10 +641,14 @@ class Model(object):
         """
         if self.execution_type == "single":
             global_variables = self.get_variables(include_submodules=True, include_nontrainable=True)
+            unsaved_variables = self.get_unsaved_variables()
         else:
             global_variables = self.global_model.get_variables(include_submodules=True, include_nontrainable=True)
+            unsaved_variables = self.global_model.get_unsaved_variables()
 
         # global_variables += [self.global_episode, self.global_timestep]
+        unsaved_variables = set(id(variable) for variable in unsaved_variables)
+        global_variables = [variable for variable in global_variables if id(variable) not in unsaved_variables]
 
         for c in self.get_savable_components():
             c.register_saver_ops()
@@ -699,7 +737,7 @@ class Model(object):
                 if file is not None:
                     try:
                         scaffold.saver.restore(sess=session, save_path=file)
-                        session.run(fetches=self.list_buffer_index_reset_op)
+                        session.run(fetches=(self.list_buffer_index_reset_op, self.unsaved_variables_rebuild_op))
                     except tf.errors.NotFoundError:
                         raise TensorForceError("Error: Existing checkpoint could not be loaded! Set \"load\" to false in saver_spec.")
 
@@ -893,12 +931,17 @@ class Model(object):
             dtype=tf.int32,
         )
 
+        if self.buffering == 'host':
+            # No buffer variables, act records are staged on the host.
+            return
+
         # States buffer variable
         for name in sorted(self.states_spec):
+            shape, dtype = self.buffered_state_spec(name=name)
             self.list_states_buffer[name] = tf.get_variable(
                 name=('state-{}'.format(name)),
-                shape=((self.num_parallel, self.batching_capacity,) + tuple(self.states_spec[name]['shape'])),
-                dtype=util.tf_dtype(self.states_spec[name]['type']),
+                shape=((self.num_parallel, self.batching_capacity,) + shape),
+                dtype=util.tf_dtype(dtype),
                 trainable=False
             )
 
@@ -943,9 +986,23 @@ class Model(object):
 
         Returns: The preprocessed versions of the input tensors.
         """
+        unprocessed_states = dict(states)
+        for name in sorted(states):
+            if self.states_spec[name]['unprocessed_type'] == 'uint8':
+                states[name] = tf.to_float(x=states[name])
+
         # States preprocessing
         for name in sorted(self.states_preprocessing):
-            states[name] = self.states_preprocessing[name].process(tensor=states[name])
+            if name in self.deferred_preprocessing:
+                index = self.deferred_preprocessing[name]
+                states[name] = self.states_preprocessing[name].process(tensor=states[name], end=index)
+                if index == 0:
+                    self.buffered_states[name] = unprocessed_states[name]
+                else:
+                    self.buffered_states[name] = states[name]
+                states[name] = self.states_preprocessing[name].process(tensor=states[name], start=index)
+            else:
+                states[name] = self.states_preprocessing[name].process(tensor=states[name])
 
         # Reward preprocessing
         if self.reward_preprocessing is not None:
@@ -953,6 +1010,26 @@ class Model(object):
 
         return states, actions, reward
 
+    def buffered_state_spec(self, name):
+        """
+        Returns shape and type of a state as written to the buffers, which differ from the processed state if
+        (part of) its preprocessing is deferred.
+
+        Args:
+            name: State name.
+
+        Returns:
+            Shape tuple and type.
+        """
+        state = self.states_spec[name]
+        if name not in self.deferred_preprocessing:
+            return tuple(state['shape']), state['type']
+        index = self.deferred_preprocessing[name]
+        if index == 0:
+            return tuple(state['unprocessed_shape']), state['unprocessed_type']
+        shape = self.states_preprocessing[name].processed_shape(shape=state['unprocessed_shape'], end=index)
+        return tuple(shape), state['type']
+
     def tf_action_exploration(self, action, exploration, action_spec):
         """
         Applies optional exploration to the action (post-processor for action outputs).
@@ -1015,7 +1092,7 @@ class Model(object):
         """
         raise NotImplementedError
 
-    def tf_observe_timestep(self, states, internals, actions, terminal, reward):
+    def tf_observe_timestep(self, states, internals, actions, terminal, reward, count_updates=False):
         """
         Creates the TensorFlow operations for processing a batch of observations coming in from our buffer (state,
         action, internals) as well as from the agent's python-batch (terminal-signals and rewards from the env).
@@ -1026,6 +1103,9 @@ class Model(object):
             actions (dict): Dict of action tensors (each key represents one action space component).
             terminal: 1D (bool) tensor of terminal signals.
             reward: 1D (float) tensor of rewards.
+            count_updates (bool): Whether timestep-based updates are triggered once per update point passed since
+                the last such observation, instead of only if the current timestep is an update point (used for
+                atomic observes, which may insert multiple timesteps and interleave with other workers).
 
         Returns:
             The observation operation depending on the model type.
@@ -1089,6 +1169,17 @@ class Model(object):
                     ))
                 )
 
+        # States as written to the buffers (fetched by act for host buffering).
+        self.act_buffered_states = {name: self.buffered_states.get(name, states[name]) for name in sorted(states)}
+
+        # Parallel buffer index per batch instance, defaults to the episode index for all instances.
+        batch_size = tf.shape(input=states[next(iter(sorted(states)))])[0]
+        self.episode_indices_input = tf.placeholder_with_default(
+            input=tf.fill(dims=(batch_size,), value=index),
+            shape=(None,),
+            name='episode-indices'
+        )
+
         # Independent act not followed by observe.
         def independent_act():
             """
@@ -1103,31 +1194,43 @@ class Model(object):
             Stores current states, internals and actions in buffer. Increases timesteps.
             """
             operations = list()
-
-            batch_size = tf.shape(input=states[next(iter(sorted(states)))])[0]
-            for name in sorted(states):
-                operations.append(tf.assign(
-                    ref=self.list_states_buffer[name][index, self.list_buffer_index[index]: self.list_buffer_index[index] + batch_size],
-                    value=states[name]
-                ))
-            for name in sorted(internals):
-                operations.append(tf.assign(
-                    ref=self.list_internals_buffer[name][index, self.list_buffer_index[index]: self.list_buffer_index[index] + batch_size],
-                    value=internals[name]
-                ))
-            for name in sorted(self.actions_output):
-                operations.append(tf.assign(
-                    ref=self.list_actions_buffer[name][index, self.list_buffer_index[index]: self.list_buffer_index[index] + batch_size],
-                    value=self.actions_output[name]
-                ))
+            indices = self.episode_indices_input
+
+            if self.buffering == 'graph':
+                # Buffer position per instance: buffer index plus number of preceding instances with the same index.
+                one_hot = tf.one_hot(indices=indices, depth=self.num_parallel, dtype=util.tf_dtype('int'))
+                offsets = tf.reduce_sum(input_tensor=(one_hot * tf.cumsum(x=one_hot, axis=0, exclusive=True)), axis=1)
+                positions = tf.gather(params=self.list_buffer_index, indices=indices) + offsets
+                buffer_indices = tf.stack(values=(indices, positions), axis=1)
+
+                for name in sorted(states):
+                    operations.append(tf.scatter_nd_update(
+                        ref=self.list_states_buffer[name],
+                        indices=buffer_indices,
+                        updates=self.act_buffered_states[name]
+                    ))
+                for name in sorted(internals):
+                    operations.append(tf.scatter_nd_update(
+                        ref=self.list_internals_buffer[name],
+                        indices=buffer_indices,
+                        updates=internals[name]
+                    ))
+                for name in sorted(self.actions_output):
+                    operations.append(tf.scatter_nd_update(
+                        ref=self.list_actions_buffer[name],
+                        indices=buffer_indices,
+                        updates=self.actions_output[name]
+                    ))
 
             with tf.control_dependencies(control_inputs=operations):
                 operations = list()
 
-                operations.append(tf.assign(
-                    ref=self.list_buffer_index[index: index+1],
-                    value=tf.add(self.list_buffer_index[index: index+1], tf.constant([1]))
-                ))
+                if self.buffering == 'graph':
+                    operations.append(tf.scatter_add(
+                        ref=self.list_buffer_index,
+                        indices=indices,
+                        updates=tf.ones_like(tensor=indices)
+                    ))
 
                     # Increment timestep
                 operations.append(tf.assign_add(
@@ -1202,6 +1305,57 @@ class Model(object):
          # TODO: add up rewards per episode and add summary_label 'episode-reward'
 
 
+    def create_host_observe_operations(self, internals, actions, terminal, reward):
+        """
+        Returns the tf op to fetch when an observation batch is passed in with host buffering, in which case the
+        act records staged on the host are fed alongside rewards and terminals: states as buffered via the
+        buffered states placeholders, internals and actions via the regular placeholders.
+
+        Args:
+            internals (dict): Dict of internal state tensors.
+            actions (dict): Dict of action tensors.
+            terminal: The 1D tensor (bool) of terminal signals to process.
+            reward: The 1D tensor (float) of rewards to process.
+
+        Returns: Tf op to fetch when `observe()` is called.
+        """
+        for name in sorted(self.states_spec):
+            shape, dtype = self.buffered_state_spec(name=name)
+            self.buffered_states_input[name] = tf.placeholder(
+                dtype=util.tf_dtype(dtype),
+                shape=((None,) + shape),
+                name=('buffered-state-' + name)
+            )
+
+        # Increment episode
+        num_episodes = tf.count_nonzero(input_tensor=terminal, dtype=util.tf_dtype('int'))
+        increment_episode = tf.assign_add(ref=self.episode, value=tf.to_int64(x=num_episodes))
+        increment_global_episode = tf.assign_add(ref=self.global_episode, value=tf.to_int64(x=num_episodes))
+
+        with tf.control_dependencies(control_inputs=(increment_episode, increment_global_episode)):
+            # Stop gradients
+            states = util.map_tensors(fn=tf.stop_gradient, tensors=self.buffered_states_input)
+            internals = util.map_tensors(fn=tf.stop_gradient, tensors=internals)
+            actions = util.map_tensors(fn=tf.stop_gradient, tensors=actions)
+            terminal = tf.stop_gradient(input=terminal)
+            reward = tf.stop_gradient(input=reward)
+
+            # Observation
+            observation = self.fn_observe_timestep(
+                states=states,
+                internals=internals,
+                actions=actions,
+                terminal=terminal,
+                reward=reward
+            )
+
+        with tf.control_dependencies(control_inputs=(observation,)):
+            # Trivial operation to enforce control dependency.
+            self.episode_output = self.global_episode + 0
+
+        # Staged records are reset on the host.
+        self.list_buffer_index_reset_op = tf.no_op()
+
     def create_atomic_observe_operations(self, states, actions, internals, terminal, reward, index):
         """
         Returns the tf op to fetch when unbuffered observations are passed in.
@@ -1222,11 +1376,11 @@ class Model(object):
 
         with tf.control_dependencies(control_inputs=(increment_episode, increment_global_episode)):
             # Stop gradients
-            # Not using buffers here.
-            fn = (lambda x: tf.stop_gradient(input=x[:self.list_buffer_index[index]]))
-            states = util.map_tensors(fn=fn, tensors=self.list_states_buffer, index=index)
-            internals = util.map_tensors(fn=fn, tensors=self.list_internals_buffer, index=index)
-            actions = util.map_tensors(fn=fn, tensors=self.list_actions_buffer, index=index)
+            # Not using buffers here, states as they would be buffered.
+            states = {name: self.buffered_states.get(name, states[name]) for name in sorted(states)}
+            states = util.map_tensors(fn=tf.stop_gradient, tensors=states)
+            internals = util.map_tensors(fn=tf.stop_gradient, tensors=internals)
+            actions = util.map_tensors(fn=tf.stop_gradient, tensors=actions)
             terminal = tf.stop_gradient(input=terminal)
             reward = tf.stop_gradient(input=reward)
 
@@ -1236,7 +1390,8 @@ class Model(object):
                 internals=internals,
                 actions=actions,
                 terminal=terminal,
-                reward=reward
+                reward=reward,
+                count_updates=True
             )
 
         with tf.control_dependencies(control_inputs=(observation,)):
@@ -1254,11 +1409,19 @@ class Model(object):
             independent=independent,
             index=index
         )
-        self.create_observe_operations(
-            reward=reward,
-            terminal=terminal,
-            index=index
-        )
+        if self.buffering == 'host':
+            self.create_host_observe_operations(
+                internals=internals,
+                actions=actions,
+                reward=reward,
+                terminal=terminal
+            )
+        else:
+            self.create_observe_operations(
+                reward=reward,
+                terminal=terminal,
+                index=index
+            )
         self.create_atomic_observe_operations(
             states=states,
             actions=actions,
@@ -1304,6 +1467,22 @@ class Model(object):
 
         return model_variables
 
+    def get_unsaved_variables(self):
+        """
+        Returns the TensorFlow variables which are not saved in checkpoints, but rebuilt from the saved variables
+        after a restore, so checkpoints without them can be restored.
+
+        Returns:
+            List of variables.
+        """
+        return list()
+
+    def rebuild_unsaved_variables(self):
+        """
+        Creates the op which rebuilds the unsaved variables (see `get_unsaved_variables`) after a restore.
+        """
+        return tf.no_op()
+
     def reset(self):
         """
         Resets the model to its initial state on episode start. This should also reset all preprocessor(s).
@@ -1412,7 +1591,11 @@ class Model(object):
         if independent is not None:
             feed_dict[self.independent_input] = independent
 
-        feed_dict[self.episode_index_input] = index
+        if isinstance(index, (list, tuple, np.ndarray)):
+            # One parallel episode index per batch instance.
+            feed_dict[self.episode_indices_input] = index
+        elif index is not None:
+            feed_dict[self.episode_index_input] = index
 
         return feed_dict
 
@@ -1428,7 +1611,8 @@ class Model(object):
             independent (bool): If true, action is not followed by observe (and hence not included
                 in updates).
             fetch_tensors (list): List of names of additional tensors (from the model's network) to fetch (and return).
-            index: (int) index of the episode we want to produce the next action
+            index: (int) index of the episode we want to produce the next action, or list of indices (one per
+                instance of a batch of states from parallel episodes).
 
         Returns:
             tuple:
@@ -1441,27 +1625,45 @@ class Model(object):
         batched = (state.ndim != len(self.states_spec[name]['unprocessed_shape']))
         if batched:
             assert state.shape[0] <= self.batching_capacity
+        if isinstance(index, (list, tuple, np.ndarray)):
+            assert batched and len(index) == state.shape[0]
+
+        if self.act_fast_path:
+            act_callable = self.get_act_callable(
+                deterministic=deterministic,
+                independent=independent,
+                fetch_tensors=fetch_tensors,
+                multiple_indices=isinstance(index, (list, tuple, np.ndarray))
+            )
+            fetch_list = act_callable(states=states, internals=internals, batched=batched, index=index)
 
-        fetches = [self.actions_output, self.internals_output, self.timestep_output]
-        if self.network is not None and fetch_tensors is not None:
-            for name in fetch_tensors:
-                valid, tensor = self.network.get_named_tensor(name)
-                if valid:
-                    fetches.append(tensor)
-                else:
-                    keys = self.network.get_list_of_named_tensor()
-                    raise TensorForceError('Cannot fetch named tensor "{}", Available {}.'.format(name, keys))
+        else:
+            fetches = [self.actions_output, self.internals_output, self.timestep_output]
+            fetches.extend(self.get_named_tensors(fetch_tensors=fetch_tensors))
+            if self.buffering == 'host' and not independent:
+                fetches.append(self.act_buffered_states)
 
-        # feed_dict[self.deterministic_input] = deterministic
-        feed_dict = self.get_feed_dict(
-            states=states,
-            internals=internals,
-            deterministic=deterministic,
-            independent=independent,
-            index=index
-        )
+            # feed_dict[self.deterministic_input] = deterministic
+            feed_dict = self.get_feed_dict(
+                states=states,
+                internals=internals,
+                deterministic=deterministic,
+                independent=independent,
+                index=index
+            )
+
+            fetch_list = self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
+
+            # The fast path callable stages the act records itself.
+            if self.buffering == 'host' and not independent:
+                self.stage_act(
+                    states=fetch_list.pop(),
+                    internals=internals,
+                    actions=fetch_list[0],
+                    batched=batched,
+                    index=index
+                )
 
-        fetch_list = self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
         actions, internals, timestep = fetch_list[0:3]
 
         # Extract the first (and only) action/internal from the batch to make return values non-batched
@@ -1478,6 +1680,94 @@ class Model(object):
         else:
             return actions, internals, timestep
 
+    def get_named_tensors(self, fetch_tensors):
+        """
+        Returns the network tensors for the given list of names (empty if no names are given).
+        """
+        tensors = list()
+        if self.network is not None and fetch_tensors is not None:
+            for name in fetch_tensors:
+                valid, tensor = self.network.get_named_tensor(name)
+                if valid:
+                    tensors.append(tensor)
+                else:
+                    keys = self.network.get_list_of_named_tensor()
+                    raise TensorForceError('Cannot fetch named tensor "{}", Available {}.'.format(name, keys))
+        return tensors
+
+    def get_act_callable(self, deterministic, independent, fetch_tensors, multiple_indices):
+        """
+        Returns a function which runs the act fetches via a precompiled session callable with fixed feed and
+        fetch lists, which avoids building a feed dict and resolving fetches on every call. Callables are cached
+        per (deterministic, independent, fetch_tensors, multiple_indices) signature.
+
+        Args:
+            deterministic (bool): Whether actions should be picked without exploration.
+            independent (bool): Whether the act is independent (not followed by observe).
+            fetch_tensors (list): List of names of additional network tensors to fetch.
+            multiple_indices (bool): Whether one parallel index per batch instance is given.
+
+        Returns:
+            Function (states, internals, batched, index) returning the list [actions, internals, timestep,
+            *fetched tensors].
+        """
+        key = (deterministic, independent, None if fetch_tensors is None else tuple(fetch_tensors), multiple_indices)
+        if key in self.act_callables:
+            return self.act_callables[key]
+
+        state_names = sorted(self.states_input)
+        internal_names = sorted(self.internals_input)
+        action_names = sorted(self.actions_output)
+        output_internal_names = sorted(self.internals_output)
+
+        feed_list = [self.states_input[name] for name in state_names]
+        feed_list.extend(self.internals_input[name] for name in internal_names)
+        feed_list.append(self.deterministic_input)
+        feed_list.append(self.independent_input)
+        feed_list.append(self.episode_indices_input if multiple_indices else self.episode_index_input)
+
+        fetch_list = [self.actions_output[name] for name in action_names]
+        fetch_list.extend(self.internals_output[name] for name in output_internal_names)
+        fetch_list.append(self.timestep_output)
+        fetch_list.extend(self.get_named_tensors(fetch_tensors=fetch_tensors))
+        # States as buffered, staged on the host after the call.
+        if self.buffering == 'host' and not independent:
+            fetch_list.extend(self.act_buffered_states[name] for name in state_names)
+            num_staged = len(state_names)
+        else:
+            num_staged = 0
+
+        session_callable = self.session.make_callable(fetches=fetch_list, feed_list=feed_list)
+        num_actions = len(action_names)
+        num_internals = len(output_internal_names)
+
+        def act_callable(states, internals, batched, index):
+            if batched:
+                args = [states[name] for name in state_names]
+                args.extend(internals[name] for name in internal_names)
+            else:
+                args = [(states[name],) for name in state_names]
+                args.extend((internals[name],) for name in internal_names)
+            args.extend((deterministic, independent, index))
+
+            values = session_callable(*args)
+
+            actions = dict(zip(action_names, values[:num_actions]))
+            output_internals = dict(zip(output_internal_names, values[num_actions: num_actions + num_internals]))
+            fetched = list(values[num_actions + num_internals: len(values) - num_staged])
+            if num_staged > 0:
+                self.stage_act(
+                    states=dict(zip(state_names, values[len(values) - num_staged:])),
+                    internals=internals,
+                    actions=actions,
+                    batched=batched,
+                    index=index
+                )
+            return [actions, output_internals] + fetched
+
+        self.act_callables[key] = act_callable
+        return act_callable
+
     def observe(self, terminal, reward, index=0):
         """
         Adds an observation (reward and is-terminal) to the model without updating its trainable variables.
@@ -1493,10 +1783,89 @@ class Model(object):
         fetches = self.episode_output
         feed_dict = self.get_feed_dict(terminal=terminal, reward=reward, index=index)
 
+        if self.buffering == 'host':
+            # Feed and reset the act records staged since the last observe.
+            buffer = self.list_host_buffer[index]
+            self.list_host_buffer[index] = self.empty_host_buffer()
+            num_staged = len(buffer['actions'].get(next(iter(sorted(self.actions_input))), ()))
+            if num_staged != np.asarray(terminal).size:
+                raise TensorForceError("Number of observed timesteps ({}) does not match number of act calls ({}).".format(
+                    np.asarray(terminal).size, num_staged
+                ))
+            for name in sorted(self.buffered_states_input):
+                feed_dict[self.buffered_states_input[name]] = np.stack(buffer['states'][name])
+            for name in sorted(self.internals_input):
+                feed_dict[self.internals_input[name]] = np.stack(buffer['internals'][name])
+            for name in sorted(self.actions_input):
+                feed_dict[self.actions_input[name]] = np.stack(buffer['actions'][name])
+
         episode = self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
 
         return episode
 
+    @staticmethod
+    def empty_host_buffer():
+        return dict(states=dict(), internals=dict(), actions=dict())
+
+    def stage_act(self, states, internals, actions, batched, index):
+        """
+        Stages the records of an act call on the host until the corresponding observe call (host buffering).
+
+        Args:
+            states (dict): Dict of buffered state values.
+            internals (dict): Dict of prior internal state values as passed to act.
+            actions (dict): Dict of action values.
+            batched (bool): Whether the values are batched.
+            index: (int) index of the parallel episode, or list of indices (one per batch instance).
+        """
+        if not batched:
+            states = {name: (states[name][0],) for name in states}
+            internals = {name: (internals[name],) for name in internals}
+            actions = {name: (actions[name][0],) for name in actions}
+        if not isinstance(index, (list, tuple, np.ndarray)):
+            index = [index] * len(actions[next(iter(actions))])
+
+        for n, index_ in enumerate(index):
+            buffer = self.list_host_buffer[index_]
+            for key, values in (('states', states), ('internals', internals), ('actions', actions)):
+                for name in values:
+                    buffer[key].setdefault(name, list()).append(np.asarray(values[name][n]))
+
+    def buffer_memory_report(self):
+        """
+        Returns the memory used by the act/observe buffers, allocated in graph variables for graph buffering or
+        currently staged on the host for host buffering.
+
+        Returns:
+            Dict of number of bytes per buffer.
+        """
+        report = dict()
+        if self.buffering == 'graph':
+            for key, buffers in (('state', self.list_states_buffer), ('internal', self.list_internals_buffer),
+                                 ('action', self.list_actions_buffer)):
+                for name in sorted(buffers):
+                    report['{}-{}'.format(key, name)] = \
+                        util.prod(util.shape(buffers[name])) * buffers[name].dtype.base_dtype.size
+        else:
+            for key in ('states', 'internals', 'actions'):
+                for buffer in self.list_host_buffer:
+                    for name in sorted(buffer[key]):
+                        column = '{}-{}'.format(key[:-1], name)
+                        report[column] = report.get(column, 0) + sum(value.nbytes for value in buffer[key][name])
+        return report
+
+    def update_due(self, timestep, episode, terminal):
+        """
+        Returns whether an observe call, after which the model counters have the given values, triggered an
+        update as part of observe (used to attribute observe time to updates).
+
+        Args:
+            timestep (int): Timestep counter at the observe call.
+            episode (int): Episode counter after the observe call.
+            terminal (List[bool]): Observed is-terminal signals.
+        """
+        return False
+
     def atomic_observe(self, states, actions, internals, terminal, reward, index=0):
         fetches = self.unbuffered_episode_output
         feed_dict = self.get_feed_dict(
@@ -1563,7 +1932,80 @@ class Model(object):
         #     raise TensorForceError("Invalid model directory/file.")
 
         self.saver.restore(sess=self.session, save_path=file)
+        self.session.run(fetches=self.unsaved_variables_rebuild_op)
+        self.reset_buffers()
+
+    def reset_buffers(self):
+        """
+        Discards the act records of all parallel episodes which have not been observed yet.
+        """
         self.session.run(fetches=self.list_buffer_index_reset_op)
+        self.list_host_buffer = [self.empty_host_buffer() for _ in range(self.num_parallel)]
+
+    def export_inference(self, directory, unique_state=False, unique_action=False):
+        """
+        Exports a frozen inference graph which only contains the operations required to compute actions and
+        posterior internal states from states and prior internal states, i.e. states preprocessing, network and
+        action distributions, with variables converted to constants. Memory, optimizer and buffers are pruned.
+        The export can be loaded via `InferenceAgent`.
+
+        Stateful states preprocessing, variable noise and summaries are not supported.
+
+        Args:
+            directory: Export directory (created if not existing).
+            unique_state: Whether the agent's state is a single unnamed state.
+            unique_action: Whether the agent's action is a single unnamed action.
+
+        Returns:
+            Path of the exported graph file.
+        """
+        if self.variable_noise is not None and self.variable_noise > 0.0:
+            raise TensorForceError("Inference export does not support variable noise.")
+        if self.summarizer_spec is not None:
+            raise TensorForceError("Inference export does not support summaries.")
+        for name in sorted(self.states_preprocessing):
+            if len(self.states_preprocessing[name].get_variables()) > 0:
+                raise TensorForceError("Inference export does not support stateful preprocessing of state {}.".format(
+                    name
+                ))
+
+        fetches = [self.actions_output[name] for name in sorted(self.actions_output)]
+        fetches.extend(self.internals_output[name] for name in sorted(self.internals_output))
+        graph_def = tf.graph_util.convert_variables_to_constants(
+            sess=self.session,
+            input_graph_def=self.graph.as_graph_def(),
+            output_node_names=[tensor.op.name for tensor in fetches]
+        )
+
+        manifest = dict(
+            unique_state=unique_state,
+            unique_action=unique_action,
+            deterministic=self.deterministic_input.name,
+            states={
+                name: dict(
+                    tensor=self.states_input[name].name,
+                    shape=list(self.states_spec[name]['unprocessed_shape']),
+                    type=str(np.dtype(util.np_dtype(self.states_spec[name]['unprocessed_type'])))
+                ) for name in sorted(self.states_input)
+            },
+            internals={
+                name: dict(
+                    tensor=self.internals_input[name].name,
+                    output=self.internals_output[name].name,
+                    init=np.asarray(self.internals_init[name]).tolist()
+                ) for name in sorted(self.internals_input)
+            },
+            actions={name: self.actions_output[name].name for name in sorted(self.actions_output)}
+        )
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        path = os.path.join(directory, 'inference.pb')
+        with open(path, 'wb') as filehandle:
+            filehandle.write(graph_def.SerializeToString())
+        with open(os.path.join(directory, 'inference.json'), 'w') as filehandle:
+            json.dump(obj=manifest, fp=filehandle, indent=2, sort_keys=True)
+        return path
 
     def get_components(self):
         """
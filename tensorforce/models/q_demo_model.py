@@ -73,6 +73,7 @@ class QDemoModel(QModel):
         self.fn_demo_loss = None
         self.fn_combined_loss = None
         self.fn_demo_optimization = None
+        self.demo_steps_input = None
 
         super(QDemoModel, self).__init__(
             states=states,
@@ -292,9 +293,34 @@ class QDemoModel(QModel):
             index=index
         )
 
-        # Demo optimization operation.
+        # Demo optimization operation, running a given number of demo updates in a TensorFlow while loop (the
+        # first one outside of the loop, so optimizer variables are created outside of the loop context).
+        self.demo_steps_input = tf.placeholder_with_default(
+            input=tf.constant(value=1, dtype=util.tf_dtype('int')),
+            shape=(),
+            name='demo-steps'
+        )
         demo_batch = self.demo_memory.retrieve_timesteps(n=self.demo_batch_size)
-        self.demo_optimization_output = self.fn_demo_optimization(**demo_batch)
+        demo_optimization = self.fn_demo_optimization(**demo_batch)
+
+        def body(iteration):
+            demo_batch = self.demo_memory.retrieve_timesteps(n=self.demo_batch_size)
+            demo_optimization = self.fn_demo_optimization(**demo_batch)
+            with tf.control_dependencies(control_inputs=(demo_optimization,)):
+                return iteration + 1
+
+        def cond(iteration):
+            return iteration < self.demo_steps_input - 1
+
+        with tf.control_dependencies(control_inputs=(demo_optimization,)):
+            iteration = tf.constant(value=0, dtype=util.tf_dtype('int'))
+            self.demo_optimization_output = tf.while_loop(
+                cond=cond,
+                body=body,
+                loop_vars=(iteration,),
+                back_prop=False,
+                parallel_iterations=1
+            )
 
     def get_variables(self, include_submodules=False, include_nontrainable=False):
         """
@@ -330,12 +356,16 @@ class QDemoModel(QModel):
 
         self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
 
-    def demo_update(self):
+    def demo_update(self, steps=1):
         """
-        Performs a demonstration update by calling the demo optimization operation.
+        Performs demonstration updates by calling the demo optimization operation.
         Note that the batch data does not have to be fetched from the demo memory as this is now part of
         the TensorFlow operation of the demo update.
+
+        Args:
+            steps (int): Number of demo updates, each on a newly sampled demo batch, within one session call.
         """
         fetches = self.demo_optimization_output
+        feed_dict = {self.demo_steps_input: steps}
 
-        self.monitored_session.run(fetches=fetches)
+        self.monitored_session.run(fetches=fetches, feed_dict=feed_dict)
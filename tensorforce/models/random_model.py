@@ -81,5 +81,5 @@ class RandomModel(Model):
 
         return actions, dict()
 
-    def tf_observe_timestep(self, states, internals, actions, terminal, reward):
+    def tf_observe_timestep(self, states, internals, actions, terminal, reward, count_updates=False):
         return tf.no_op()
@@ -0,0 +1,53 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+
+from tensorforce.agents import VPGAgent
+from .minimal_test import MinimalTest
+
+
+class TestActFastPath(unittest.TestCase):
+
+    def test_act_fast_path(self):
+        environment = MinimalTest(specification={'float': ()})
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            batching_capacity=10,
+            execution=dict(type='single', session_config=None, distributed_spec=None, act_fast_path=True)
+        )
+        self.assertTrue(agent.model.act_fast_path)
+
+        states = np.random.uniform(size=(4, 2))
+        fast_actions = agent.act(states=states, deterministic=True, independent=True)
+        fast_action = agent.act(states=states[0], deterministic=True, independent=True)
+
+        agent.model.act_fast_path = False
+        actions = agent.act(states=states, deterministic=True, independent=True)
+        action = agent.act(states=states[0], deterministic=True, independent=True)
+
+        self.assertTrue(np.allclose(fast_actions, actions))
+        self.assertTrue(np.allclose(fast_action, action))
+        self.assertEqual(np.shape(fast_action), np.shape(action))
+
+        agent.close()
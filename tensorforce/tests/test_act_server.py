@@ -0,0 +1,66 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import threading
+import unittest
+
+import numpy as np
+
+from tensorforce.agents import VPGAgent
+from tensorforce.execution import ActServer
+from tensorforce.execution.act_server import Future
+from .minimal_test import MinimalTest
+
+
+@unittest.skipIf(Future is None, "requires concurrent.futures")
+class TestActServer(unittest.TestCase):
+
+    def test_act_server(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='internal_lstm', size=8), dict(type='dense', size=8)],
+            batching_capacity=16
+        )
+
+        server = ActServer(agent=agent, latency_budget=0.01)
+        server.start()
+
+        results = dict()
+
+        def client(client_id):
+            results[client_id] = [
+                server.act(states=np.random.uniform(size=(2,)), client_id=client_id) for _ in range(10)
+            ]
+
+        threads = [threading.Thread(target=client, args=(client_id,)) for client_id in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        server.stop()
+
+        self.assertEqual(server.num_requests, 80)
+        self.assertLess(server.num_batches, 80)
+        for client_id in range(8):
+            self.assertEqual(len(results[client_id]), 10)
+            self.assertIn(client_id, server.client_internals)
+
+        agent.close()
@@ -0,0 +1,103 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import unittest
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.environments import ActionRepeat, Environment
+
+
+class FlickeringFrames(Environment):
+    """
+    Environment whose frames alternately show one of two pixels, terminating after a given number of frames.
+    Frames are optionally written to one reused buffer, like emulator frame buffers.
+    """
+
+    def __init__(self, episode_length, reuse_buffer=False):
+        self.episode_length = episode_length
+        self.frame = 0
+        self.num_executes = 0
+        self.buffer = np.zeros(shape=(2,)) if reuse_buffer else None
+
+    def __str__(self):
+        return 'FlickeringFrames'
+
+    def reset(self):
+        self.frame = 0
+        return np.zeros(shape=(2,))
+
+    def execute(self, action):
+        self.frame += 1
+        self.num_executes += 1
+        if self.buffer is None:
+            state = np.zeros(shape=(2,))
+        else:
+            state = self.buffer
+            state[:] = 0.0
+        state[self.frame % 2] = self.frame
+        return state, self.frame >= self.episode_length, float(action)
+
+    @property
+    def states(self):
+        return dict(shape=(2,), type='float')
+
+    @property
+    def actions(self):
+        return dict(type='int', num_actions=2)
+
+
+class TestActionRepeat(unittest.TestCase):
+
+    def test_action_repeat(self):
+        environment = ActionRepeat(environment=FlickeringFrames(episode_length=10), repeat=4)
+        self.assertEqual(environment.states, dict(shape=(2,), type='float'))
+        self.assertEqual(str(environment), 'ActionRepeat(FlickeringFrames, 4)')
+
+        environment.reset()
+        state, terminal, reward = environment.execute(action=1)
+        self.assertEqual(tuple(state), (4.0, 3.0))
+        self.assertFalse(terminal)
+        self.assertEqual(reward, 4.0)
+        self.assertEqual(environment.environment.num_executes, 4)
+
+        environment.execute(action=1)
+        # Stops repeating at the terminal frame.
+        state, terminal, reward = environment.execute(action=1)
+        self.assertEqual(tuple(state), (10.0, 9.0))
+        self.assertTrue(terminal)
+        self.assertEqual(reward, 2.0)
+        self.assertEqual(environment.environment.num_executes, 10)
+
+    def test_reused_buffer(self):
+        environment = ActionRepeat(environment=FlickeringFrames(episode_length=10, reuse_buffer=True), repeat=4)
+        environment.reset()
+        state, terminal, reward = environment.execute(action=1)
+        self.assertEqual(tuple(state), (4.0, 3.0))
+
+    def test_no_max_pool(self):
+        environment = ActionRepeat(environment=FlickeringFrames(episode_length=10), repeat=3, max_pool=False)
+        environment.reset()
+        state, terminal, reward = environment.execute(action=1)
+        self.assertEqual(tuple(state), (0.0, 3.0))
+        self.assertEqual(reward, 3.0)
+
+        with self.assertRaises(TensorForceError):
+            ActionRepeat(environment=FlickeringFrames(episode_length=10), repeat=0)
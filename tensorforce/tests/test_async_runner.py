@@ -0,0 +1,137 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import asyncio
+import logging
+import random
+import sys
+import unittest
+
+from tensorforce import TensorForceError
+from tensorforce.agents import VPGAgent
+from tensorforce.execution.async_runner import AsyncRunner
+from .minimal_test import MinimalTest
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class AsyncMinimalTest(MinimalTest):
+    """
+    MinimalTest with coroutine methods and random response latency, like a remote environment.
+    """
+
+    async def reset(self):
+        await asyncio.sleep(random.random() * 0.001)
+        return MinimalTest.reset(self)
+
+    async def execute(self, action):
+        await asyncio.sleep(random.random() * 0.001)
+        return MinimalTest.execute(self, action=action)
+
+
+class TestAsyncRunner(unittest.TestCase):
+
+    def test_async_runner(self):
+        sys.stdout.write('\nVPGAgent (async environments):')
+        sys.stdout.flush()
+
+        environments = [AsyncMinimalTest(specification={'int': ()}) for _ in range(4)]
+
+        agent = VPGAgent(
+            states=environments[0].states,
+            actions=environments[0].actions,
+            network=[dict(type='dense', size=32), dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+            memory=dict(type='latest', include_next_states=False, capacity=100),
+            optimizer=dict(type='adam', learning_rate=1e-2),
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=4)
+        )
+
+        runner = AsyncRunner(agent=agent, environment=environments)
+        runner.run(num_episodes=100)
+        runner.close()
+
+        self.assertGreaterEqual(runner.episode, 100)
+        self.assertEqual(len(runner.episode_rewards), len(runner.episode_timesteps))
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_repeated_runs(self):
+        environments = [AsyncMinimalTest(specification={'int': ()}) for _ in range(4)]
+        agent = VPGAgent(
+            states=environments[0].states,
+            actions=environments[0].actions,
+            network=[dict(type='dense', size=32)],
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=4)
+        )
+        runner = AsyncRunner(agent=agent, environment=environments)
+
+        # The timestep limit interrupts episodes, whose records must not be continued by the next run.
+        runner.run(num_timesteps=50)
+
+        act = agent.act
+        first_act_buffered = list()
+
+        def checked_act(**kwargs):
+            if len(first_act_buffered) == 0:
+                first_act_buffered.append(sum(len(terminal) for terminal in agent.observe_terminal))
+            return act(**kwargs)
+
+        agent.act = checked_act
+        runner.run(num_timesteps=50)
+        runner.close()
+
+        self.assertEqual(first_act_buffered, [0])
+        self.assertGreaterEqual(runner.global_timestep, 100)
+
+    def test_synchronous_environment(self):
+        environments = [MinimalTest(specification={'int': ()}), AsyncMinimalTest(specification={'int': ()})]
+        agent = VPGAgent(
+            states=environments[0].states,
+            actions=environments[0].actions,
+            network=[dict(type='dense', size=32)],
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=2)
+        )
+
+        # Synchronous environments run in the environment thread pool, alongside asyncio environments.
+        runner = AsyncRunner(agent=agent, environment=environments)
+        runner.run(num_episodes=20)
+        runner.close()
+
+        self.assertGreaterEqual(runner.episode, 20)
+        histograms = runner.latency_histograms()
+        self.assertEqual(len(histograms), 2)
+        for histogram in histograms:
+            self.assertGreater(histogram['reset'][0].sum(), 0)
+            self.assertGreater(histogram['execute'][0].sum(), 0)
+
+    def test_mixed_environment_methods(self):
+        class MixedMinimalTest(MinimalTest):
+
+            async def execute(self, action):
+                return MinimalTest.execute(self, action=action)
+
+        environment = MixedMinimalTest(specification={'int': ()})
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=2)
+        )
+        with self.assertRaises(TensorForceError):
+            AsyncRunner(agent=agent, environment=[environment])
+        agent.close()
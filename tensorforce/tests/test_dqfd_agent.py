@@ -122,7 +122,8 @@ class TestDQFDAgent(BaseAgentTest, unittest.TestCase):
             demonstrations.append(demonstration)
 
         agent.import_demonstrations(demonstrations=demonstrations)
-        agent.pretrain(steps=1000)
+        statistics = agent.pretrain(steps=1000, steps_per_call=300)
+        assert statistics['steps'] == 1000
 
     # multi_config = dict(
     #     memory=dict(
@@ -0,0 +1,129 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.agents import DQNAgent
+from tensorforce.experience_dataset import ExperienceDataset
+from .minimal_test import MinimalTest
+
+
+class TestExperienceDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_batches(self):
+        for path in (os.path.join(self.directory, 'dataset'), os.path.join(self.directory, 'dataset.npz')):
+            ExperienceDataset.write(
+                path=path,
+                states=dict(state=np.arange(10, dtype=np.float32).reshape(5, 2)),
+                internals=dict(),
+                actions=dict(action=np.arange(5, dtype=np.int32)),
+                terminal=np.array([False, False, True, False, True]),
+                reward=np.ones(shape=(5,), dtype=np.float32)
+            )
+            dataset = ExperienceDataset(path=path)
+
+            self.assertEqual(len(dataset), 5)
+            self.assertEqual(dataset.names(kind='states'), ['state'])
+            self.assertEqual(dataset.names(kind='internals'), [])
+
+            batches = list(dataset.batches(batch_size=2))
+            self.assertEqual([batch['terminal'].shape[0] for batch in batches], [2, 2, 1])
+            self.assertEqual(batches[1]['states']['state'].tolist(), [[4.0, 5.0], [6.0, 7.0]])
+            self.assertEqual(batches[2]['actions']['action'].tolist(), [4])
+
+    def test_npz_memmap(self):
+        path = os.path.join(self.directory, 'dataset.npz')
+        ExperienceDataset.write(
+            path=path,
+            states=dict(state=np.arange(12, dtype=np.float32).reshape(3, 2, 2)),
+            internals=dict(),
+            actions=dict(action=np.arange(3, dtype=np.int64)),
+            terminal=np.array([False, False, True]),
+            reward=np.ones(shape=(3,), dtype=np.float32)
+        )
+
+        # Columns of uncompressed archives are memory-mapped instead of loaded.
+        dataset = ExperienceDataset(path=path)
+        self.assertTrue(all(isinstance(column, np.memmap) for column in dataset.columns.values()))
+        self.assertEqual(dataset.columns['states.state'].tolist(), np.arange(12).reshape(3, 2, 2).tolist())
+        self.assertEqual(dataset.columns['terminal'].tolist(), [False, False, True])
+
+        compressed_path = os.path.join(self.directory, 'compressed.npz')
+        np.savez_compressed(compressed_path, terminal=np.array([False, True]), reward=np.ones(shape=(2,)))
+        with self.assertRaises(TensorForceError):
+            ExperienceDataset(path=compressed_path)
+
+    def collect_experiences(self, environment, num_timesteps):
+        experiences = list()
+        state = environment.reset()
+        for _ in range(num_timesteps):
+            action = np.random.randint(2)
+            next_state, terminal, reward = environment.execute(action=action)
+            experiences.append(dict(states=state, internals=dict(), actions=action, terminal=terminal, reward=reward))
+            state = environment.reset() if terminal else next_state
+        return experiences
+
+    def test_import_experience_dataset(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = DQNAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            memory=dict(type='replay', include_next_states=True, capacity=1000)
+        )
+
+        experiences = self.collect_experiences(environment=environment, num_timesteps=100)
+        path = os.path.join(self.directory, 'experiences')
+        agent.save_experience(path=path, experiences=experiences)
+        result = agent.import_experience_dataset(path=path, batch_size=32)
+        self.assertEqual(result['timesteps'], 100)
+
+        agent.close()
+
+    def test_import_default_batch_size(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = DQNAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            memory=dict(type='replay', include_next_states=True, capacity=50)
+        )
+
+        experiences = self.collect_experiences(environment=environment, num_timesteps=120)
+        path = os.path.join(self.directory, 'experiences')
+        agent.save_experience(path=path, experiences=experiences)
+
+        # The default batch size exceeds the memory capacity, so batches are limited to the capacity.
+        result = agent.import_experience_dataset(path=path)
+        self.assertEqual(result['timesteps'], 120)
+        self.assertEqual(agent.model.session.run(agent.model.memory.memory_index), 20)
+
+        agent.close()
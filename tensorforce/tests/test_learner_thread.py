@@ -0,0 +1,64 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import time
+import unittest
+
+from tensorforce.agents import DQNAgent
+from tensorforce.execution import Runner
+from .minimal_test import MinimalTest
+
+
+class TestLearnerThread(unittest.TestCase):
+
+    def test_learner_thread(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = DQNAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='timesteps', batch_size=8, frequency=4),
+            memory=dict(type='replay', include_next_states=True, capacity=1000),
+            optimizer=dict(type='adam', learning_rate=1e-2),
+            execution=dict(
+                type='single',
+                session_config=None,
+                distributed_spec=None,
+                learner=dict(type='thread', replay_ratio=2.0)
+            )
+        )
+        self.assertIsNotNone(agent.model.learner_thread)
+
+        runner = Runner(agent=agent, environment=environment)
+        runner.run(num_timesteps=200)
+
+        # Wait for the learner to catch up with the replay ratio.
+        statistics = agent.model.learner_statistics()
+        for _ in range(100):
+            if statistics['replay_ratio'] >= 2.0 - 8 / statistics['observed_timesteps']:
+                break
+            time.sleep(0.1)
+            statistics = agent.model.learner_statistics()
+
+        self.assertGreaterEqual(statistics['observed_timesteps'], 200)
+        self.assertGreater(statistics['updates'], 0)
+        self.assertLessEqual(statistics['updates'] * 8, 2.0 * statistics['observed_timesteps'] + 8)
+
+        runner.close()
+        self.assertIsNone(agent.model.learner_thread)
@@ -1,8 +1,12 @@
+import shutil
+import tempfile
 import unittest
 
 import tensorflow as tf
 import numpy as np
-from tensorforce.core.memories import Queue, Latest, Replay
+from tensorforce import TensorForceError
+from tensorforce.core.memories import Queue, Latest, Replay, StackedFrameReplay, MemmapReplay, ReplayServer, \
+    RemoteReplay, SumTreePrioritizedReplay
 
 
 class TestMemory(unittest.TestCase):
@@ -293,6 +297,323 @@ class TestMemory(unittest.TestCase):
         retrieved_data = self.sess.run(retrieve_op_full_plus)
         assert np.sum(retrieved_data["terminal"]) == true_capacity_episodes
 
+    def test_replay_timesteps(self):
+        episode_length = 3
+        n = 16
+        mem = self._make_mem(Replay, capacity=(episode_length * 2 + 1), include_next_states=True)
+
+        mem.initialize()
+        store_op = self._build_store_op(mem)
+        retrieve_op = mem.retrieve_timesteps(n=n)
+
+        self.sess.run(tf.global_variables_initializer())
+
+        # Batches have a static size.
+        assert retrieve_op["terminal"].shape.as_list() == [n]
+
+        for _ in range(4):
+            self._store_episode(store_op=store_op, episode_length=episode_length)
+
+            # Exactly n non-terminal records, followed by their successor within the episode.
+            retrieved_data = self.sess.run(retrieve_op)
+            assert [False] * n == retrieved_data["terminal"].tolist()
+            assert retrieved_data["states"]["test_state"].tolist() == \
+                retrieved_data["next_states"]["test_state"].tolist()
+
+    def test_replay_sequences(self):
+        episode_length = 4
+        sequence_length = 2
+        mem = self._make_mem(Replay, capacity=(episode_length * 3))
+
+        mem.initialize()
+        store_op = self._build_store_op(mem)
+        retrieve_op = mem.retrieve_sequences(n=16, sequence_length=sequence_length)
+
+        self.sess.run(tf.global_variables_initializer())
+
+        for _ in range(4):
+            self._store_episode(store_op=store_op, episode_length=episode_length)
+
+        # Sequences starting with a terminal are dropped, the remaining ones lie within one episode.
+        retrieved_data = self.sess.run(retrieve_op)
+        terminal = retrieved_data["terminal"].tolist()
+        states = retrieved_data["states"]["test_state"].flatten().tolist()
+        assert len(states) > 0 and len(states) % sequence_length == 0
+        for i in range(0, len(states), sequence_length):
+            assert not terminal[i]
+            assert states[i] == states[i + 1]
+
+    def test_sum_tree_prioritized_replay_timesteps(self):
+        episode_length = 3
+        capacity = 5
+        mem = self._make_mem(SumTreePrioritizedReplay, capacity=capacity)
+
+        n = tf.placeholder(dtype=tf.int32)
+        loss = tf.placeholder(dtype=tf.float32, shape=[None])
+
+        mem.initialize()
+        store_op = self._build_store_op(mem)
+        retrieve_op_t = mem.retrieve_timesteps(n)
+        update_op = mem.update_batch(loss)
+
+        self.sess.run(tf.global_variables_initializer())
+
+        try:
+            self.sess.run(retrieve_op_t, feed_dict={n: 1})
+            assert False
+        except tf.errors.InvalidArgumentError as e:
+            assert "nothing stored yet" in e.message
+
+        self._store_episode(store_op=store_op, episode_length=episode_length)
+        sum_tree = self.sess.run(mem.sum_tree)
+        assert sum_tree[1] == episode_length
+
+        # Retrieval is stratified over the priority mass, so equal priorities yield each timestep once.
+        retrieved_data = self.sess.run(retrieve_op_t, feed_dict={n: episode_length})
+        assert [False, False, True] == retrieved_data["terminal"].tolist()
+        assert [0.0, 0.0, 0.0] == retrieved_data["states"]["test_state"].flatten().tolist()
+
+        # Priority updates propagate to the root of both trees.
+        self.sess.run(update_op, feed_dict={loss: [1.0, 2.0, 4.0]})
+        sum_tree, min_tree = self.sess.run((mem.sum_tree, mem.min_tree))
+        assert np.isclose(sum_tree[1], 7.0, atol=1e-4)
+        assert np.isclose(min_tree[1], 1.0, atol=1e-4)
+
+        # Overwriting experiences replaces their priorities.
+        self._store_episode(store_op=store_op, episode_length=episode_length)
+        sum_tree, min_tree = self.sess.run((mem.sum_tree, mem.min_tree))
+        assert np.isclose(sum_tree[1], 2.0 + 4.0 + 3 * 4.0, atol=1e-4)
+        assert np.isclose(min_tree[1], 2.0, atol=1e-4)
+
+        retrieved_data = self.sess.run(retrieve_op_t, feed_dict={n: capacity})
+        assert len(retrieved_data["terminal"]) == capacity
+        weights = self.sess.run(mem.batch_weights)
+        assert np.all(weights <= 1.0 + 1e-4)
+
+    def test_stacked_frame_replay(self):
+        stack_length = 3
+        capacity = 5
+        mem = StackedFrameReplay(
+            states=dict(test_state=dict(shape=(stack_length,), type="float")),
+            internals=self.internals_spec,
+            actions=self.actions_spec,
+            include_next_states=True,
+            capacity=capacity,
+            stack_length=stack_length
+        )
+        states = dict(test_state=tf.placeholder(dtype=tf.float32, shape=[None, stack_length]))
+        indices = tf.placeholder(dtype=tf.int32, shape=[None])
+
+        mem.initialize()
+        store_op = mem.store(
+            states=states,
+            internals=dict(),
+            actions=self.actions,
+            terminal=self.terminal,
+            reward=self.reward
+        )
+        retrieve_op = mem.retrieve_indices(indices=indices)
+
+        self.sess.run(tf.global_variables_initializer())
+
+        def stack(frames, t):
+            # Frame order of the sequence preprocessor: [t-1, t-2, ..., t].
+            previous = [frames[max(t - n - 1, 0)] for n in range(stack_length - 1)]
+            return previous + [frames[t]]
+
+        # Frames are stored once.
+        assert self.sess.run(mem.states_memory["test_state"]).shape == (capacity, 1)
+
+        episodes = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0]]
+        for frames in episodes:
+            self.sess.run(store_op, feed_dict={
+                states["test_state"]: np.array([stack(frames, t) for t in range(len(frames))]),
+                self.actions["test_action"]: np.zeros(shape=[len(frames)]),
+                self.terminal: np.array([False] * (len(frames) - 1) + [True]),
+                self.reward: np.zeros(shape=[len(frames)])
+            })
+
+        # Memory holds [6, 7, 3, 4, 5], the third episode starts at index 3.
+        retrieved_data = self.sess.run(retrieve_op, feed_dict={indices: [3, 4, 0, 1]})
+        frames = episodes[1]
+        assert [stack(frames, t) for t in range(4)] == retrieved_data["states"]["test_state"].tolist()
+        assert [stack(frames, t) for t in range(1, 4)] == retrieved_data["next_states"]["test_state"].tolist()[:3]
+
+        # The oldest record starts the stack, since its predecessors are overwritten.
+        retrieved_data = self.sess.run(retrieve_op, feed_dict={indices: [2]})
+        assert [[3.0, 3.0, 3.0]] == retrieved_data["states"]["test_state"].tolist()
+
+    def test_memmap_replay(self):
+        directory = tempfile.mkdtemp()
+        try:
+            capacity = 5
+            mem = MemmapReplay(
+                states=self.states_spec,
+                internals=self.internals_spec,
+                actions=self.actions_spec,
+                include_next_states=True,
+                capacity=capacity,
+                directory=directory
+            )
+            indices = tf.placeholder(dtype=tf.int32, shape=[None])
+
+            mem.initialize()
+            store_op = self._build_store_op(mem)
+            retrieve_op = mem.retrieve_indices(indices=indices)
+            timesteps_op = mem.retrieve_timesteps(n=10)
+            episodes_op = mem.retrieve_episodes(n=2)
+
+            episodes = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0]]
+            for frames in episodes:
+                self.sess.run(store_op, feed_dict={
+                    self.states["test_state"]: np.array(frames).reshape(-1, 1),
+                    self.actions["test_action"]: np.array(frames),
+                    self.terminal: np.array([False] * (len(frames) - 1) + [True]),
+                    self.reward: np.zeros(shape=[len(frames)])
+                })
+
+            # Memory holds [6, 7, 3, 4, 5], the oldest episode is truncated to its terminal record.
+            assert mem.num_stored == capacity
+            assert mem.memory_index == 2
+            retrieved_data = self.sess.run(retrieve_op, feed_dict={indices: [3, 4]})
+            assert [[4.0], [5.0]] == retrieved_data["states"]["test_state"].tolist()
+            assert [[5.0], [6.0]] == retrieved_data["next_states"]["test_state"].tolist()
+
+            # Terminal records have no next state.
+            retrieved_data = self.sess.run(timesteps_op)
+            assert not retrieved_data["terminal"].any()
+
+            retrieved_data = self.sess.run(episodes_op)
+            assert retrieved_data["terminal"].sum() == 2 and retrieved_data["terminal"][-1]
+
+            # Reopening the memory directory restores its content.
+            mem.flush()
+            mem = MemmapReplay(
+                states=self.states_spec,
+                internals=self.internals_spec,
+                actions=self.actions_spec,
+                include_next_states=True,
+                capacity=capacity,
+                directory=directory
+            )
+            assert mem.num_stored == capacity
+            assert mem.memory_index == 2
+            assert list(mem.terminal_indices) == [2, 1]
+            assert mem.columns["state-test_state"][:, 0].tolist() == [6.0, 7.0, 3.0, 4.0, 5.0]
+        finally:
+            shutil.rmtree(directory)
+
+    def test_remote_replay(self):
+        server = ReplayServer(
+            states=self.states_spec,
+            internals=self.internals_spec,
+            actions=self.actions_spec,
+            include_next_states=True,
+            capacity=10,
+            address=('localhost', 6027),
+            authkey=b'test',
+            prioritized=True
+        )
+        server.start()
+        try:
+            # Two memories share the server, as acting and learning agents would.
+            writer = RemoteReplay(
+                states=self.states_spec,
+                internals=self.internals_spec,
+                actions=self.actions_spec,
+                include_next_states=True,
+                address=('localhost', 6027),
+                authkey=b'test',
+                scope='writer'
+            )
+            reader = RemoteReplay(
+                states=self.states_spec,
+                internals=self.internals_spec,
+                actions=self.actions_spec,
+                include_next_states=True,
+                address=('localhost', 6027),
+                authkey=b'test',
+                scope='reader'
+            )
+            loss = tf.placeholder(dtype=tf.float32, shape=[None])
+
+            writer.initialize()
+            store_op = self._build_store_op(writer)
+            reader.initialize()
+            retrieve_op = reader.retrieve_timesteps(n=8)
+            update_op = reader.update_batch(loss_per_instance=loss)
+
+            for _ in range(3):
+                self._store_episode(store_op=store_op, episode_length=3)
+
+            retrieved_data = self.sess.run(retrieve_op)
+            assert [False] * 8 == retrieved_data["terminal"].tolist()
+            assert retrieved_data["states"]["test_state"].tolist() == \
+                retrieved_data["next_states"]["test_state"].tolist()
+            self.sess.run(update_op, feed_dict={loss: np.ones(shape=[8])})
+
+            writer.close()
+            reader.close()
+        finally:
+            server.close()
+
+    def test_remote_replay_authkey(self):
+        # Servers without explicit key generate one, memories require one.
+        server = ReplayServer(
+            states=self.states_spec,
+            internals=self.internals_spec,
+            actions=self.actions_spec,
+            include_next_states=True,
+            capacity=10
+        )
+        assert isinstance(server.authkey, bytes) and len(server.authkey) == 32
+        with self.assertRaises(TensorForceError):
+            RemoteReplay(
+                states=self.states_spec,
+                internals=self.internals_spec,
+                actions=self.actions_spec,
+                include_next_states=True
+            )
+
+    def test_replay_server_priorities(self):
+        directory = tempfile.mkdtemp()
+        try:
+            server = ReplayServer(
+                states=self.states_spec,
+                internals=self.internals_spec,
+                actions=self.actions_spec,
+                include_next_states=True,
+                capacity=10,
+                directory=directory,
+                prioritized=True
+            )
+            server.initialize_memory()
+
+            def store(num_instances):
+                values = [
+                    np.zeros(shape=((num_instances,) + shape), dtype=dtype)
+                    for _, _, _, shape, dtype in server.memory.columns_spec
+                ]
+                server.request_store(values)
+
+            store(num_instances=8)
+            indices, num_stores = server.request_sample_timesteps(n=8)
+            assert num_stores == 8
+
+            # The latest record is only sampled once its successor is stored.
+            assert all(index != 7 for index in indices)
+
+            # Records at indices 8, 9, 0 and 1 are written after sampling, so their priorities are not updated.
+            store(num_instances=4)
+            indices = np.arange(8)
+            server.request_update_priorities(indices, np.ones(shape=(8,)) * 2.0, num_stores)
+            priorities = server.sum_tree[server.tree_capacity: server.tree_capacity + 10]
+            assert priorities[:2].tolist() == [1.0, 0.0]
+            assert np.allclose(priorities[2:8], 2.0)
+            assert np.isclose(server.sum_tree[1], priorities.sum())
+        finally:
+            shutil.rmtree(directory)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,7 +10,7 @@ from tensorforce.core.networks import LayeredNetwork
 from tensorforce.environments import Environment
 from tensorforce.models import DistributionModel
 from .minimal_test import MinimalTest
-from tensorforce.agents import PPOAgent
+from tensorforce.agents import DQNAgent, PPOAgent, InferenceAgent
 from tensorforce.execution import Runner
 import tensorflow as tf
 import numpy as np
@@ -199,6 +199,80 @@ class TestModelSaveRestore(unittest.TestCase):
         assert agent.episode == 2 * train_episodes - 1
         runner.close()
 
+    def test_restore_rebuilt_variables(self):
+        environment = create_environment({"int": ()})
+
+        def create_dqn_agent():
+            return DQNAgent(
+                states=environment.states,
+                actions=environment.actions,
+                network=[dict(type='dense', size=32)],
+                update_mode=dict(unit='timesteps', batch_size=8, frequency=4),
+                memory=dict(type='replay', include_next_states=True, capacity=100)
+            )
+
+        agent = create_dqn_agent()
+        runner = Runner(agent=agent, environment=environment)
+        runner.run(episodes=50)
+        valid_count = agent.model.session.run(agent.model.memory.valid_count)
+        save_path = agent.model.save(directory=self._tmp_dir_path + "/model")
+        runner.close()
+
+        # Rebuilt variables are not saved, so checkpoints written before they existed can be restored.
+        saved_names = [name for name, _ in tf.train.list_variables(save_path)]
+        self.assertFalse(any(
+            'update-timestep' in name or 'valid-' in name or 'num-stored' in name for name in saved_names
+        ))
+
+        agent = create_dqn_agent()
+        agent.model.restore(directory="", file=save_path)
+        timestep, update_timestep, restored_valid_count = agent.model.session.run((
+            agent.model.timestep, agent.model.update_timestep, agent.model.memory.valid_count
+        ))
+        self.assertEqual(update_timestep, timestep)
+        self.assertGreater(restored_valid_count, 0)
+        self.assertLessEqual(restored_valid_count, valid_count)
+
+        # Memory retrieval works on the rebuilt variables.
+        runner = Runner(agent=agent, environment=environment)
+        runner.run(episodes=10)
+        runner.close()
+
+    def test_restore_wrapped_replay(self):
+        environment = create_environment({"int": ()})
+
+        def create_dqn_agent():
+            return DQNAgent(
+                states=environment.states,
+                actions=environment.actions,
+                network=[dict(type='dense', size=32)],
+                update_mode=dict(unit='timesteps', batch_size=8, frequency=4),
+                memory=dict(type='replay', include_next_states=True, capacity=100)
+            )
+
+        def valid_ring(agent):
+            memory = agent.model.memory
+            valid_indices, valid_start, valid_count = agent.model.session.run(
+                (memory.valid_indices, memory.valid_start, memory.valid_count)
+            )
+            return [valid_indices[(valid_start + n) % memory.capacity] for n in range(valid_count)]
+
+        agent = create_dqn_agent()
+        runner = Runner(agent=agent, environment=environment)
+        # Runs until the memory has wrapped around.
+        runner.run(num_timesteps=250)
+        self.assertEqual(agent.model.session.run(agent.model.memory.num_stored), 100)
+        ring = valid_ring(agent)
+        save_path = agent.model.save(directory=self._tmp_dir_path + "/model")
+        runner.close()
+
+        # The rebuilt ring contains all stored non-terminal records, not only those after the memory index.
+        agent = create_dqn_agent()
+        agent.model.restore(directory="", file=save_path)
+        self.assertEqual(agent.model.session.run(agent.model.memory.num_stored), 100)
+        self.assertEqual(valid_ring(agent), ring)
+        agent.close()
+
     def test_save_network(self):
         """
         Test to validate that calls to save and restore of a SavableComponent successfully save and restore the
@@ -307,3 +381,43 @@ class TestModelSaveRestore(unittest.TestCase):
         assert "Component non-existent must implement SavableComponent but is None" == str(excinfo.value)
 
         agent.close()
+
+    def test_save_restore_memory(self):
+        environment_spec = {"float": ()}
+        environment = create_environment(environment_spec)
+        network_spec = [dict(type='dense', size=32)]
+        agent = create_agent(environment, network_spec)
+        runner = Runner(agent=agent, environment=environment)
+
+        runner.run(episodes=10)
+        memory_variables = agent.model.memory.get_variables()
+        memory_values = agent.model.session.run(memory_variables)
+        manifest_path = agent.save_memory(directory=self._tmp_dir_path + "/memory", chunk_size=7)
+        assert os.path.isfile(manifest_path)
+        runner.close()
+
+        agent = create_agent(environment, network_spec)
+        agent.restore_memory(directory=self._tmp_dir_path + "/memory", chunk_size=7)
+        restored_memory_values = agent.model.session.run(agent.model.memory.get_variables())
+
+        assert len(memory_values) == len(restored_memory_values)
+        for value, restored_value in zip(memory_values, restored_memory_values):
+            assert np.array_equal(value, restored_value)
+
+        agent.close()
+
+    def test_export_inference(self):
+        environment_spec = {"float": ()}
+        environment = create_environment(environment_spec)
+        network_spec = [dict(type='dense', size=32)]
+        agent = create_agent(environment, network_spec)
+
+        states = np.random.uniform(size=(8, 2))
+        actions = agent.act(states=states, deterministic=True, independent=True)
+        agent.export_inference(directory=self._tmp_dir_path + "/inference")
+        agent.close()
+
+        inference_agent = InferenceAgent(directory=self._tmp_dir_path + "/inference")
+        assert np.allclose(inference_agent.act(states=states), actions)
+        assert np.shape(inference_agent.act(states=states[0])) == ()
+        inference_agent.close()
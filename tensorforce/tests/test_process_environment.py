@@ -0,0 +1,120 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import logging
+import sys
+import unittest
+
+from tensorforce import TensorForceError
+from tensorforce.agents import VPGAgent
+from tensorforce.environments import ProcessEnvironment
+from tensorforce.environments.process_environment import shared_memory
+from tensorforce.execution import ParallelRunner
+from .minimal_test import MinimalTest
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class TestProcessEnvironment(unittest.TestCase):
+
+    def test_process_environment(self):
+        environment = ProcessEnvironment(environment=MinimalTest, kwargs=dict(specification={'int': ()}))
+        reference = MinimalTest(specification={'int': ()})
+
+        self.assertEqual(environment.states, reference.states)
+        self.assertEqual(environment.actions, reference.actions)
+        self.assertEqual(str(environment), 'ProcessEnvironment(MinimalTest)')
+
+        self.assertEqual(tuple(environment.reset()), tuple(reference.reset()))
+        state, terminal, reward = environment.execute(action=1)
+        self.assertEqual(tuple(state), (0.0, 1.0))
+        self.assertEqual(reward, 1.0)
+
+        environment.execute_async(action=0)
+        with self.assertRaises(TensorForceError):
+            environment.execute_async(action=0)
+        state, terminal, reward = environment.wait()
+        self.assertEqual(tuple(state), (1.0, 0.0))
+
+        environment.close()
+        with self.assertRaises(TensorForceError):
+            environment.reset()
+
+    def test_worker_exception(self):
+        with self.assertRaises(TensorForceError):
+            ProcessEnvironment(environment=MinimalTest, kwargs=dict(specification={'invalid': ()}))
+
+    @unittest.skipIf(shared_memory is None, "requires multiprocessing.shared_memory")
+    def test_shared_states(self):
+        environments = ProcessEnvironment.create_pool(
+            environment=MinimalTest,
+            num_environments=3,
+            kwargs=dict(specification={'int': ()}),
+            shared_states=True
+        )
+        memory = environments[0].shared_memory
+
+        for environment in environments:
+            environment.reset_async(slot=0)
+        for environment in environments:
+            environment.wait()
+        self.assertEqual(memory.batch(slot=0).tolist(), [[1.0, 0.0]] * 3)
+
+        for n, environment in enumerate(environments):
+            environment.execute_async(action=(n % 2), slot=1)
+        states = [environment.wait()[0] for environment in environments]
+        self.assertEqual(memory.batch(slot=1).tolist(), [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]])
+        self.assertEqual(states[1].tolist(), [0.0, 1.0])
+        # Previous slot is left untouched.
+        self.assertEqual(memory.batch(slot=0).tolist(), [[1.0, 0.0]] * 3)
+
+        for environment in environments:
+            environment.close()
+        self.assertIsNone(memory.blocks)
+
+    def test_parallel_runner(self):
+        sys.stdout.write('\nVPGAgent (process environments):')
+        sys.stdout.flush()
+
+        environments = ProcessEnvironment.create_pool(
+            environment=MinimalTest,
+            num_environments=4,
+            kwargs=dict(specification={'int': ()}),
+            shared_states=(shared_memory is not None)
+        )
+
+        agent = VPGAgent(
+            states=environments[0].states,
+            actions=environments[0].actions,
+            network=[dict(type='dense', size=32), dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+            memory=dict(type='latest', include_next_states=False, capacity=100),
+            optimizer=dict(type='adam', learning_rate=1e-2),
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=4)
+        )
+
+        runner = ParallelRunner(agent=agent, environment=environments)
+        runner.run(num_episodes=100)
+        runner.close()
+
+        self.assertGreaterEqual(runner.episode, 100)
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
@@ -0,0 +1,59 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import math
+import unittest
+
+import numpy as np
+
+from tensorforce.agents import DQNAgent
+from .minimal_test import MinimalTest
+
+
+class TestRepeatUpdate(unittest.TestCase):
+
+    def test_repeat_update(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = DQNAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='timesteps', batch_size=8, frequency=8, repeat_update=4),
+            memory=dict(type='replay', include_next_states=True, capacity=100),
+            optimizer=dict(type='adam', learning_rate=1e-2, beta1=0.9),
+            batching_capacity=1
+        )
+
+        for _ in range(64):
+            agent.act(states=np.random.uniform(size=(2,)))
+            agent.observe(terminal=False, reward=0.0)
+
+        # Adam's beta1 accumulator counts the optimization steps.
+        beta1_power = [
+            variable for variable in agent.model.get_variables(include_nontrainable=True)
+            if 'beta1_power' in variable.name
+        ][0]
+        num_steps = int(round(math.log(agent.model.session.run(beta1_power)) / math.log(0.9)))
+
+        # One update per multiple of the frequency from the batch size on, each of four optimization steps.
+        timestep = agent.model.session.run(agent.model.timestep)
+        self.assertEqual(timestep, 64)
+        self.assertEqual(num_steps, (timestep // 8) * 4)
+
+        agent.close()
@@ -0,0 +1,96 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tensorforce.execution import RingBuffer, RunStatistics, RunTimings
+
+
+class TestRunStatistics(unittest.TestCase):
+
+    def test_ring_buffer(self):
+        buffer = RingBuffer(capacity=5, values=range(3))
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(list(buffer), [0.0, 1.0, 2.0])
+
+        buffer.extend(range(3, 9))
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.num_appended, 9)
+        self.assertEqual(list(buffer), [4.0, 5.0, 6.0, 7.0, 8.0])
+        self.assertEqual(buffer[0], 4.0)
+        self.assertEqual(buffer[-1], 8.0)
+        self.assertEqual(list(buffer[-2:]), [7.0, 8.0])
+        self.assertEqual(buffer.mean(), 6.0)
+        self.assertEqual(buffer.max(window=2), 8.0)
+        self.assertEqual(buffer.min(window=2), 7.0)
+        self.assertEqual(buffer.quantile(q=0.5), 6.0)
+
+    def test_flush_and_resume(self):
+        directory = tempfile.mkdtemp()
+        try:
+            statistics = RunStatistics(capacity=10, directory=directory, flush_interval=4)
+            for n in range(11):
+                statistics.append(episode_reward=float(n), episode_timesteps=n, episode_time=0.1)
+            self.assertEqual(len(statistics['episode_rewards']), 10)
+            statistics.flush()
+
+            history = RunStatistics.load(directory=directory)
+            self.assertTrue(np.array_equal(history['episode_rewards'], np.arange(11)))
+
+            statistics = RunStatistics(capacity=10, directory=directory, flush_interval=4, history=history)
+            for n in range(4):
+                statistics.append(episode_reward=100.0, episode_timesteps=1, episode_time=0.1)
+            self.assertEqual(statistics.num_episodes, 15)
+            self.assertEqual(len(RunStatistics.load(directory=directory)['episode_rewards']), 15)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_run_timings(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'timings.jsonl')
+            timings = RunTimings(path=path, interval=3600.0)
+            timings.add('reset', 0.5)
+            timings.add_step(act=0.1, execute=0.2, observe=0.4, update=0.3)
+            timings.add_observe(observe=0.1)
+
+            summary = timings.summary()
+            self.assertEqual(summary['act']['count'], 1)
+            self.assertAlmostEqual(summary['observe']['total'], 0.2)
+            self.assertEqual(summary['observe']['count'], 2)
+            self.assertAlmostEqual(summary['update']['total'], 0.3)
+            self.assertEqual(summary['update']['count'], 1)
+
+            # Metrics file entries at most every interval seconds, unless forced.
+            timings.report(episode=np.int64(1))
+            self.assertFalse(os.path.exists(path))
+            timings.report(force=True, episode=np.int64(1))
+            with open(path) as metrics_file:
+                entries = [json.loads(line) for line in metrics_file]
+            self.assertEqual(len(entries), 1)
+            self.assertEqual(entries[0]['episode'], 1)
+            self.assertAlmostEqual(entries[0]['timings']['execute']['total'], 0.2)
+        finally:
+            shutil.rmtree(directory)
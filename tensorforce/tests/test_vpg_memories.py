@@ -19,6 +19,8 @@ from __future__ import division
 
 import unittest
 
+import numpy as np
+
 from tensorforce.tests.base_test import BaseTest
 from tensorforce.agents import VPGAgent
 from .minimal_test import MinimalTest
@@ -241,3 +243,60 @@ class TestVPGMemories(BaseTest, unittest.TestCase):
             network=network,
             **config
         )
+
+    def test_sum_tree_prioritized_replay_timesteps(self):
+        environment = MinimalTest(specification={'int': ()})
+        network = [
+            dict(type='dense', size=32),
+            dict(type='dense', size=32)
+        ]
+
+        config = dict(
+            update_mode=dict(
+                unit='timesteps',
+                batch_size=8,
+                frequency=4
+            ),
+            memory=dict(
+                type='sum_tree_prioritized_replay',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            )
+        )
+
+        self.base_test_run(
+            name='sum-tree-prioritized-replay-timesteps',
+            environment=environment,
+            network=network,
+            **config
+        )
+
+    def test_raw_states(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = VPGAgent(
+            states=dict(type='uint8', shape=(2,)),
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            states_preprocessing=[dict(type='divide', scale=1.0)],
+            update_mode=dict(unit='timesteps', batch_size=8, frequency=4),
+            memory=dict(type='replay', include_next_states=False, capacity=100, raw_states=True),
+            optimizer=dict(type='adam', learning_rate=1e-2)
+        )
+
+        # States are stored unprocessed as uint8 instead of float.
+        self.assertEqual(agent.model.deferred_preprocessing, dict(state=0))
+        transition_bytes = agent.model.transition_bytes()
+        self.assertEqual(transition_bytes['processed'] - transition_bytes['stored'], 2 * 4 - 2 * 1)
+
+        state = environment.reset()
+        for _ in range(100):
+            action = agent.act(states=np.asarray(state, dtype=np.uint8))
+            state, terminal, reward = environment.execute(action=action)
+            agent.observe(terminal=terminal, reward=reward)
+            if terminal:
+                state = environment.reset()
+        agent.close()
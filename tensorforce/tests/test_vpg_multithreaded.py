@@ -19,6 +19,7 @@ from __future__ import division
 
 import copy
 import logging
+import math
 import sys
 import unittest
 
@@ -77,3 +78,116 @@ class TestVPGMultithreaded(unittest.TestCase):
 
         sys.stdout.write(' ran\n')
         sys.stdout.flush()
+
+    def test_multithreaded_batched_observe(self):
+        sys.stdout.write('\nVPGAgent (multithreaded, batched atomic observe):')
+        sys.stdout.flush()
+
+        environment = MinimalTest(specification={'int': ()})
+
+        network = [
+            dict(type='dense', size=32),
+            dict(type='dense', size=32)
+        ]
+        kwargs = dict(
+            update_mode=dict(
+                unit='episodes',
+                batch_size=4,
+                frequency=4
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            ),
+            batched_observe=False
+        )
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=network,
+            **kwargs
+        )
+
+        agents = clone_worker_agent(agent, 5, environment, network, kwargs)
+        environments = [environment] + [copy.deepcopy(environment) for n in range(4)]
+
+        runner = ThreadedRunner(agent=agents, environment=environments)
+
+        runner.run(num_episodes=100, observe_batch_size=8)
+
+        # All transitions of finished episodes have been inserted.
+        self.assertGreaterEqual(agent.model.monitored_session.run(agent.model.episode), 100)
+        runner.close()
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_multithreaded_batched_observe_timesteps(self):
+        environment = MinimalTest(specification={'int': ()})
+
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='timesteps', batch_size=8, frequency=4),
+            memory=dict(type='latest', include_next_states=False, capacity=100),
+            optimizer=dict(type='adam', learning_rate=1e-2, beta1=0.9),
+            batched_observe=False
+        )
+
+        runner = ThreadedRunner(agent=[agent], environment=[environment])
+
+        # Stop after complete episodes, so all acted timesteps have been observed.
+        runner.run(num_episodes=1000, observe_batch_size=3, episode_finished=(lambda r, _: r.global_episode < 20))
+
+        # One update per multiple of the frequency, from the batch size on, although timesteps are inserted in
+        # batches of three.
+        timestep = agent.model.monitored_session.run(agent.model.timestep)
+        beta1_power = [
+            variable for variable in agent.model.get_variables(include_nontrainable=True)
+            if 'beta1_power' in variable.name
+        ][0]
+        num_steps = int(round(math.log(agent.model.session.run(beta1_power)) / math.log(0.9)))
+        self.assertEqual(num_steps, max(timestep // 4 - 1, 0))
+
+        runner.close()
+
+    def test_multithreaded_batched_observe_stop(self):
+        environment = MinimalTest(specification={'int': ()})
+
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+            memory=dict(type='latest', include_next_states=False, capacity=100),
+            optimizer=dict(type='adam', learning_rate=1e-2),
+            batched_observe=False
+        )
+
+        runner = ThreadedRunner(agent=[agent], environment=[environment])
+        runner.reset()
+        runner.global_episode = 0
+        runner.global_timestep = 0
+
+        # Signal the stop in the middle of an episode, with fewer transitions than the observe batch size.
+        execute = environment.execute
+        num_executes = [0]
+
+        def execute_and_stop(action):
+            state, _, reward = execute(action=action)
+            num_executes[0] += 1
+            runner.should_stop = (num_executes[0] == 5)
+            return state, False, reward
+
+        environment.execute = execute_and_stop
+        runner._run_single(thread_id=0, agent=agent, environment=environment, observe_batch_size=8)
+
+        # Pending transitions have been inserted before the worker returned.
+        self.assertEqual(agent.model.monitored_session.run(agent.model.memory.memory_index), 5)
+        runner.close()
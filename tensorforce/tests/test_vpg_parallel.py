@@ -0,0 +1,208 @@
+# Copyright 2017 reinforce.io. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import division
+
+import copy
+import logging
+import sys
+import unittest
+
+import numpy as np
+
+from tensorforce import TensorForceError
+from tensorforce.agents import VPGAgent
+from .minimal_test import MinimalTest
+from tensorforce.execution import ParallelRunner
+
+
+logging.getLogger('tensorflow').disabled = True
+
+
+class TestVPGParallel(unittest.TestCase):
+
+    def test_parallel(self):
+        sys.stdout.write('\nVPGAgent (parallel):')
+        sys.stdout.flush()
+
+        environment = MinimalTest(specification={'int': ()})
+
+        network = [
+            dict(type='dense', size=32),
+            dict(type='dense', size=32)
+        ]
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=network,
+            update_mode=dict(
+                unit='episodes',
+                batch_size=4,
+                frequency=4
+            ),
+            memory=dict(
+                type='latest',
+                include_next_states=False,
+                capacity=100
+            ),
+            optimizer=dict(
+                type='adam',
+                learning_rate=1e-2
+            ),
+            execution=dict(
+                type='single',
+                session_config=None,
+                distributed_spec=None,
+                num_parallel=4
+            )
+        )
+
+        environments = [environment] + [copy.deepcopy(environment) for n in range(3)]
+
+        runner = ParallelRunner(agent=agent, environment=environments)
+
+        runner.run(num_episodes=100)
+        runner.close()
+
+        assert runner.episode >= 100
+        assert sum(runner.episode_timesteps) <= runner.timestep
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_single_environment_internals(self):
+        environment = MinimalTest(specification={'int': ()})
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='internal_lstm', size=8), dict(type='dense', size=8)],
+            states_preprocessing=[dict(type='sequence', length=2)],
+            update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+            memory=dict(type='latest', include_next_states=False, capacity=100),
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=1)
+        )
+
+        reset = agent.reset
+        num_resets = list()
+
+        def counted_reset():
+            num_resets.append(None)
+            reset()
+
+        agent.reset = counted_reset
+
+        # A single environment acts unbatched and starts each episode with initial internal states.
+        runner = ParallelRunner(agent=agent, environment=environment)
+        runner.run(num_episodes=10)
+        runner.close()
+
+        self.assertGreaterEqual(runner.episode, 10)
+        self.assertGreaterEqual(len(num_resets), 10)
+
+    def test_multiple_environments_stateful_preprocessing(self):
+        environments = [MinimalTest(specification={'int': ()}) for _ in range(2)]
+        agent = VPGAgent(
+            states=environments[0].states,
+            actions=environments[0].actions,
+            network=[dict(type='dense', size=8)],
+            states_preprocessing=[dict(type='sequence', length=2)],
+            execution=dict(type='single', session_config=None, distributed_spec=None, num_parallel=2)
+        )
+        with self.assertRaises(TensorForceError):
+            ParallelRunner(agent=agent, environment=environments)
+        agent.close()
+
+    def test_host_buffering(self):
+        sys.stdout.write('\nVPGAgent (parallel, host buffering):')
+        sys.stdout.flush()
+
+        environment = MinimalTest(specification={'int': ()})
+
+        agent = VPGAgent(
+            states=environment.states,
+            actions=environment.actions,
+            network=[dict(type='dense', size=32)],
+            update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+            memory=dict(type='latest', include_next_states=False, capacity=100),
+            optimizer=dict(type='adam', learning_rate=1e-2),
+            execution=dict(
+                type='single',
+                session_config=None,
+                distributed_spec=None,
+                num_parallel=4,
+                buffering='host'
+            )
+        )
+
+        # No act records are buffered before the first act call.
+        assert sum(agent.buffer_memory_report().values()) == 0
+
+        environments = [environment] + [copy.deepcopy(environment) for n in range(3)]
+
+        runner = ParallelRunner(agent=agent, environment=environments)
+
+        runner.run(num_episodes=100)
+
+        # Unfinished episodes of the run are discarded before the next run.
+        agent.reset_buffers()
+        assert sum(agent.buffer_memory_report().values()) == 0
+        assert all(len(terminal) == 0 for terminal in agent.observe_terminal)
+        runner.run(num_episodes=10)
+        runner.close()
+
+        assert runner.episode >= 110
+        assert sum(runner.episode_timesteps) <= runner.timestep
+
+        sys.stdout.write(' ran\n')
+        sys.stdout.flush()
+
+    def test_host_buffering_staged_records(self):
+        environment = MinimalTest(specification={'int': ()})
+
+        for act_fast_path in (True, False):
+            agent = VPGAgent(
+                states=environment.states,
+                actions=environment.actions,
+                network=[dict(type='dense', size=32)],
+                update_mode=dict(unit='episodes', batch_size=4, frequency=4),
+                memory=dict(type='latest', include_next_states=False, capacity=100),
+                optimizer=dict(type='adam', learning_rate=1e-2),
+                execution=dict(
+                    type='single',
+                    session_config=None,
+                    distributed_spec=None,
+                    num_parallel=2,
+                    buffering='host',
+                    act_fast_path=act_fast_path
+                )
+            )
+            self.assertEqual(agent.model.act_fast_path, act_fast_path)
+
+            states = np.random.uniform(size=(3, 2))
+            action = agent.act(states=states[0], index=0)
+            actions = agent.act(states=states[1:], index=[0, 1])
+
+            buffers = agent.model.list_host_buffer
+            self.assertTrue(np.allclose(buffers[0]['states']['state'], states[:2]))
+            self.assertTrue(np.allclose(buffers[1]['states']['state'], states[2:]))
+            self.assertEqual(
+                [int(value) for value in buffers[0]['actions']['action']],
+                [int(action), int(actions[0])]
+            )
+            self.assertEqual([int(value) for value in buffers[1]['actions']['action']], [int(actions[1])])
+
+            agent.close()
@@ -78,6 +78,8 @@ def np_dtype(dtype):
         return np.int64
     elif dtype == np.int16 or dtype == tf.int16:
         return np.int16
+    elif dtype == 'uint8' or dtype == np.uint8 or dtype == tf.uint8:
+        return np.uint8
     elif dtype == 'bool' or dtype == bool or dtype == np.bool_ or dtype == tf.bool:
         return np.bool_
     else:
@@ -107,6 +109,8 @@ def tf_dtype(dtype):
         return tf.int64
     elif dtype == np.int16 or dtype == tf.int16:
         return tf.int16
+    elif dtype == 'uint8' or dtype == np.uint8 or dtype == tf.uint8:
+        return tf.uint8
     elif dtype == 'bool' or dtype == bool or dtype == np.bool_ or dtype == tf.bool:
         return tf.bool
     else: